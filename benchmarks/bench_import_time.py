@@ -0,0 +1,62 @@
+"""
+Benchmark: package import time.
+
+Times `import wave_visualizer` and the first use of each part of the package
+in a fresh interpreter, and lists the heavy third-party modules each one
+loads. Public names are imported lazily (PEP 562), so a cleaning-only or
+statistics-only script should never load plotly or Kaleido.
+
+Usage:
+    python -m benchmarks.bench_import_time
+    python -m benchmarks.bench_import_time --repeats 10
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ['pandas', 'pyarrow', 'pyreadstat', 'plotly', 'kaleido']
+
+SCENARIOS = {
+    'bare import': "import wave_visualizer",
+    'cleaning': "import wave_visualizer; wave_visualizer.DataCleaningPipeline",
+    'statistics': "import wave_visualizer; wave_visualizer.TransitionMatrix",
+    'visualization': "import wave_visualizer; wave_visualizer.create_heatmap_visualization",
+    'export': "import wave_visualizer; wave_visualizer.export_figure",
+}
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+exec({statement!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed,
+                   'loaded': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure_import(statement: str) -> dict:
+    """Run a statement in a fresh interpreter and time it."""
+    probe = _PROBE.format(statement=statement, heavy=HEAVY_MODULES)
+    output = subprocess.run([sys.executable, '-c', probe], check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'scenario':<14} {'median (s)':>11} {'min (s)':>9}  heavy modules loaded")
+    for name, statement in SCENARIOS.items():
+        runs = [measure_import(statement) for _ in range(args.repeats)]
+        seconds = [run['seconds'] for run in runs]
+        loaded = ', '.join(runs[-1]['loaded']) or '-'
+        print(f"{name:<14} {statistics.median(seconds):11.3f} {min(seconds):9.3f}  {loaded}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark: transition pattern counting.
+
+Compares the grouped count used by create_pattern_analysis_visualization
+against the previous implementation, which built one pattern string per
+respondent with iterrows() and ran value_counts on the strings.
+
+Usage:
+    python -m benchmarks.bench_pattern_counting
+    python -m benchmarks.bench_pattern_counting --rows 10000 1000000 --legacy-max-rows 10000000
+
+The per-row implementation takes minutes at 10M rows, so by default it is
+only timed up to --legacy-max-rows.
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from wave_visualizer.visualization_techs.transition_matrix import TransitionMatrix
+from wave_visualizer.visualization_techs.transition_pattern_analysis import _pattern_table
+
+CATEGORIES = ['Thriving', 'Struggling', 'Suffering', 'Disengaged', 'Recovering']
+
+
+def legacy_count(source: pd.Series, target: pd.Series) -> pd.DataFrame:
+    """Per-row pattern strings, as before the grouped count."""
+    transition_data = pd.DataFrame({'source': source, 'target': target})
+    patterns = []
+    for _, row in transition_data.iterrows():
+        patterns.append(f"{row['source']} -> {row['target']}")
+
+    pattern_counts = pd.Series(patterns).value_counts()
+    pattern_df = pd.DataFrame({
+        'Pattern': pattern_counts.index,
+        'Count': pattern_counts.values,
+        'Percentage': (pattern_counts.values / len(transition_data)) * 100
+    })
+    pattern_df['Type'] = pattern_df['Pattern'].apply(
+        lambda x: 'Stable' if x.split(' -> ')[0] == x.split(' -> ')[1] else 'Changed'
+    )
+    return pattern_df
+
+
+def grouped_count(source: pd.Series, target: pd.Series) -> pd.DataFrame:
+    """Grouped count on shared category codes, as used now."""
+    return _pattern_table(TransitionMatrix.from_series(source, target))
+
+
+def make_data(n_rows: int, seed: int = 0) -> pd.DataFrame:
+    """Random two-wave data with text labels."""
+    rng = np.random.default_rng(seed)
+    labels = np.array(CATEGORIES, dtype=object)
+    return pd.DataFrame({
+        'source': labels[rng.integers(0, len(labels), n_rows)],
+        'target': labels[rng.integers(0, len(labels), n_rows)],
+    })
+
+
+def time_call(func, *args) -> float:
+    """Wall time of one call in seconds."""
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument('--legacy-max-rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"{'rows':>12} {'per-row (s)':>12} {'grouped (s)':>12} {'categorical (s)':>16} {'speedup':>9}")
+    for n_rows in args.rows:
+        data = make_data(n_rows)
+        categorical = data.astype('category')
+
+        grouped = time_call(grouped_count, data['source'], data['target'])
+        grouped_cat = time_call(grouped_count, categorical['source'], categorical['target'])
+
+        if n_rows <= args.legacy_max_rows:
+            legacy = time_call(legacy_count, data['source'], data['target'])
+            legacy_text, speedup = f"{legacy:12.3f}", f"{legacy / grouped:8.0f}x"
+        else:
+            legacy_text, speedup = f"{'skipped':>12}", f"{'-':>9}"
+
+        print(f"{n_rows:>12,} {legacy_text} {grouped:12.3f} {grouped_cat:16.3f} {speedup}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark: Sankey payload construction for two-wave alluvial diagrams.
+
+Compares AlluvialVisualizationBuilder._create_plotly_figure, which builds
+link indices, colors and hover text as whole arrays, against the previous
+implementation, which formatted hover text with iterrows(), mapped indices
+with list comprehensions and converted a hex color to rgba for every link.
+
+Usage:
+    python -m benchmarks.bench_sankey_payload
+    python -m benchmarks.bench_sankey_payload --categories 50 200 500
+
+With k categories per wave there are up to k * k links; 200 categories give
+40,000 links.
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from wave_visualizer.visualization_techs.alluvial_builder import (
+    AlluvialVisualizationBuilder, _link_color
+)
+from wave_visualizer.visualization_techs.transition_matrix import TransitionMatrix
+
+
+def legacy_figure(builder: AlluvialVisualizationBuilder, transition_data: pd.DataFrame) -> go.Figure:
+    """Per-link Python loops, as before the vectorized payload."""
+    source_categories = sorted(transition_data['source'].unique())
+    target_categories = sorted(transition_data['target'].unique())
+    all_node_labels = ([f"{cat} (W1)" for cat in source_categories] +
+                       [f"{cat} (W2)" for cat in target_categories])
+
+    source_to_index = {cat: i for i, cat in enumerate(source_categories)}
+    target_to_index = {cat: i + len(source_categories) for i, cat in enumerate(target_categories)}
+    source_indices = [source_to_index[source] for source in transition_data['source']]
+    target_indices = [target_to_index[target] for target in transition_data['target']]
+    values = transition_data['count'].tolist()
+
+    unique_categories = sorted(set(source_categories) | set(target_categories))
+    base_colors = builder._customizer.get_semantic_colors(builder._variable_name, unique_categories)
+    color_map = {cat: color for cat, color in zip(unique_categories, base_colors)}
+    node_colors = [color_map[cat] for cat in source_categories + target_categories]
+    link_colors = [_link_color(color_map[source]) for source in transition_data['source']]
+
+    hover_text = [
+        f"{row['source']} → {row['target']}<br>"
+        f"Count: {row['count']:,}<br>"
+        f"Percentage: {row['percentage']:.1f}%"
+        for _, row in transition_data.iterrows()
+    ]
+
+    return go.Figure(data=[go.Sankey(
+        arrangement="snap",
+        node=dict(label=all_node_labels, color=node_colors),
+        link=dict(source=source_indices, target=target_indices, value=values,
+                  color=link_colors, hovertemplate='%{customdata}<extra></extra>',
+                  customdata=hover_text)
+    )])
+
+
+def make_builder(n_categories: int, seed: int = 0) -> AlluvialVisualizationBuilder:
+    """Builder over a dense random transition matrix with n_categories per wave."""
+    rng = np.random.default_rng(seed)
+    categories = [f"Category {i:03d}" for i in range(n_categories)]
+    counts = rng.integers(1, 2_000, (n_categories, n_categories))
+    builder = (AlluvialVisualizationBuilder()
+               .set_wave_config('w1_to_w2')
+               .set_transition_matrix(TransitionMatrix(counts, categories)))
+    builder._prepare_data()
+    builder._configure_visualization()
+    return builder
+
+
+def time_call(func, *args) -> float:
+    """Wall time of one call in seconds."""
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--categories', type=int, nargs='+', default=[20, 100, 200])
+    args = parser.parse_args()
+
+    print(f"{'categories':>10} {'links':>8} {'per-link (s)':>13} {'vectorized (s)':>15} {'speedup':>9}")
+    for n_categories in args.categories:
+        builder = make_builder(n_categories)
+        transition_data = builder._process_transition_data()
+
+        legacy = time_call(legacy_figure, builder, transition_data)
+        vectorized = time_call(builder._create_plotly_figure, transition_data)
+
+        print(f"{n_categories:>10} {len(transition_data):>8,} {legacy:13.3f} "
+              f"{vectorized:15.3f} {legacy / vectorized:8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,112 +1,62 @@
 """
 Political Party Analysis: W1 to W3 Transitions
 
-This script generates 9 comprehensive visualizations analyzing how different 
-political party affiliations (Democrat, Republican, Independent) transition 
+This script generates 9 comprehensive visualizations analyzing how different
+political party affiliations (Democrat, Republican, Independent) transition
 across psychological well-being categories from Wave 1 to Wave 3.
 
 Generated visualizations:
 - 3 Alluvial plots (one per party)
-- 3 Heatmaps (one per party) 
+- 3 Heatmaps (one per party)
 - 3 Transition pattern analyses (one per party)
+
+All three parties are counted in a single pass over the data with
+create_visualizations_by_group, instead of filtering the full dataset
+once per party and visualization, and all nine figures are exported in
+one batch that keeps the image renderer running between figures. The HTML
+files share one plotly.min.js in the exports folder, and a single report
+page shows all nine figures together.
 """
 
 import wave_visualizer
 
+PARTIES = ['Democrat', 'Republican', 'Independent']
+
 print("Starting Political Party Analysis: W1 to W3 Transitions")
 print("=" * 60)
 
 # =============================================================================
-# DEMOCRATIC VOTERS ANALYSIS
+# ALL PARTIES IN ONE PASS
 # =============================================================================
-print("\nDEMOCRATIC VOTERS - W1 to W3 Analysis")
-print("-" * 40)
-
-# Democrat Alluvial Plot
-print("Creating Democratic voters alluvial plot...")
-dem_alluvial, dem_alluvial_stats = wave_visualizer.create_alluvial_visualization(
-    variable_name='HFClust_labeled', wave_config='w1_to_w3', 
-    filter_column='PID1_labeled', filter_value='Democrat', show_plot=False
-)
-wave_visualizer.export_figure(dem_alluvial, 'democrat_alluvial_w1_w3')
-
-# Democrat Heatmap
-print("Creating Democratic voters heatmap...")
-dem_heatmap, dem_heatmap_stats = wave_visualizer.create_heatmap_visualization(
-    variable_name='HFClust_labeled', wave_config='w1_to_w3',
-    filter_column='PID1_labeled', filter_value='Democrat', show_plot=False
-)
-wave_visualizer.export_figure(dem_heatmap, 'democrat_heatmap_w1_w3')
-
-# Democrat Transition Pattern Analysis
-print("Creating Democratic voters transition pattern analysis...")
-dem_patterns, dem_pattern_stats = wave_visualizer.create_pattern_analysis_visualization(
+print("\nCreating alluvial plots, heatmaps and pattern analyses for each party...")
+results = wave_visualizer.create_visualizations_by_group(
     variable_name='HFClust_labeled', wave_config='w1_to_w3',
-    filter_column='PID1_labeled', filter_value='Democrat', show_plot=False
+    group_by='PID1_labeled', groups=PARTIES,
+    kinds=['alluvial', 'heatmap', 'patterns'], show_plot=False
 )
-wave_visualizer.export_figure(dem_patterns, 'democrat_patterns_w1_w3')
 
 # =============================================================================
-# REPUBLICAN VOTERS ANALYSIS  
+# EXPORT ALL FIGURES IN ONE BATCH
 # =============================================================================
-print("\nREPUBLICAN VOTERS - W1 to W3 Analysis")
-print("-" * 40)
+figures = {}
+for party in PARTIES:
+    print(f"\n{party.upper()} VOTERS - W1 to W3 Analysis")
+    print("-" * 40)
 
-# Republican Alluvial Plot
-print("Creating Republican voters alluvial plot...")
-rep_alluvial, rep_alluvial_stats = wave_visualizer.create_alluvial_visualization(
-    variable_name='HFClust_labeled', wave_config='w1_to_w3',
-    filter_column='PID1_labeled', filter_value='Republican', show_plot=False
-)
-wave_visualizer.export_figure(rep_alluvial, 'republican_alluvial_w1_w3')
+    for kind in ['alluvial', 'heatmap', 'patterns']:
+        fig, stats = results[party][kind]
+        print(f"Queued {party} {kind} ({stats['total_transitions']:,} respondents)")
+        figures[f"{party.lower()}_{kind}_w1_w3"] = fig
 
-# Republican Heatmap
-print("Creating Republican voters heatmap...")
-rep_heatmap, rep_heatmap_stats = wave_visualizer.create_heatmap_visualization(
-    variable_name='HFClust_labeled', wave_config='w1_to_w3',
-    filter_column='PID1_labeled', filter_value='Republican', show_plot=False
-)
-wave_visualizer.export_figure(rep_heatmap, 'republican_heatmap_w1_w3')
+exported = wave_visualizer.export_figures(figures, include_plotlyjs='directory')
+for name, result in exported.items():
+    print(f"Exported {name} in {result['total_seconds']:.2f}s")
 
-# Republican Transition Pattern Analysis
-print("Creating Republican voters transition pattern analysis...")
-rep_patterns, rep_pattern_stats = wave_visualizer.create_pattern_analysis_visualization(
-    variable_name='HFClust_labeled', wave_config='w1_to_w3',
-    filter_column='PID1_labeled', filter_value='Republican', show_plot=False
-)
-wave_visualizer.export_figure(rep_patterns, 'republican_patterns_w1_w3')
-
-# =============================================================================
-# INDEPENDENT VOTERS ANALYSIS
-# =============================================================================
-print("\nINDEPENDENT VOTERS - W1 to W3 Analysis")
-print("-" * 40)
-
-# Independent Alluvial Plot
-print("Creating Independent voters alluvial plot...")
-ind_alluvial, ind_alluvial_stats = wave_visualizer.create_alluvial_visualization(
-    variable_name='HFClust_labeled', wave_config='w1_to_w3',
-    filter_column='PID1_labeled', filter_value='Independent', show_plot=False
-)
-wave_visualizer.export_figure(ind_alluvial, 'independent_alluvial_w1_w3')
-
-# Independent Heatmap
-print("Creating Independent voters heatmap...")
-ind_heatmap, ind_heatmap_stats = wave_visualizer.create_heatmap_visualization(
-    variable_name='HFClust_labeled', wave_config='w1_to_w3',
-    filter_column='PID1_labeled', filter_value='Independent', show_plot=False
-)
-wave_visualizer.export_figure(ind_heatmap, 'independent_heatmap_w1_w3')
-
-# Independent Transition Pattern Analysis
-print("Creating Independent voters transition pattern analysis...")
-ind_patterns, ind_pattern_stats = wave_visualizer.create_pattern_analysis_visualization(
-    variable_name='HFClust_labeled', wave_config='w1_to_w3',
-    filter_column='PID1_labeled', filter_value='Independent', show_plot=False
-)
-wave_visualizer.export_figure(ind_patterns, 'independent_patterns_w1_w3')
+report = wave_visualizer.export_report(figures, 'political_w1_w3_report',
+                                       title='Political Party Analysis: W1 to W3')
+print(f"Report: {report}")
 
 print("\n" + "=" * 60)
 print("COMPLETE! All 9 political visualizations have been generated.")
 print("Check the 'exports' folder for HTML and PNG files.")
-print("=" * 60)
\ No newline at end of file
+print("=" * 60)
@@ -157,7 +157,7 @@ def clean_environment():
     """Clean up environment variables before and after each test."""
     # Store original values
     original_env = {}
-    test_env_vars = ['WAVE_VISUALIZER_LOG_LEVEL', 'WAVE_VISUALIZER_CONFIG']
+    test_env_vars = ['WAVE_VISUALIZER_LOG_LEVEL', 'WAVE_VISUALIZER_CONFIG', 'WAVE_VISUALIZER_CACHE_DIR']
     
     for var in test_env_vars:
         if var in os.environ:
@@ -174,6 +174,14 @@ def clean_environment():
             os.environ[var] = original_env[var]
 
 
+@pytest.fixture
+def isolated_result_cache(tmp_path, monkeypatch):
+    """Enable the on-disk result cache in a directory of the test's own."""
+    cache_dir = tmp_path / "result_cache"
+    monkeypatch.setenv('WAVE_VISUALIZER_CACHE_DIR', str(cache_dir))
+    return cache_dir
+
+
 @pytest.fixture
 def mock_processed_data_file(tmp_path, sample_data):
     """Create a mock processed data file for testing."""
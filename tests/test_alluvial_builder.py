@@ -3,10 +3,17 @@ Unit tests for wave_visualizer.visualization_techs.alluvial_builder module.
 """
 
 import pytest
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from unittest.mock import Mock, patch
-from wave_visualizer.visualization_techs.alluvial_builder import AlluvialVisualizationBuilder
+from wave_visualizer.visualization_techs.alluvial_builder import AlluvialVisualizationBuilder, _link_color
+from wave_visualizer.visualization_techs.transition_matrix import (
+    TransitionMatrix, get_trajectory_counts, get_transition_matrix
+)
+from wave_visualizer.visualization_techs import transition_matrix
+from wave_visualizer.data_prep.cleaning.row_reduction import Selection
+from wave_visualizer.validators import ValidatedInputs
 from wave_visualizer.exceptions import DataLoadingError, VisualizationError
 
 
@@ -30,16 +37,29 @@ class TestAlluvialVisualizationBuilder:
         assert result is builder  # Method chaining
         assert builder._data is sample_data
     
-    def test_set_data_none_loads_default(self):
-        """Test setting data to None loads default data."""
+    def test_set_data_none_defers_loading(self):
+        """Test setting data to None defers loading until build."""
         builder = AlluvialVisualizationBuilder()
         
         with patch.object(builder, '_load_default_data') as mock_load:
-            mock_load.return_value = Mock(spec=pd.DataFrame)
             result = builder.set_data(None)
             
             assert result is builder
-            mock_load.assert_called_once()
+            assert builder._data is None
+            mock_load.assert_not_called()
+    
+    @patch('wave_visualizer.visualization_techs.alluvial_builder.validate_visualization_inputs')
+    def test_prepare_data_loads_required_columns(self, mock_validate, sample_data):
+        """Test that default data is loaded with only the needed columns."""
+        builder = AlluvialVisualizationBuilder()
+        builder.set_data(None).set_wave_config('w1_to_w3').apply_filter('W1_PID1_labeled', 'Democrat')
+        
+        with patch.object(builder, '_load_default_data', return_value=sample_data) as mock_load:
+            builder._prepare_data()
+        
+        mock_load.assert_called_once_with(
+            columns=['W1_HFClust_labeled', 'W3_HFClust_labeled', 'W1_PID1_labeled']
+        )
     
     def test_set_variable(self):
         """Test setting variable name."""
@@ -93,25 +113,25 @@ class TestAlluvialVisualizationBuilder:
         assert builder._filter_value == 'Republican'
         assert builder._custom_title == 'Test Title'
     
-    @patch('wave_visualizer.visualization_techs.alluvial_builder.pd.read_csv')
-    def test_load_default_data_success(self, mock_read_csv, sample_data):
+    @patch('wave_visualizer.visualization_techs.alluvial_builder.load_processed_data')
+    def test_load_default_data_success(self, mock_load_data, sample_data):
         """Test successful loading of default data."""
-        mock_read_csv.return_value = sample_data
+        mock_load_data.return_value = sample_data
         builder = AlluvialVisualizationBuilder()
         
         result = builder._load_default_data()
         
         assert result is sample_data
-        mock_read_csv.assert_called_once_with('./wave_visualizer/settings/processed_data.csv')
+        mock_load_data.assert_called_once_with(columns=None)
     
-    @patch('wave_visualizer.visualization_techs.alluvial_builder.pd.read_csv')
-    def test_load_default_data_file_not_found(self, mock_read_csv):
+    def test_load_default_data_file_not_found(self, tmp_path):
         """Test loading default data when file not found."""
-        mock_read_csv.side_effect = FileNotFoundError()
         builder = AlluvialVisualizationBuilder()
         
-        with pytest.raises(DataLoadingError, match="Processed data file not found"):
-            builder._load_default_data()
+        with patch('wave_visualizer.data_prep.data_loader.get_processed_data_path',
+                   return_value=tmp_path / 'missing.csv'):
+            with pytest.raises(DataLoadingError, match="Processed data file not found"):
+                builder._load_default_data()
     
     def test_generate_automatic_title_no_filter(self):
         """Test automatic title generation without filter."""
@@ -199,8 +219,11 @@ class TestAlluvialBuilderIntegration:
         
         # This would normally require the full environment
         # For testing, we'll mock the heavy dependencies
+        validated = ValidatedInputs(columns=['W1_HFClust_labeled', 'W2_HFClust_labeled'],
+                                    selection=Selection(sample_data))
         with patch('wave_visualizer.visualization_techs.alluvial_builder.parse_wave_config') as mock_parse, \
-             patch('wave_visualizer.visualization_techs.alluvial_builder.validate_visualization_inputs'), \
+             patch('wave_visualizer.visualization_techs.alluvial_builder.validate_visualization_inputs',
+                   return_value=validated), \
              patch('wave_visualizer.visualization_techs.alluvial_builder.generate_column_names') as mock_gen, \
              patch.object(builder, '_configure_visualization'), \
              patch.object(builder, '_create_plotly_figure') as mock_create_fig:
@@ -226,10 +249,14 @@ class TestAlluvialBuilderIntegration:
         """Test build process with filtering applied."""
         builder = AlluvialVisualizationBuilder()
         
+        validated = ValidatedInputs(columns=['W1_HFClust_labeled', 'W2_HFClust_labeled'],
+                                    selection=Selection(sample_data, np.arange(0, len(sample_data), 2)))
         with patch('wave_visualizer.visualization_techs.alluvial_builder.parse_wave_config') as mock_parse, \
-             patch('wave_visualizer.visualization_techs.alluvial_builder.validate_visualization_inputs'), \
+             patch('wave_visualizer.visualization_techs.alluvial_builder.validate_visualization_inputs',
+                   return_value=validated), \
              patch('wave_visualizer.visualization_techs.alluvial_builder.generate_column_names') as mock_gen, \
-             patch.object(builder, '_apply_data_filter') as mock_filter, \
+             patch('wave_visualizer.visualization_techs.alluvial_builder.get_transition_matrix',
+                   wraps=get_transition_matrix) as mock_matrix, \
              patch.object(builder, '_configure_visualization'), \
              patch.object(builder, '_create_plotly_figure') as mock_create_fig:
             
@@ -245,8 +272,27 @@ class TestAlluvialBuilderIntegration:
                          .apply_filter('PID1_labeled', 'Republican')
                          .build())
             
-            # Verify filter was applied
-            mock_filter.assert_called_once()
+            # Verify the validated rows of the filter were counted
+            mock_matrix.assert_called_once_with(
+                sample_data, 'W1_HFClust_labeled', 'W2_HFClust_labeled',
+                'PID1_labeled', 'Republican', selection=validated.selection
+            )
+    
+    def test_validated_rows_not_selected_again(self, sample_data):
+        """Test that the rows selected by validation are the rows counted."""
+        transition_matrix.clear_transition_cache()
+        builder = AlluvialVisualizationBuilder()
+        
+        with patch.object(transition_matrix, 'select_transition_rows',
+                          side_effect=AssertionError("rows selected twice")):
+            _, stats = (builder
+                        .set_data(sample_data)
+                        .apply_filter('W1_PID1_labeled', 'Democrat')
+                        .build())
+        
+        democrat = sample_data['W1_PID1_labeled'] == 'Democrat'
+        both_waves = sample_data[['W1_HFClust_labeled', 'W2_HFClust_labeled']].notna().all(axis=1)
+        assert stats['total_transitions'] == (democrat & both_waves).sum()
     
     def test_build_error_handling(self, sample_data):
         """Test error handling during build process."""
@@ -257,6 +303,138 @@ class TestAlluvialBuilderIntegration:
                 builder.set_data(sample_data).build()
 
 
+class TestMultiStageAlluvial:
+    """Test alluvial figures through more than two waves."""
+    
+    def test_all_waves_draws_every_wave(self, sample_data):
+        """Test that all_waves gets one node column per wave and links between neighbours."""
+        columns = ['W1_HFClust_labeled', 'W2_HFClust_labeled', 'W3_HFClust_labeled']
+        complete = sample_data[columns].dropna()
+        
+        fig, stats = (AlluvialVisualizationBuilder()
+                      .set_data(sample_data)
+                      .set_wave_config('all_waves')
+                      .build())
+        
+        sankey = fig.data[0]
+        assert len(sankey.node.label) == 9
+        assert sorted(set(sankey.node.x)) == pytest.approx([0.01, 0.5, 0.99])
+        # Every respondent flows through both wave gaps
+        assert sum(sankey.link.value) == 2 * len(complete)
+        assert 'W1 -> W2 -> W3' in fig.layout.title.text
+        assert stats['waves'] == ['W1', 'W2', 'W3']
+        assert stats['total_transitions'] == len(complete)
+        assert stats['top_trajectories'][0]['count'] == complete.value_counts().iloc[0]
+    
+    def test_chain_with_filter(self, sample_data):
+        """Test a chain configuration on a filtered subset."""
+        subset = sample_data[sample_data['W1_PID1_labeled'] == 'Democrat']
+        
+        fig, stats = (AlluvialVisualizationBuilder()
+                      .set_data(sample_data)
+                      .set_wave_config('w3_to_w2_to_w1')
+                      .apply_filter('W1_PID1_labeled', 'Democrat')
+                      .build())
+        
+        assert stats['waves'] == ['W3', 'W2', 'W1']
+        assert stats['total_transitions'] == len(subset[['W1_HFClust_labeled', 'W2_HFClust_labeled',
+                                                         'W3_HFClust_labeled']].dropna())
+        assert fig.data[0].node.label[0].endswith('(W3)')
+    
+    def test_precomputed_matrix_rejected_for_multiple_waves(self, sample_data):
+        """Test that a first -> last matrix cannot stand in for a multi-wave figure."""
+        matrix = get_transition_matrix(sample_data, 'W1_HFClust_labeled', 'W3_HFClust_labeled')
+        
+        builder = (AlluvialVisualizationBuilder()
+                   .set_wave_config('all_waves')
+                   .set_transition_matrix(matrix))
+        
+        with pytest.raises(VisualizationError, match="set_trajectory_counts"):
+            builder.build()
+    
+    def test_precomputed_trajectories_match_data(self, sample_data):
+        """Test that precomputed path counts draw the same figure as counting the data."""
+        columns = ['W1_HFClust_labeled', 'W2_HFClust_labeled', 'W3_HFClust_labeled']
+        trajectories = get_trajectory_counts(sample_data, columns, 'W1_PID1_labeled', 'Democrat')
+        
+        expected_fig, expected_stats = (AlluvialVisualizationBuilder()
+                                        .set_data(sample_data)
+                                        .set_wave_config('all_waves')
+                                        .apply_filter('W1_PID1_labeled', 'Democrat')
+                                        .build())
+        fig, stats = (AlluvialVisualizationBuilder()
+                      .set_wave_config('all_waves')
+                      .apply_filter('W1_PID1_labeled', 'Democrat')
+                      .set_trajectory_counts(trajectories)
+                      .build())
+        
+        assert fig.to_json() == expected_fig.to_json()
+        assert stats == expected_stats
+    
+    def test_precomputed_trajectories_must_match_waves(self, sample_data):
+        """Test that path counts over other columns are rejected."""
+        trajectories = get_trajectory_counts(sample_data, ['W1_HFClust_labeled', 'W3_HFClust_labeled'])
+        
+        builder = (AlluvialVisualizationBuilder()
+                   .set_wave_config('all_waves')
+                   .set_trajectory_counts(trajectories))
+        
+        with pytest.raises(VisualizationError, match="needs"):
+            builder.build()
+    
+    def test_counts_not_carried_between_builds(self, sample_data):
+        """Test that a second build counts its own configuration."""
+        builder = AlluvialVisualizationBuilder().set_data(sample_data).set_wave_config('all_waves')
+        builder.build()
+        
+        fig, stats = builder.set_wave_config('w1_to_w2').build()
+        
+        expected = get_transition_matrix(sample_data, 'W1_HFClust_labeled', 'W2_HFClust_labeled')
+        assert sorted(set(fig.data[0].node.x)) == [0.01, 0.99]
+        assert 'waves' not in stats
+        assert stats['total_transitions'] == expected.total
+
+
+class TestSankeyPayload:
+    """Test the whole-array Sankey link payload."""
+    
+    def test_links_match_per_row_construction(self):
+        """Test that indices, colors and hover text match building each link in Python."""
+        categories = ['Thriving', 'Struggling', 'Suffering', 'Unknown']
+        counts = [[1234, 5, 0, 0],
+                  [7, 2500, 1, 0],
+                  [0, 3, 12, 0],
+                  [4, 0, 0, 0]]
+        builder = (AlluvialVisualizationBuilder()
+                   .set_wave_config('w1_to_w2')
+                   .set_transition_matrix(TransitionMatrix(counts, categories)))
+        builder._prepare_data()
+        builder._configure_visualization()
+        transition_data = builder._process_transition_data()
+        
+        sankey = builder._create_plotly_figure(transition_data).data[0]
+        
+        # 'Unknown' only appears in wave 1, so the target nodes start one later
+        sources = sorted(transition_data['source'].unique())
+        targets = sorted(transition_data['target'].unique())
+        assert list(sankey.node.label) == ([f"{cat} (W1)" for cat in sources] +
+                                           [f"{cat} (W2)" for cat in targets])
+        assert list(sankey.link.source) == [sources.index(s) for s in transition_data['source']]
+        assert list(sankey.link.target) == [len(sources) + targets.index(t)
+                                            for t in transition_data['target']]
+        assert list(sankey.link.value) == transition_data['count'].tolist()
+        
+        node_colors = dict(zip(sources, sankey.node.color))
+        assert list(sankey.link.color) == [_link_color(node_colors[s]) for s in transition_data['source']]
+        assert list(sankey.link.customdata) == [
+            f"{row['source']} → {row['target']}<br>"
+            f"Count: {row['count']:,}<br>"
+            f"Percentage: {row['percentage']:.1f}%"
+            for _, row in transition_data.iterrows()
+        ]
+        assert sankey.link.customdata[0] == "Struggling → Struggling<br>Count: 2,500<br>Percentage: 66.4%"
+
+
 @pytest.mark.unit 
 class TestBuilderValidation:
     """Test validation aspects of the builder."""
@@ -0,0 +1,159 @@
+"""
+Unit tests for wave_visualizer.data_prep.cleaning.cleaning module.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from unittest.mock import patch
+
+from wave_visualizer.data_prep.cleaning.cleaning import DataCleaningPipeline
+from wave_visualizer.data_prep.cleaning.metadata_handler import MetadataHandler
+from wave_visualizer.data_prep.cleaning.value_merging_handler import ValueMergingHandler
+from wave_visualizer.data_prep.cleaning.value_missing_and_dropping_handler import ValueMissingAndDroppingHandler
+from wave_visualizer.data_prep.data_loader import to_columnar_frame
+from wave_visualizer.data_prep.cleaning.values_to_labels import ValuesToLabelsConverter
+
+
+@pytest.fixture
+def pipeline(tmp_path):
+    """Pipeline with small metadata, merging rules and raw data loaded."""
+    pd.DataFrame({
+        'variable_name': ['W1_PID1', 'W1_PID1', 'W1_PID1', 'W2_PID1', 'W2_PID1'],
+        'value': [1, 2, 3, 1, 2],
+        'value_label': ['Democrat', 'Republican', 'Independent', 'Democrat', 'Republican']
+    }).to_csv(tmp_path / "value_labels.csv", index=False)
+
+    pipeline = DataCleaningPipeline(output_dir=str(tmp_path))
+    pipeline.values_converter = ValuesToLabelsConverter(str(tmp_path))
+    pipeline.merging_handler.merging_rules = {
+        'W1_PID1': {'Partisan': ['Democrat', 'Republican'], 'Other': [3.0]}
+    }
+
+    rng = np.random.default_rng(0)
+    pipeline.raw_data = pd.DataFrame({
+        'W1_PID1': rng.choice([1.0, 2.0, 3.0, np.nan], 200),
+        'W2_PID1': rng.choice([1.0, 2.0, 9.0], 200),
+        'age': rng.integers(18, 90, 200).astype(float)
+    })
+    return pipeline
+
+
+class TestApplyCleaningTransformations:
+    """Test serial and parallel per-column cleaning."""
+
+    def test_derived_columns(self, pipeline):
+        """Test that labeled and merged columns are appended after the raw columns."""
+        assert pipeline.apply_cleaning_transformations()
+
+        assert list(pipeline.processed_data.columns) == [
+            'W1_PID1', 'W2_PID1', 'age',
+            'W1_PID1_labeled', 'W1_PID1_merged', 'W1_PID1_labeled_merged', 'W2_PID1_labeled'
+        ]
+        assert set(pipeline.processed_data['W1_PID1_labeled_merged'].dropna()) == {'Partisan', 'Independent'}
+
+    def test_labeled_columns_categorical(self, pipeline):
+        """Test that labeled columns are categoricals in value-label order."""
+        pipeline.apply_cleaning_transformations()
+        labeled = pipeline.processed_data['W2_PID1_labeled']
+
+        assert isinstance(labeled.dtype, pd.CategoricalDtype)
+        assert list(labeled.cat.categories[:2]) == ['Democrat', 'Republican']
+        assert labeled.cat.codes.dtype.itemsize == 1
+
+        pipeline.categorical_labels = False
+        pipeline.apply_cleaning_transformations()
+        assert pipeline.processed_data['W2_PID1_labeled'].dtype == object
+
+    @pytest.mark.parametrize("use_processes", [False, True])
+    def test_parallel_matches_serial(self, pipeline, capsys, use_processes):
+        """Test that worker pools produce the same data and log as the serial path."""
+        pipeline.apply_cleaning_transformations()
+        serial, serial_out = pipeline.processed_data, capsys.readouterr().out
+
+        pipeline.apply_cleaning_transformations(n_workers=2, use_processes=use_processes)
+
+        pd.testing.assert_frame_equal(pipeline.processed_data, serial)
+        assert capsys.readouterr().out == serial_out
+
+    def test_invalid_worker_count(self, pipeline):
+        """Test that fewer than one worker is rejected."""
+        with pytest.raises(ValueError, match="n_workers"):
+            pipeline.apply_cleaning_transformations(n_workers=0)
+
+
+@pytest.fixture
+def sav_file(tmp_path):
+    """Small labeled SPSS file."""
+    pyreadstat = pytest.importorskip("pyreadstat")
+    path = tmp_path / "survey.sav"
+    pyreadstat.write_sav(
+        pd.DataFrame({'W1_PID1': [1.0, 2.0, 1.0], 'age': [30.0, 41.0, 52.0]}), str(path),
+        column_labels=['Party ID', 'Age'],
+        variable_value_labels={'W1_PID1': {1.0: 'Democrat', 2.0: 'Republican'}}
+    )
+    return path
+
+
+class TestSpssIngestion:
+    """Test reading data and metadata from one pass over the .sav file."""
+
+    def test_pipeline_reads_file_once(self, sav_file, tmp_path):
+        """Test that metadata extraction reuses the metadata from load_raw_data."""
+        import pyreadstat
+        pipeline = DataCleaningPipeline(output_dir=str(tmp_path))
+        pipeline.metadata_handler = MetadataHandler(output_dir=str(tmp_path / "metadata"))
+
+        with patch.object(pyreadstat, 'read_sav', wraps=pyreadstat.read_sav) as mock_read:
+            assert pipeline.load_raw_data(str(sav_file))
+            assert pipeline.ensure_metadata_processed(force_reprocess=True)
+
+        mock_read.assert_called_once()
+        assert pipeline.raw_data.shape == (3, 2)
+        assert pipeline.metadata_handler.get_value_labels('W1_PID1') == {1.0: 'Democrat', 2.0: 'Republican'}
+
+    def test_standalone_extraction_reads_metadata_only(self, sav_file, tmp_path):
+        """Test that MetadataHandler alone never loads the data."""
+        import pyreadstat
+        handler = MetadataHandler(output_dir=str(tmp_path / "metadata"))
+
+        with patch.object(pyreadstat, 'read_sav', wraps=pyreadstat.read_sav) as mock_read:
+            assert handler.extract_metadata(sav_file)
+
+        assert mock_read.call_args.kwargs['metadataonly'] is True
+        assert handler.get_variable_label('age') == 'Age'
+
+
+class TestStreamingPipeline:
+    """Test chunk-by-chunk cleaning into the columnar output."""
+
+    def _pipeline(self, tmp_path):
+        pipeline = DataCleaningPipeline(output_dir=str(tmp_path / "out"))
+        pipeline.metadata_handler = MetadataHandler(output_dir=str(tmp_path / "metadata"))
+        pipeline.values_converter = ValuesToLabelsConverter(str(tmp_path / "metadata"))
+        pipeline.missing_handler = ValueMissingAndDroppingHandler(output_dir=str(tmp_path / "settings"))
+        pipeline.merging_handler = ValueMergingHandler(output_dir=str(tmp_path / "settings"))
+        pipeline.merging_handler.merging_rules = {
+            'W1_PID1': {'Partisan': ['Democrat', 'Republican']},
+            'age': {'Older': [52.0]}
+        }
+        return pipeline
+
+    def test_matches_in_memory_pipeline(self, sav_file, tmp_path):
+        """Test that streamed output equals the columnar copy of the in-memory pipeline."""
+        pytest.importorskip("pyarrow")
+        batch = self._pipeline(tmp_path)
+        batch.load_raw_data(str(sav_file))
+        batch.ensure_metadata_processed(force_reprocess=True)
+        batch.apply_cleaning_transformations()
+        expected = to_columnar_frame(batch.processed_data)
+
+        streaming = self._pipeline(tmp_path)
+        assert streaming.run_streaming_pipeline(str(sav_file), chunksize=1, force_reprocess=True)
+
+        result = pd.read_parquet(tmp_path / "out" / "processed_data.parquet")
+        assert streaming.processed_data is None
+        assert result.columns.tolist() == expected.columns.tolist()
+        for column in expected.columns:
+            assert result[column].dtype == expected[column].dtype
+            assert result[column].astype(object).tolist() == expected[column].astype(object).tolist()
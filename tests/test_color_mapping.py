@@ -0,0 +1,55 @@
+"""
+Unit tests for wave_visualizer.data_prep.color_mapping module.
+"""
+
+import pandas as pd
+from unittest.mock import patch
+
+from wave_visualizer.data_prep import color_mapping
+from wave_visualizer.data_prep.color_mapping import ColorMappingHandler
+
+
+def _write_mappings(settings_dir):
+    """Write a small value_color_mappings.csv."""
+    pd.DataFrame({
+        'variable_name': ['PID1_labeled', 'PID1_labeled', 'HFClust_labeled'],
+        'value_name': ['Republican', 'Democrat', 'Thriving'],
+        'color_hex': ['#d62728', '#1f77b4', '#2E8B57'],
+        'description': ['', '', '']
+    }).to_csv(settings_dir / "value_color_mappings.csv", index=False)
+
+
+class TestColorMappingLoading:
+    """Test indexed, cached loading of color mappings."""
+
+    def test_mappings_indexed_by_variable(self, tmp_path):
+        """Test the nested {variable: {value: color}} index."""
+        _write_mappings(tmp_path)
+        handler = ColorMappingHandler(str(tmp_path))
+
+        assert handler.value_color_mappings == {
+            'PID1_labeled': {'Republican': '#d62728', 'Democrat': '#1f77b4'},
+            'HFClust_labeled': {'Thriving': '#2E8B57'}
+        }
+
+    def test_repeat_construction_is_cached(self, tmp_path):
+        """Test that an unchanged mappings file is parsed only once."""
+        _write_mappings(tmp_path)
+        ColorMappingHandler(str(tmp_path))
+
+        with patch.object(color_mapping.pd, 'read_csv', wraps=pd.read_csv) as mock_read:
+            handler = ColorMappingHandler(str(tmp_path))
+
+        mock_read.assert_not_called()
+        assert handler.get_available_mappings('HFClust_labeled') == {'Thriving': '#2E8B57'}
+
+    def test_handlers_do_not_share_edits(self, tmp_path):
+        """Test that adding a mapping is saved and does not leak through the cache."""
+        _write_mappings(tmp_path)
+        first = ColorMappingHandler(str(tmp_path))
+        second = ColorMappingHandler(str(tmp_path))
+
+        first.add_color_mapping('HFClust_labeled', 'Suffering', '#dc143c')
+
+        assert 'Suffering' not in second.value_color_mappings['HFClust_labeled']
+        assert ColorMappingHandler(str(tmp_path)).value_color_mappings['HFClust_labeled']['Suffering'] == '#dc143c'
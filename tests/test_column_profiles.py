@@ -0,0 +1,245 @@
+"""
+Unit tests for wave_visualizer.data_prep.column_profiles module.
+"""
+
+import json
+import os
+
+import pytest
+import numpy as np
+import pandas as pd
+from unittest.mock import patch
+
+from wave_visualizer.data_prep.column_profiles import (
+    ColumnProfileCatalog, get_column_profiles, clear_column_profile_cache,
+    get_profile_path, load_column_profiles, peek_column_profiles
+)
+from wave_visualizer.data_prep.data_loader import invalidate_data_cache, load_processed_data
+from wave_visualizer.data_prep.cleaning.row_reduction import RowReductionHandler
+from wave_visualizer.data_prep.cleaning.value_merging_handler import ValueMergingHandler
+from wave_visualizer.utils.frame_signature import invalidate_frame_caches
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    """Start and finish every test with no memoized data or profiles."""
+    invalidate_data_cache()
+    clear_column_profile_cache()
+    yield
+    invalidate_data_cache()
+    clear_column_profile_cache()
+
+
+@pytest.fixture
+def mixed_data():
+    """Frame with missing values, a categorical and a high-cardinality column."""
+    return pd.DataFrame({
+        'party': ['Democrat', None, 'Republican', 'Democrat', 'Independent', None],
+        'wave': [1.0, 2.0, np.nan, 1.0, 3.0, 3.0],
+        'cluster': pd.Categorical(['b', 'a', 'a', None, 'b', 'a'], categories=['a', 'b', 'unused']),
+        'id': [10, 11, 12, 13, 14, 15],
+    })
+
+
+class TestColumnProfileCatalog:
+    """Test profiling a frame."""
+
+    def test_matches_column_scans(self, mixed_data):
+        """Test that counts match isna, nunique, unique and value_counts per column."""
+        catalog = ColumnProfileCatalog.from_frame(mixed_data)
+
+        assert catalog.columns == list(mixed_data.columns)
+        assert catalog.missing_counts.to_dict() == mixed_data.isna().sum().to_dict()
+        assert catalog.unique_counts.to_dict() == mixed_data.nunique().to_dict()
+        for column in mixed_data.columns:
+            values = mixed_data[column].dropna()
+            assert catalog.unique_values(column) == values.unique().tolist()
+            expected = values.value_counts()
+            assert catalog.value_counts(column).to_dict() == expected[expected > 0].to_dict()
+            assert catalog.sample_values(column, 2) == values.unique()[:2].tolist()
+
+    def test_top_k_truncates_high_cardinality(self, mixed_data):
+        """Test that only the most common values are kept past top_k."""
+        catalog = ColumnProfileCatalog.from_frame(mixed_data, top_k=2)
+
+        assert catalog.is_complete('party') is False
+        assert catalog.unique_values('party') is None
+        assert catalog.unique_count('party') == 3
+        assert catalog.value_counts('party').index[0] == 'Democrat'
+        assert len(catalog.value_counts('id')) == 2
+        assert catalog.is_complete('cluster')
+
+    def test_dict_round_trip(self, mixed_data):
+        """Test that serialized catalogs keep counts and samples."""
+        catalog = ColumnProfileCatalog.from_frame(mixed_data)
+
+        restored = ColumnProfileCatalog.from_dict(json.loads(json.dumps(catalog.to_dict())))
+
+        assert restored.n_rows == catalog.n_rows
+        assert restored.missing_counts.equals(catalog.missing_counts)
+        assert restored.value_counts('party').to_dict() == catalog.value_counts('party').to_dict()
+        assert restored.sample_values('wave') == catalog.sample_values('wave')
+
+    def test_memoized_per_frame(self, mixed_data):
+        """Test that the same frame is profiled once and a copy again."""
+        with patch.object(ColumnProfileCatalog, 'from_frame',
+                          wraps=ColumnProfileCatalog.from_frame) as mock_build:
+            first = get_column_profiles(mixed_data)
+            assert get_column_profiles(mixed_data) is first
+            assert get_column_profiles(mixed_data.copy()) is not first
+
+        assert mock_build.call_count == 2
+
+    def test_changed_columns_reprofiled(self, mixed_data):
+        """Test that replaced columns are profiled again and the rest reused."""
+        first = get_column_profiles(mixed_data)
+
+        mixed_data['party'] = range(6)
+        mixed_data['wave'] = [7.0, 2.0, np.nan, 1.0, 3.0, 3.0]
+        assert peek_column_profiles(mixed_data) is None
+        assert peek_column_profiles(mixed_data, ['cluster']) is first
+
+        with patch.object(ColumnProfileCatalog, 'from_frame',
+                          wraps=ColumnProfileCatalog.from_frame) as mock_build:
+            refreshed = get_column_profiles(mixed_data)
+
+        assert mock_build.call_args.kwargs['columns'] == ['party', 'wave']
+        assert refreshed.unique_count('party') == 6
+        assert refreshed.missing_count('party') == 0
+        assert refreshed.unique_values('wave') == [7.0, 2.0, 1.0, 3.0]
+        assert refreshed.value_counts('cluster').to_dict() == first.value_counts('cluster').to_dict()
+        assert peek_column_profiles(mixed_data) is refreshed
+
+    def test_invalidated_frame_reprofiled(self, mixed_data):
+        """Test that values edited in place are profiled after invalidate_frame_caches()."""
+        get_column_profiles(mixed_data)
+
+        mixed_data.loc[0, 'wave'] = 7.0
+        invalidate_frame_caches(mixed_data)
+
+        assert peek_column_profiles(mixed_data, ['wave']) is None
+        assert get_column_profiles(mixed_data).unique_values('wave') == [7.0, 2.0, 1.0, 3.0]
+
+    def test_hit_does_not_read_values(self, mixed_data, monkeypatch):
+        """Test that reusing a current catalog checks tokens only."""
+        first = get_column_profiles(mixed_data)
+        monkeypatch.setattr(pd, 'factorize', lambda *args, **kwargs: pytest.fail("rescanned"))
+        monkeypatch.setattr(pd.DataFrame, 'isna', lambda *args, **kwargs: pytest.fail("rescanned"))
+
+        assert get_column_profiles(mixed_data) is first
+        assert get_column_profiles(mixed_data, ['party']) is first
+
+    def test_requested_columns_refreshed(self, mixed_data):
+        """Test that a lookup for some columns re-profiles only those."""
+        first = get_column_profiles(mixed_data)
+
+        mixed_data['party'] = range(6)
+        mixed_data['wave'] = 0.0
+
+        assert get_column_profiles(mixed_data, ['cluster']) is first
+        partial = get_column_profiles(mixed_data, ['party'])
+        assert partial.unique_count('party') == 6
+        assert peek_column_profiles(mixed_data, ['party', 'cluster']) is partial
+        assert peek_column_profiles(mixed_data) is None
+        assert get_column_profiles(mixed_data).unique_count('wave') == 1
+
+    def test_added_column_and_dropped_rows(self, mixed_data):
+        """Test that new columns and a changed row count are picked up."""
+        get_column_profiles(mixed_data)
+
+        mixed_data['extra'] = 'x'
+        assert get_column_profiles(mixed_data).unique_count('extra') == 1
+
+        mixed_data.drop(index=[0, 1], inplace=True)
+        refreshed = get_column_profiles(mixed_data)
+        assert refreshed.n_rows == 4
+        assert refreshed.missing_counts.to_dict() == mixed_data.isna().sum().to_dict()
+
+
+class TestProfileSidecar:
+    """Test the profile file persisted next to the processed data."""
+
+    def test_written_then_reused(self, mock_processed_data_file):
+        """Test that a new process reads the sidecar instead of profiling again."""
+        data = load_processed_data(mock_processed_data_file)
+        catalog = get_column_profiles(data)
+
+        assert get_profile_path(mock_processed_data_file).exists()
+        assert load_column_profiles(mock_processed_data_file) is not None
+
+        # Simulate a new process: nothing memoized, sidecar on disk
+        invalidate_data_cache()
+        clear_column_profile_cache()
+        with patch.object(ColumnProfileCatalog, 'from_frame') as mock_build:
+            reloaded = get_column_profiles(load_processed_data(mock_processed_data_file))
+
+        mock_build.assert_not_called()
+        assert reloaded.unique_counts.equals(catalog.unique_counts)
+
+    def test_sidecar_checked_against_frame(self, mock_processed_data_file):
+        """Test that a frame changed after loading does not take the sidecar's profile."""
+        get_column_profiles(load_processed_data(mock_processed_data_file))
+        invalidate_data_cache()
+        clear_column_profile_cache()
+
+        data = load_processed_data(mock_processed_data_file)
+        data['W1_HFClust_labeled'] = 'Thriving'
+
+        assert get_column_profiles(data).unique_count('W1_HFClust_labeled') == 1
+
+    def test_frame_changed_after_loading_not_persisted(self, mock_processed_data_file):
+        """Test that a sidecar is only written from the file's own contents."""
+        data = load_processed_data(mock_processed_data_file)
+        data['W1_HFClust_labeled'] = 'Thriving'
+
+        get_column_profiles(data)
+
+        assert not get_profile_path(mock_processed_data_file).exists()
+
+    def test_stale_sidecar_ignored(self, mock_processed_data_file, sample_data):
+        """Test that rewriting the data invalidates the sidecar."""
+        get_column_profiles(load_processed_data(mock_processed_data_file))
+
+        sample_data.head(100).to_csv(mock_processed_data_file, index=False)
+        stat = os.stat(mock_processed_data_file)
+        os.utime(mock_processed_data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_column_profiles(mock_processed_data_file) is None
+        assert get_column_profiles(load_processed_data(mock_processed_data_file)).n_rows == 100
+
+    def test_column_projection_not_persisted(self, mock_processed_data_file):
+        """Test that frames with only some columns are profiled in memory only."""
+        data = load_processed_data(mock_processed_data_file, columns=['W1_HFClust_labeled'])
+
+        get_column_profiles(data)
+
+        assert not get_profile_path(mock_processed_data_file).exists()
+
+
+class TestHandlersShareProfiles:
+    """Test that cleaning handlers read the shared catalog."""
+
+    def test_handlers_profile_frame_once(self, mixed_data, tmp_path, monkeypatch):
+        """Test that categorical detection and value analysis reuse one catalog."""
+        monkeypatch.chdir(tmp_path)
+        with patch.object(ColumnProfileCatalog, 'from_frame',
+                          wraps=ColumnProfileCatalog.from_frame) as mock_build:
+            categorical = RowReductionHandler().get_categorical_columns(mixed_data)
+            analysis = ValueMergingHandler(output_dir=str(tmp_path)).analyze_column_values(mixed_data, 'party')
+
+        assert mock_build.call_count == 1
+        assert categorical == ['party', 'wave', 'id']
+        assert analysis['unique_values'] == ['Democrat', 'Republican', 'Independent']
+        assert analysis['value_counts'] == {'Democrat': 2, 'Republican': 1, 'Independent': 1}
+        assert analysis['total_non_missing'] == 4
+
+    def test_handlers_see_changed_columns(self, tmp_path, monkeypatch):
+        """Test that a column replaced between calls is classified by its new values."""
+        monkeypatch.chdir(tmp_path)
+        handler = RowReductionHandler()
+        data = pd.DataFrame({'a': ['x', 'y'] * 50})
+        assert handler.get_categorical_columns(data) == ['a']
+
+        data['a'] = range(100)
+
+        assert handler.get_categorical_columns(data) == []
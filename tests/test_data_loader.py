@@ -0,0 +1,215 @@
+"""
+Unit tests for wave_visualizer.data_prep.data_loader module.
+"""
+
+import os
+
+import pytest
+import pandas as pd
+from unittest.mock import patch
+
+from wave_visualizer.data_prep import data_loader
+from wave_visualizer.data_prep.data_loader import (
+    load_processed_data, invalidate_data_cache, refresh_processed_data,
+    get_processed_columns, save_columnar_data, get_columnar_path, ColumnarDataWriter
+)
+from wave_visualizer.exceptions import ColumnNotFoundError, DataLoadingError
+
+
+@pytest.fixture(autouse=True)
+def empty_data_cache():
+    """Start and finish every test with an empty processed data cache."""
+    invalidate_data_cache()
+    yield
+    invalidate_data_cache()
+
+
+class TestLoadProcessedData:
+    """Test cached loading of the processed dataset."""
+
+    def test_load_returns_file_contents(self, mock_processed_data_file, sample_data):
+        """Test that loading returns the data written to disk."""
+        data = load_processed_data(mock_processed_data_file)
+
+        assert data.shape == sample_data.shape
+        assert list(data.columns) == list(sample_data.columns)
+
+    def test_repeat_load_is_cached(self, mock_processed_data_file):
+        """Test that an unchanged file is parsed only once."""
+        with patch.object(data_loader, '_read_processed_file',
+                          wraps=data_loader._read_processed_file) as mock_read:
+            first = load_processed_data(mock_processed_data_file)
+            second = load_processed_data(mock_processed_data_file)
+
+        assert first is second
+        assert mock_read.call_count == 1
+
+    def test_modified_file_is_reloaded(self, mock_processed_data_file, sample_data):
+        """Test that changing the file on disk invalidates the cached copy."""
+        first = load_processed_data(mock_processed_data_file)
+
+        sample_data.head(100).to_csv(mock_processed_data_file, index=False)
+        stat = os.stat(mock_processed_data_file)
+        os.utime(mock_processed_data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = load_processed_data(mock_processed_data_file)
+
+        assert second is not first
+        assert len(second) == 100
+
+    def test_invalidate_and_refresh(self, mock_processed_data_file):
+        """Test the explicit invalidate and refresh API."""
+        first = load_processed_data(mock_processed_data_file)
+
+        assert invalidate_data_cache(mock_processed_data_file) == 1
+        assert invalidate_data_cache(mock_processed_data_file) == 0
+
+        second = load_processed_data(mock_processed_data_file)
+        third = refresh_processed_data(mock_processed_data_file)
+
+        assert second is not first
+        assert third is not second
+
+    def test_missing_file_raises(self, tmp_path):
+        """Test that a missing file raises DataLoadingError."""
+        with pytest.raises(DataLoadingError, match="Processed data file not found"):
+            load_processed_data(tmp_path / "missing.csv")
+
+    def test_default_path_used(self, mock_processed_data_file):
+        """Test that the package default path is used when none is given."""
+        with patch.object(data_loader, 'get_processed_data_path',
+                          return_value=mock_processed_data_file):
+            data = load_processed_data()
+
+        assert isinstance(data, pd.DataFrame)
+
+
+class TestColumnProjection:
+    """Test loading a subset of the processed dataset's columns."""
+
+    def test_load_requested_columns(self, mock_processed_data_file):
+        """Test that only the requested columns are returned, in order."""
+        columns = ['W3_HFClust_labeled', 'W1_HFClust_labeled']
+        data = load_processed_data(mock_processed_data_file, columns=columns)
+
+        assert list(data.columns) == columns
+
+    def test_projection_reads_only_requested_columns(self, mock_processed_data_file):
+        """Test that a projected load parses only the requested columns."""
+        columns = ['W1_HFClust_labeled', 'W2_HFClust_labeled']
+        with patch.object(data_loader, '_read_processed_file',
+                          wraps=data_loader._read_processed_file) as mock_read:
+            load_processed_data(mock_processed_data_file, columns=columns)
+            load_processed_data(mock_processed_data_file, columns=columns)
+
+        mock_read.assert_called_once()
+        assert mock_read.call_args[0][1] == columns
+
+    def test_projection_reuses_full_load(self, mock_processed_data_file):
+        """Test that a fully cached frame serves projected loads without a re-read."""
+        load_processed_data(mock_processed_data_file)
+        with patch.object(data_loader, '_read_processed_file') as mock_read:
+            data = load_processed_data(mock_processed_data_file, columns=['W1_HFClust_labeled'])
+
+        mock_read.assert_not_called()
+        assert list(data.columns) == ['W1_HFClust_labeled']
+
+    def test_missing_column_raises(self, mock_processed_data_file):
+        """Test that requesting an unknown column raises ColumnNotFoundError."""
+        with pytest.raises(ColumnNotFoundError):
+            load_processed_data(mock_processed_data_file, columns=['not_a_column'])
+
+    def test_get_processed_columns(self, mock_processed_data_file, sample_data):
+        """Test listing columns without loading the data."""
+        assert get_processed_columns(mock_processed_data_file) == list(sample_data.columns)
+
+
+class TestColumnarStorage:
+    """Test the Parquet companion of the processed dataset."""
+
+    @pytest.fixture(autouse=True)
+    def require_pyarrow(self):
+        pytest.importorskip("pyarrow")
+
+    def test_columnar_file_preferred(self, mock_processed_data_file, sample_data):
+        """Test that the Parquet file is read instead of the CSV and keeps categories."""
+        columnar_path = save_columnar_data(sample_data, mock_processed_data_file)
+
+        assert columnar_path == get_columnar_path(mock_processed_data_file)
+        with patch.object(data_loader, '_read_processed_file',
+                          wraps=data_loader._read_processed_file) as mock_read:
+            data = load_processed_data(mock_processed_data_file, columns=['W1_HFClust_labeled'])
+
+        assert mock_read.call_args[0][0] == columnar_path
+        assert isinstance(data['W1_HFClust_labeled'].dtype, pd.CategoricalDtype)
+        assert data['W1_HFClust_labeled'].astype(str).tolist() == \
+            sample_data['W1_HFClust_labeled'].astype(str).tolist()
+
+    def test_csv_and_columnar_dtypes_match(self, mock_processed_data_file, sample_data):
+        """Test that labeled text columns load as categoricals from either file."""
+        from_csv = load_processed_data(mock_processed_data_file)
+        columnar_path = save_columnar_data(sample_data, mock_processed_data_file)
+        from_parquet = load_processed_data(columnar_path)
+
+        assert isinstance(from_csv['W1_PID1_labeled'].dtype, pd.CategoricalDtype)
+        assert from_csv.dtypes.astype(str).equals(from_parquet.dtypes.astype(str))
+
+    def test_mixed_categories_written_as_text(self, tmp_path):
+        """Test that leftover numeric codes in a labeled categorical are stored as text."""
+        data = pd.DataFrame({'PID1_labeled': pd.Categorical(['Democrat', 9.0, None],
+                                                            categories=['Democrat', 'Republican', 9.0])})
+
+        path = save_columnar_data(data, tmp_path / "processed_data.csv")
+        result = pd.read_parquet(path)['PID1_labeled']
+
+        assert list(result.cat.categories) == ['Democrat', 'Republican', '9.0']
+
+    def test_stale_columnar_file_ignored(self, mock_processed_data_file, sample_data):
+        """Test that a Parquet file older than the CSV is not used."""
+        columnar_path = save_columnar_data(sample_data.head(10), mock_processed_data_file)
+        stat = os.stat(mock_processed_data_file)
+        os.utime(columnar_path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 1_000_000_000))
+
+        data = load_processed_data(mock_processed_data_file)
+
+        assert len(data) == len(sample_data)
+
+
+class TestColumnarDataWriter:
+    """Test appending chunks to a Parquet file."""
+
+    @pytest.fixture(autouse=True)
+    def require_pyarrow(self):
+        pytest.importorskip("pyarrow")
+
+    def test_chunks_share_one_schema(self, tmp_path):
+        """Test that label/code mixes per chunk are stored like to_columnar_frame."""
+        chunks = [
+            pd.DataFrame({'code': [1.0, 2.0], 'label': [3.0, 9.0], 'merged': [1.0, 2.0]}),
+            pd.DataFrame({'code': [3.0, None], 'label': ['Democrat', None], 'merged': [3.0, None]}),
+        ]
+
+        with ColumnarDataWriter(tmp_path / "processed_data.csv",
+                                text_columns=['label', 'merged']) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+
+        data = pd.read_parquet(get_columnar_path(tmp_path / "processed_data.csv"))
+        assert data['code'].tolist()[:3] == [1.0, 2.0, 3.0]
+        assert isinstance(data['label'].dtype, pd.CategoricalDtype)
+        assert data['label'].astype(object).tolist()[:3] == ['3.0', '9.0', 'Democrat']
+        assert data['merged'].dtype == float
+
+    def test_drop_columns_and_abort(self, tmp_path):
+        """Test leaving columns out on close and discarding a failed write."""
+        writer = ColumnarDataWriter(tmp_path / "processed_data.csv")
+        writer.write(pd.DataFrame({'a': [1.0], 'b': [2.0]}))
+        path = writer.close(drop_columns=['b'])
+
+        assert pd.read_parquet(path).columns.tolist() == ['a']
+
+        with pytest.raises(RuntimeError):
+            with ColumnarDataWriter(tmp_path / "other.csv") as failed:
+                failed.write(pd.DataFrame({'a': [1.0]}))
+                raise RuntimeError("boom")
+        assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,317 @@
+"""
+Unit tests for wave_visualizer.data_prep.export_handler module.
+"""
+
+import json
+import os
+
+import pytest
+import plotly.io as pio
+from plotly.offline import get_plotlyjs
+import plotly.graph_objects as go
+from unittest.mock import patch
+
+from wave_visualizer.exceptions import ExportError
+from wave_visualizer.data_prep.export_handler import (
+    ExportHandler, ImageRenderer, FINGERPRINT_FILENAME, PLOTLYJS_FILENAME, figure_fingerprint
+)
+
+
+@pytest.fixture
+def handler(tmp_path):
+    """Handler exporting into tmp_path/exports."""
+    handler = ExportHandler()
+    with patch.object(handler, '_get_caller_directory', return_value=str(tmp_path)):
+        yield handler
+
+
+@pytest.fixture
+def figure():
+    """Small heatmap figure."""
+    return go.Figure(go.Heatmap(z=[[1, 2], [3, 4]]))
+
+
+def _fake_write_image(fig, path, **kwargs):
+    """Stand-in for Kaleido rendering."""
+    with open(path, 'wb') as f:
+        f.write(b'PNG' + json.dumps(kwargs, sort_keys=True).encode())
+
+
+class FakeKaleido:
+    """Stand-in for kaleido.Kaleido that writes placeholder images."""
+
+    instances = []
+
+    def __init__(self, n=1, timeout=None):
+        self.n = n
+        self.renders = []
+        self.closed = False
+        FakeKaleido.instances.append(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+
+    async def write_fig_from_object(self, specs, cancel_on_error=False):
+        for spec in specs:
+            with open(spec['path'], 'wb') as f:
+                f.write(b'IMG' + spec['opts']['format'].encode())
+            self.renders.append(spec)
+
+
+class BrokenKaleido(FakeKaleido):
+    """Kaleido whose browser cannot be started."""
+
+    async def __aenter__(self):
+        raise RuntimeError("Chrome not found")
+
+
+@pytest.fixture
+def fake_kaleido(monkeypatch):
+    """Replace the Kaleido browser with FakeKaleido."""
+    kaleido = pytest.importorskip("kaleido")
+    FakeKaleido.instances = []
+    monkeypatch.setattr(kaleido, 'Kaleido', FakeKaleido)
+    return FakeKaleido
+
+
+class TestFigureFingerprint:
+    """Test hashing of figure payloads."""
+
+    def test_changes_with_figure(self, figure):
+        """Test that equal figures match and edited figures do not."""
+        same = go.Figure(go.Heatmap(z=[[1, 2], [3, 4]]))
+
+        assert figure_fingerprint(figure) == figure_fingerprint(same)
+        same.update_layout(title='Changed')
+        assert figure_fingerprint(figure) != figure_fingerprint(same)
+
+    def test_unserializable_figure(self):
+        """Test that objects without a JSON payload have no fingerprint."""
+        assert figure_fingerprint(object()) is None
+
+
+class TestExportSkipping:
+    """Test that unchanged figures are not written again."""
+
+    def test_unchanged_figure_skipped(self, handler, figure, tmp_path):
+        """Test that a second identical export writes nothing."""
+        with patch.object(pio, 'write_html', wraps=pio.write_html) as mock_html, \
+             patch.object(pio, 'write_image', side_effect=_fake_write_image) as mock_image:
+            first = handler.export_visualization(figure, 'heatmap')
+            second = handler.export_visualization(figure, 'heatmap')
+
+        assert first == second == {
+            'html': str(tmp_path / 'exports' / 'heatmap.html'),
+            'png': str(tmp_path / 'exports' / 'heatmap.png'),
+        }
+        assert mock_html.call_count == 1
+        assert mock_image.call_count == 1
+        manifest = json.loads((tmp_path / 'exports' / FINGERPRINT_FILENAME).read_text())
+        assert set(manifest) == {'heatmap.html', 'heatmap.png'}
+
+    def test_changed_figure_rewritten(self, handler, figure):
+        """Test that editing the figure triggers a new export."""
+        with patch.object(pio, 'write_html', wraps=pio.write_html) as mock_html:
+            handler.export_visualization(figure, 'heatmap', formats=['html'])
+            figure.update_layout(title='New title')
+            handler.export_visualization(figure, 'heatmap', formats=['html'])
+
+        assert mock_html.call_count == 2
+
+    def test_force_and_missing_file_rewritten(self, handler, figure, tmp_path):
+        """Test that force=True or a deleted file bypasses the fingerprint."""
+        with patch.object(pio, 'write_html', wraps=pio.write_html) as mock_html:
+            handler.export_visualization(figure, 'heatmap', formats=['html'])
+            handler.export_visualization(figure, 'heatmap', formats=['html'], force=True)
+            os.remove(tmp_path / 'exports' / 'heatmap.html')
+            handler.export_visualization(figure, 'heatmap', formats=['html'])
+
+        assert mock_html.call_count == 3
+        assert (tmp_path / 'exports' / 'heatmap.html').exists()
+
+    def test_edited_output_rewritten(self, handler, figure, tmp_path):
+        """Test that a file modified after export is written again."""
+        with patch.object(pio, 'write_html', wraps=pio.write_html) as mock_html:
+            handler.export_visualization(figure, 'heatmap', formats=['html'])
+            with open(tmp_path / 'exports' / 'heatmap.html', 'a') as f:
+                f.write('<!-- edited -->')
+            handler.export_visualization(figure, 'heatmap', formats=['html'])
+
+        assert mock_html.call_count == 2
+
+
+@pytest.mark.skipif(not ImageRenderer.supported(), reason="requires kaleido v1+")
+class TestExportFigures:
+    """Test batch export through one warm renderer."""
+
+    def test_one_renderer_for_batch(self, handler, fake_kaleido, tmp_path):
+        """Test that every image of a batch is rendered by one browser."""
+        figures = {f'party_{i}': go.Figure(go.Bar(y=[i, i + 1])) for i in range(3)}
+
+        results = handler.export_figures(figures, formats=['html', 'png', 'svg'], n_renderers=2)
+
+        assert list(results) == ['party_0', 'party_1', 'party_2']
+        assert len(fake_kaleido.instances) == 1
+        renderer = fake_kaleido.instances[0]
+        assert renderer.n == 2 and renderer.closed
+        assert [spec['opts']['format'] for spec in renderer.renders] == ['png', 'svg'] * 3
+        assert renderer.renders[0]['opts']['width'] == 1200
+        for name, result in results.items():
+            assert result['files']['png'] == str(tmp_path / 'exports' / f'{name}.png')
+            assert set(result['seconds']) == {'html', 'png', 'svg'}
+            assert result['skipped'] == []
+            assert result['total_seconds'] >= sum(result['seconds'].values())
+
+    def test_unchanged_batch_skipped(self, handler, fake_kaleido):
+        """Test that re-exporting the same batch renders nothing."""
+        figures = [('a', go.Figure(go.Bar(y=[1]))), ('b', go.Figure(go.Bar(y=[2])))]
+        handler.export_figures(figures)
+
+        results = handler.export_figures(figures)
+
+        assert all(result['skipped'] == ['html', 'png'] for result in results.values())
+        assert len(fake_kaleido.instances) == 1
+
+    def test_renderer_failure_falls_back(self, handler, monkeypatch):
+        """Test that images are still written when the browser cannot start."""
+        kaleido = pytest.importorskip("kaleido")
+        monkeypatch.setattr(kaleido, 'Kaleido', BrokenKaleido)
+
+        with patch.object(pio, 'write_image', side_effect=_fake_write_image) as mock_image:
+            results = handler.export_figures({'a': go.Figure(), 'b': go.Figure()}, formats=['png'])
+
+        assert mock_image.call_count == 2
+        assert set(results) == {'a', 'b'}
+
+
+class TestConcurrentExport:
+    """Test writing formats and figures on a thread pool."""
+
+    def test_parallel_matches_sequential(self, handler, figure, tmp_path):
+        """Test that n_workers only changes scheduling, not the returned paths."""
+        with patch.object(pio, 'write_image', side_effect=_fake_write_image):
+            sequential = handler.export_visualization(figure, 'seq', formats=['html', 'png', 'svg', 'pdf'])
+            parallel = handler.export_visualization(figure, 'par', formats=['html', 'png', 'svg', 'pdf'],
+                                                    n_workers=4)
+
+        assert list(parallel) == list(sequential) == ['html', 'png', 'svg', 'pdf']
+        assert parallel == {fmt: str(tmp_path / 'exports' / f'par.{fmt}') for fmt in parallel}
+        assert all(os.path.getsize(path) > 0 for path in parallel.values())
+
+    def test_figure_serialized_once(self, handler, figure):
+        """Test that every format shares one to_dict() of the figure."""
+        with patch.object(pio, 'write_image', side_effect=_fake_write_image), \
+             patch.object(go.Figure, 'to_dict', autospec=True, side_effect=go.Figure.to_dict) as mock_dict:
+            handler.export_visualization(figure, 'heatmap', formats=['html', 'png', 'svg'], n_workers=3)
+
+        assert mock_dict.call_count == 1
+
+    def test_failure_keeps_written_files(self, handler, figure, tmp_path):
+        """Test that one failing format raises ExportError but records the others."""
+        def fail_svg(fig, path, **kwargs):
+            if path.endswith('.svg'):
+                raise RuntimeError("render failed")
+            _fake_write_image(fig, path, **kwargs)
+
+        with patch.object(pio, 'write_image', side_effect=fail_svg), \
+             pytest.raises(ExportError, match="svg"):
+            handler.export_visualization(figure, 'heatmap', formats=['html', 'png', 'svg'], n_workers=3)
+
+        manifest = json.loads((tmp_path / 'exports' / FINGERPRINT_FILENAME).read_text())
+        assert set(manifest) == {'heatmap.html', 'heatmap.png'}
+
+    @pytest.mark.skipif(not ImageRenderer.supported(), reason="requires kaleido v1+")
+    def test_parallel_batch(self, handler, fake_kaleido):
+        """Test that a parallel batch groups results per figure in format order."""
+        figures = {f'party_{i}': go.Figure(go.Bar(y=[i])) for i in range(4)}
+
+        results = handler.export_figures(figures, formats=['png', 'html'], n_workers=3)
+
+        assert list(results) == list(figures)
+        assert fake_kaleido.instances[0].n == 3
+        assert all(list(result['files']) == ['png', 'html'] for result in results.values())
+        assert len(fake_kaleido.instances[0].renders) == 4
+
+
+class TestSharedPlotlyJS:
+    """Test HTML exports that share one plotly.js bundle."""
+
+    def test_directory_mode_writes_bundle_once(self, handler, tmp_path):
+        """Test that every HTML file references one shared plotly.min.js."""
+        figures = {f'party_{i}': go.Figure(go.Bar(y=[i])) for i in range(3)}
+        exports = tmp_path / 'exports'
+
+        handler.export_figures(figures, formats=['html'], include_plotlyjs='directory')
+        bundle_mtime = (exports / PLOTLYJS_FILENAME).stat().st_mtime_ns
+        handler.export_visualization(go.Figure(go.Bar(y=[9])), 'extra', formats=['html'],
+                                     include_plotlyjs='directory')
+
+        assert (exports / PLOTLYJS_FILENAME).stat().st_mtime_ns == bundle_mtime
+        embedded = handler.export_visualization(go.Figure(go.Bar(y=[9])), 'embedded', formats=['html'])
+        for name in list(figures) + ['extra']:
+            page = (exports / f'{name}.html').read_text()
+            assert f'src="{PLOTLYJS_FILENAME}"' in page
+            assert len(page) * 100 < os.path.getsize(embedded['html'])
+
+    def test_mode_change_rewrites_html(self, handler, figure):
+        """Test that switching plotly.js mode is not mistaken for an unchanged export."""
+        with patch.object(pio, 'write_html', wraps=pio.write_html) as mock_html:
+            handler.export_visualization(figure, 'heatmap', formats=['html'])
+            handler.export_visualization(figure, 'heatmap', formats=['html'], include_plotlyjs='directory')
+            handler.export_visualization(figure, 'heatmap', formats=['html'], include_plotlyjs='directory')
+
+        assert mock_html.call_count == 2
+
+    def test_missing_bundle_restored(self, handler, figure, tmp_path):
+        """Test that a deleted bundle is written again even when the HTML is skipped."""
+        handler.export_visualization(figure, 'heatmap', formats=['html'], include_plotlyjs='directory')
+        os.remove(tmp_path / 'exports' / PLOTLYJS_FILENAME)
+
+        handler.export_visualization(figure, 'heatmap', formats=['html'], include_plotlyjs='directory')
+
+        assert (tmp_path / 'exports' / PLOTLYJS_FILENAME).exists()
+
+    def test_invalid_mode_rejected(self, handler, figure):
+        """Test that unsupported plotly.js modes raise ExportError."""
+        with pytest.raises(ExportError, match="include_plotlyjs"):
+            handler.export_visualization(figure, 'heatmap', include_plotlyjs='inline')
+
+
+class TestExportReport:
+    """Test single-page multi-figure HTML reports."""
+
+    def test_report_contains_every_figure(self, handler, tmp_path):
+        """Test that the report holds one section per figure and one plotly.js reference."""
+        figures = {'Democrat <D>': go.Figure(go.Bar(y=[1])), 'Republican': go.Figure(go.Bar(y=[2]))}
+
+        path = handler.export_report(figures, 'party_report', title='By party')
+
+        assert path == str(tmp_path / 'exports' / 'party_report.html')
+        page = (tmp_path / 'exports' / 'party_report.html').read_text()
+        assert page.count('<section>') == 2
+        assert page.count(f'src="{PLOTLYJS_FILENAME}"') == 1
+        assert page.count('Plotly.newPlot') == 2
+        assert 'Democrat &lt;D&gt;' in page and '<h1>By party</h1>' in page
+        assert (tmp_path / 'exports' / PLOTLYJS_FILENAME).exists()
+
+    def test_unchanged_report_skipped(self, handler, tmp_path):
+        """Test that an identical report is not written again, and an edited one is."""
+        figures = [('a', go.Figure(go.Bar(y=[1]))), ('b', go.Figure(go.Bar(y=[2])))]
+        handler.export_report(figures, 'report')
+        mtime = (tmp_path / 'exports' / 'report.html').stat().st_mtime_ns
+
+        handler.export_report(figures, 'report')
+        assert (tmp_path / 'exports' / 'report.html').stat().st_mtime_ns == mtime
+
+        handler.export_report(figures, 'report', title='Retitled')
+        assert 'Retitled' in (tmp_path / 'exports' / 'report.html').read_text()
+
+    def test_embedded_report(self, handler, tmp_path):
+        """Test that an embedded report carries plotly.js once and writes no bundle."""
+        handler.export_report({'a': go.Figure(), 'b': go.Figure()}, 'report', include_plotlyjs=True)
+
+        assert not (tmp_path / 'exports' / PLOTLYJS_FILENAME).exists()
+        assert os.path.getsize(tmp_path / 'exports' / 'report.html') < 1.5 * len(get_plotlyjs())
@@ -0,0 +1,195 @@
+"""
+Unit tests for wave_visualizer.visualization_techs.grouped_visualizations module.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from unittest.mock import patch
+
+from wave_visualizer.visualization_techs.alluvial_plots import create_alluvial_visualization
+from wave_visualizer.visualization_techs.grouped_visualizations import create_visualizations_by_group
+from wave_visualizer.visualization_techs.heatmaps import create_heatmap_visualization
+from wave_visualizer.visualization_techs.transition_matrix import (
+    TransitionMatrix, get_trajectory_counts, group_trajectory_counts, group_transition_matrices,
+    clear_transition_cache
+)
+from wave_visualizer.exceptions import DataValidationError, FilteringError
+
+
+@pytest.fixture(autouse=True)
+def empty_transition_cache():
+    """Start every test with an empty matrix cache."""
+    clear_transition_cache()
+    yield
+    clear_transition_cache()
+
+
+class TestGroupTransitionMatrices:
+    """Test the one-pass (group, source, target) count cube."""
+
+    def test_slices_match_filtered_counts(self, sample_data):
+        """Test that each group's matrix equals counting the filtered rows."""
+        matrices = group_transition_matrices(
+            sample_data, 'W1_HFClust_labeled', 'W3_HFClust_labeled', 'W1_PID1_labeled'
+        )
+
+        assert list(matrices) == ['Democrat', 'Independent', 'Republican']
+        for party, matrix in matrices.items():
+            subset = sample_data[sample_data['W1_PID1_labeled'] == party]
+            expected = TransitionMatrix.from_frame(subset, 'W1_HFClust_labeled', 'W3_HFClust_labeled')
+            assert matrix.categories == expected.categories
+            np.testing.assert_array_equal(matrix.counts, expected.counts)
+
+    def test_categorical_columns(self, sample_data):
+        """Test that categorical columns give the same groups, in the same order."""
+        categorical = sample_data.astype({
+            'W1_HFClust_labeled': pd.CategoricalDtype(['Thriving', 'Struggling', 'Suffering']),
+            'W3_HFClust_labeled': pd.CategoricalDtype(['Thriving', 'Struggling', 'Suffering']),
+            'W1_PID1_labeled': pd.CategoricalDtype(['Republican', 'Democrat', 'Independent']),
+        })
+
+        expected = group_transition_matrices(
+            sample_data, 'W1_HFClust_labeled', 'W3_HFClust_labeled', 'W1_PID1_labeled'
+        )
+        matrices = group_transition_matrices(
+            categorical, 'W1_HFClust_labeled', 'W3_HFClust_labeled', 'W1_PID1_labeled'
+        )
+
+        assert list(matrices) == list(expected)
+        for party, matrix in matrices.items():
+            assert matrix.categories == expected[party].categories
+            np.testing.assert_array_equal(matrix.counts, expected[party].counts)
+
+    def test_missing_values_ignored(self, sample_data):
+        """Test that rows missing a wave or group value are not counted."""
+        matrices = group_transition_matrices(
+            sample_data, 'W2_HFClust_labeled', 'W3_HFClust_labeled', 'W3_PID1_labeled'
+        )
+        complete = sample_data[['W2_HFClust_labeled', 'W3_HFClust_labeled', 'W3_PID1_labeled']].dropna()
+
+        assert sum(matrix.total for matrix in matrices.values()) == len(complete)
+
+
+class TestGroupTrajectoryCounts:
+    """Test the one-pass (group, path) counts."""
+
+    COLUMNS = ['W1_HFClust_labeled', 'W2_HFClust_labeled', 'W3_HFClust_labeled']
+
+    def test_groups_match_filtered_counts(self, sample_data):
+        """Test that each group's paths equal counting the filtered rows."""
+        trajectories = group_trajectory_counts(sample_data, self.COLUMNS, 'W3_PID1_labeled')
+
+        assert list(trajectories) == ['Democrat', 'Independent', 'Republican']
+        for party, counts in trajectories.items():
+            expected = get_trajectory_counts(sample_data, self.COLUMNS, 'W3_PID1_labeled', party)
+            assert counts.stages == self.COLUMNS
+            assert counts.total == expected.total
+            pd.testing.assert_frame_equal(counts.ranked_paths(), expected.ranked_paths())
+
+    def test_wide_keys_fall_back_to_code_rows(self, sample_data):
+        """Test that (group, path) keys too wide for int64 give the same counts."""
+        columns = self.COLUMNS * 14  # 3 ** 42 paths do not fit in int64
+
+        trajectories = group_trajectory_counts(sample_data, columns, 'W1_PID1_labeled')
+
+        for party, counts in trajectories.items():
+            expected = get_trajectory_counts(sample_data, columns, 'W1_PID1_labeled', party)
+            assert counts.total == expected.total
+            np.testing.assert_array_equal(counts.transition(0, 40).counts,
+                                          expected.transition(0, 40).counts)
+
+
+class TestCreateVisualizationsByGroup:
+    """Test the grouped visualization entry point."""
+
+    def test_matches_single_filter_path(self, sample_data):
+        """Test that grouped output matches one filtered call per group."""
+        results = create_visualizations_by_group(
+            variable_name='HFClust_labeled', wave_config='w1_to_w3',
+            group_by='W1_PID1_labeled', kinds=['heatmap', 'patterns'], data=sample_data
+        )
+
+        assert set(results) == {'Democrat', 'Independent', 'Republican'}
+        fig, stats = results['Democrat']['heatmap']
+        clear_transition_cache()
+        _, expected = create_heatmap_visualization(
+            data=sample_data, wave_config='w1_to_w3', filter_column='W1_PID1_labeled',
+            filter_value='Democrat', show_plot=False
+        )
+
+        assert isinstance(fig, go.Figure)
+        assert stats == expected
+        assert 'Democrat Subset' in fig.layout.title.text
+
+    def test_multi_wave_alluvial_matches_single_call(self, sample_data):
+        """Test that all_waves groups get the same multi-stage alluvial as filtered calls."""
+        results = create_visualizations_by_group(
+            wave_config='all_waves', group_by='W1_PID1_labeled', kinds=['alluvial', 'heatmap'],
+            data=sample_data
+        )
+
+        fig, stats = results['Republican']['alluvial']
+        expected_fig, expected_stats = create_alluvial_visualization(
+            data=sample_data, wave_config='all_waves', filter_column='W1_PID1_labeled',
+            filter_value='Republican', show_plot=False
+        )
+        assert fig.to_json() == expected_fig.to_json()
+        assert stats == expected_stats
+        assert stats['waves'] == ['W1', 'W2', 'W3']
+        assert 'waves' not in results['Republican']['heatmap'][1]
+
+    def test_group_without_full_paths_gets_no_alluvial(self, sample_data):
+        """Test that a group with first -> last respondents but no complete path is not drawn empty."""
+        data = sample_data.copy()
+        data.loc[data['W1_PID1_labeled'] == 'Independent', 'W2_HFClust_labeled'] = np.nan
+
+        results = create_visualizations_by_group(
+            wave_config='all_waves', group_by='W1_PID1_labeled', kinds=['alluvial', 'heatmap'],
+            data=data
+        )
+        alluvials_only = create_visualizations_by_group(
+            wave_config='all_waves', group_by='W1_PID1_labeled', kinds=['alluvial'], data=data
+        )
+
+        assert set(results['Independent']) == {'heatmap'}
+        assert set(results['Democrat']) == {'alluvial', 'heatmap'}
+        assert 'Independent' not in alluvials_only
+        with pytest.raises(FilteringError, match="Independent"):
+            create_visualizations_by_group(wave_config='all_waves', group_by='W1_PID1_labeled',
+                                           groups=['Independent'], kinds=['alluvial'], data=data)
+
+    def test_data_filtered_once(self, sample_data):
+        """Test that no per-group filtering pass is made."""
+        with patch('wave_visualizer.data_prep.cleaning.row_reduction.RowReductionHandler.apply_filters') as mock_filter, \
+             patch('wave_visualizer.visualization_techs.grouped_visualizations.group_transition_matrices',
+                   wraps=group_transition_matrices) as mock_group:
+            results = create_visualizations_by_group(
+                wave_config='w1_to_w2', group_by='W1_PID1_labeled', data=sample_data
+            )
+
+        mock_filter.assert_not_called()
+        mock_group.assert_called_once()
+        assert all(set(figures) == {'alluvial', 'heatmap', 'patterns'} for figures in results.values())
+
+    def test_selected_groups(self, sample_data):
+        """Test creating only the requested groups, in order."""
+        results = create_visualizations_by_group(
+            group_by='W1_PID1_labeled', groups=['Republican', 'Democrat'],
+            kinds=['patterns'], data=sample_data
+        )
+
+        assert list(results) == ['Republican', 'Democrat']
+
+    def test_unknown_group_raises(self, sample_data):
+        """Test that a group with no respondents raises FilteringError."""
+        with pytest.raises(FilteringError, match="Green"):
+            create_visualizations_by_group(group_by='W1_PID1_labeled', groups=['Green'],
+                                           kinds=['heatmap'], data=sample_data)
+
+    def test_unknown_kind_raises(self, sample_data):
+        """Test that an unsupported visualization kind is rejected."""
+        with pytest.raises(DataValidationError, match="kinds"):
+            create_visualizations_by_group(group_by='W1_PID1_labeled', kinds=['scatter'],
+                                           data=sample_data)
@@ -14,10 +14,10 @@ import wave_visualizer
 class TestFullVisualizationWorkflow:
     """Test complete visualization workflow."""
     
-    @patch('wave_visualizer.visualization_techs.alluvial_plots.pd.read_csv')
-    def test_create_alluvial_visualization_basic(self, mock_read_csv, sample_data, test_helpers):
+    @patch('wave_visualizer.visualization_techs.alluvial_builder.load_processed_data')
+    def test_create_alluvial_visualization_basic(self, mock_load_data, sample_data, test_helpers):
         """Test basic alluvial visualization creation."""
-        mock_read_csv.return_value = sample_data
+        mock_load_data.return_value = sample_data
         
         # This tests the main API function
         fig, stats = wave_visualizer.create_alluvial_visualization(
@@ -33,10 +33,10 @@ class TestFullVisualizationWorkflow:
         assert stats['variable_analyzed'] == 'HFClust_labeled'
         assert stats['wave_transition'] == 'w1_to_w2'
     
-    @patch('wave_visualizer.visualization_techs.alluvial_plots.pd.read_csv')
-    def test_create_alluvial_visualization_with_filter(self, mock_read_csv, sample_data, test_helpers):
+    @patch('wave_visualizer.visualization_techs.alluvial_builder.load_processed_data')
+    def test_create_alluvial_visualization_with_filter(self, mock_load_data, sample_data, test_helpers):
         """Test alluvial visualization with filtering."""
-        mock_read_csv.return_value = sample_data
+        mock_load_data.return_value = sample_data
         
         fig, stats = wave_visualizer.create_alluvial_visualization(
             variable_name='HFClust_labeled',
@@ -144,10 +144,10 @@ class TestConfigurationIntegration:
 class TestEndToEndWorkflow:
     """Test complete end-to-end workflows."""
     
-    @patch('wave_visualizer.visualization_techs.alluvial_plots.pd.read_csv')
-    def test_complete_visualization_and_export_workflow(self, mock_read_csv, sample_data, tmp_path):
+    @patch('wave_visualizer.visualization_techs.alluvial_builder.load_processed_data')
+    def test_complete_visualization_and_export_workflow(self, mock_load_data, sample_data, tmp_path):
         """Test complete workflow from visualization to export."""
-        mock_read_csv.return_value = sample_data
+        mock_load_data.return_value = sample_data
         
         with patch('wave_visualizer.data_prep.export_handler._export_handler._get_caller_directory') as mock_caller:
             mock_caller.return_value = str(tmp_path)
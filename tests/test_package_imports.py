@@ -0,0 +1,66 @@
+"""
+Tests for the lazy public API of the wave_visualizer package.
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+import wave_visualizer
+from wave_visualizer import visualization_techs
+
+# A fresh `import wave_visualizer` takes ~0.02 s; eager imports took ~0.7 s
+IMPORT_TIME_BUDGET = 0.35
+
+
+def _run_fresh(statement):
+    """Run a statement in a new interpreter; return its time and loaded heavy modules."""
+    probe = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - start\n"
+        "heavy = ['pandas', 'pyreadstat', 'plotly', 'kaleido']\n"
+        "print(json.dumps({'seconds': elapsed, 'loaded': [m for m in heavy if m in sys.modules]}))"
+    )
+    output = subprocess.run([sys.executable, '-c', probe], check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+class TestLazyImports:
+    """Test that heavy dependencies load only when their features are used."""
+
+    def test_bare_import_is_light(self):
+        """Test that importing the package loads no heavy dependency and stays within budget."""
+        runs = [_run_fresh("import wave_visualizer") for _ in range(3)]
+
+        assert all(run['loaded'] == [] for run in runs)
+        assert min(run['seconds'] for run in runs) < IMPORT_TIME_BUDGET
+
+    @pytest.mark.parametrize('statement', [
+        "from wave_visualizer import DataCleaningPipeline, RowReductionHandler",
+        "from wave_visualizer import TransitionMatrix, load_processed_data",
+    ])
+    def test_cleaning_and_statistics_skip_plotly(self, statement):
+        """Test that non-plotting features never import plotly or Kaleido."""
+        loaded = _run_fresh(statement)['loaded']
+
+        assert 'plotly' not in loaded and 'kaleido' not in loaded
+
+    def test_every_public_name_resolves(self):
+        """Test that each lazy name resolves to the object defined in its submodule."""
+        for package in (wave_visualizer, visualization_techs):
+            for name in package._LAZY_ATTRIBUTES:
+                value = getattr(package, name)
+                assert value is not None
+                assert name in dir(package)
+        assert wave_visualizer.export_figure is sys.modules[
+            'wave_visualizer.data_prep.export_handler'].export_figure
+
+    def test_unknown_attribute_raises(self):
+        """Test that missing names still raise AttributeError."""
+        with pytest.raises(AttributeError, match="no_such_name"):
+            wave_visualizer.no_such_name
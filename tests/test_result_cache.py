@@ -0,0 +1,96 @@
+"""
+Unit tests for wave_visualizer.utils.result_cache module.
+"""
+
+import os
+
+import pytest
+
+from wave_visualizer.utils.result_cache import ResultCache, files_fingerprint, get_result_cache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Cache in a temporary directory."""
+    return ResultCache(tmp_path / "cache", max_bytes=1000)
+
+
+class TestResultCache:
+    """Test content-addressed storage and LRU eviction."""
+
+    def test_round_trip(self, cache):
+        """Test that stored values are read back by key."""
+        key = ResultCache.make_key({'column': 'W1_HFClust_labeled', 'filter': None})
+
+        assert cache.get(key) is None
+        assert cache.put(key, {'counts': [[1, 2], [3, 4]], 'categories': ['a', 'b']})
+        assert cache.get(key) == {'counts': [[1, 2], [3, 4]], 'categories': ['a', 'b']}
+
+    def test_key_is_canonical(self):
+        """Test that key order does not matter and values do."""
+        assert ResultCache.make_key({'a': 1, 'b': 2}) == ResultCache.make_key({'b': 2, 'a': 1})
+        assert ResultCache.make_key({'a': 1}) != ResultCache.make_key({'a': 2})
+
+    def test_least_recently_used_evicted(self, cache):
+        """Test that the oldest unused entries go first once over the cap."""
+        payload = 'x' * 300
+        keys = [ResultCache.make_key({'n': n}) for n in range(3)]
+        for age, key in enumerate(keys):
+            cache.put(key, payload)
+            path = cache.cache_dir / f"{key}.json"
+            os.utime(path, ns=(age * 10**9, age * 10**9))
+        cache.get(keys[0])
+
+        cache.put(ResultCache.make_key({'n': 3}), payload)
+
+        assert cache.get(keys[0]) == payload
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[2]) == payload
+
+    def test_unserializable_not_stored(self, cache):
+        """Test that values that are not JSON are skipped."""
+        assert not cache.put(ResultCache.make_key({}), {'value': object()})
+        assert cache.clear() == 0
+
+    def test_corrupt_entry_ignored(self, cache):
+        """Test that an unreadable entry is a miss."""
+        key = ResultCache.make_key({'n': 1})
+        cache.cache_dir.mkdir(parents=True)
+        (cache.cache_dir / f"{key}.json").write_text("{not json")
+
+        assert cache.get(key) is None
+
+
+class TestConfiguration:
+    """Test environment configuration and file fingerprints."""
+
+    def test_environment_override(self, tmp_path, monkeypatch):
+        """Test the directory and size cap environment variables."""
+        monkeypatch.setenv('WAVE_VISUALIZER_CACHE_DIR', str(tmp_path / "elsewhere"))
+        monkeypatch.setenv('WAVE_VISUALIZER_CACHE_MAX_BYTES', '2048')
+
+        cache = get_result_cache()
+
+        assert cache.cache_dir == tmp_path / "elsewhere"
+        assert cache.max_bytes == 2048
+
+    def test_disabled_by_default(self, monkeypatch):
+        """Test that nothing is cached on disk unless a directory is configured."""
+        monkeypatch.delenv('WAVE_VISUALIZER_CACHE_DIR', raising=False)
+        assert get_result_cache() is None
+
+        monkeypatch.setenv('WAVE_VISUALIZER_CACHE_DIR', ' ')
+        assert get_result_cache() is None
+
+    def test_files_fingerprint_tracks_content(self, tmp_path):
+        """Test that editing a file changes the fingerprint."""
+        settings = tmp_path / "settings.csv"
+        settings.write_text("a,b\n1,2\n")
+        before = files_fingerprint([settings])
+
+        settings.write_text("a,b\n1,3\n")
+        stat = os.stat(settings)
+        os.utime(settings, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert files_fingerprint([settings]) != before
+        assert files_fingerprint([tmp_path / "missing.csv"]) != before
@@ -0,0 +1,220 @@
+"""
+Unit tests for wave_visualizer.data_prep.cleaning.row_reduction module.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from wave_visualizer.data_prep.cleaning import row_reduction
+from wave_visualizer.data_prep.cleaning.row_reduction import (
+    FilterIndex, RowReductionHandler, Selection, get_filter_index, clear_filter_index_cache
+)
+from wave_visualizer.utils.frame_signature import invalidate_frame_caches
+
+
+@pytest.fixture
+def survey_data():
+    """Mixed-type frame with missing values, 13 rows (not a multiple of 8)."""
+    return pd.DataFrame({
+        'party': ['Democrat', 'Republican', None, 'Independent', 'Democrat', 'Republican',
+                  'Democrat', None, 'Independent', 'Republican', 'Democrat', 'Democrat', 'Republican'],
+        'wave': [1.0, 2.0, 3.0, np.nan, 1.0, 1.0, 2.0, 3.0, 2.0, np.nan, 1.0, 3.0, 2.0],
+        'cluster': pd.Categorical(['Thriving', 'Struggling', 'Suffering', 'Thriving', 'Struggling',
+                                   'Thriving', None, 'Suffering', 'Thriving', 'Struggling',
+                                   'Thriving', 'Suffering', 'Thriving']),
+        'score': np.arange(13) * 1.5
+    }, index=np.arange(100, 113))
+
+
+@pytest.fixture
+def handler(tmp_path, monkeypatch):
+    """Handler whose settings directory is created under tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    return RowReductionHandler()
+
+
+def _isin_mask(data, filters):
+    mask = pd.Series(True, index=data.index)
+    for filter_item in filters:
+        if filter_item['column'] in data.columns:
+            mask &= data[filter_item['column']].isin(filter_item['values'])
+    return mask.to_numpy()
+
+
+class TestFilterIndex:
+    """Test the packed per-value row bitmaps."""
+
+    @pytest.mark.parametrize('filters', [
+        [{'column': 'party', 'values': ['Democrat', 'Independent']}],
+        [{'column': 'party', 'values': ['Democrat']}, {'column': 'wave', 'values': [1.0, 3]}],
+        [{'column': 'wave', 'values': [np.nan, 2.0]}, {'column': 'cluster', 'values': ['Thriving']}],
+        [{'column': 'party', 'values': [None]}, {'column': 'cluster', 'values': ['Suffering', 'Other']}],
+        [{'column': 'score', 'values': [3.0, 4.5, 99.0]}],
+        [{'column': 'party', 'values': ['Green']}],
+        [],
+    ])
+    def test_matches_isin(self, survey_data, filters):
+        """Test that combined bitmaps select the same rows as chained isin."""
+        index = FilterIndex(survey_data)
+        expected = _isin_mask(survey_data, filters)
+
+        np.testing.assert_array_equal(index.mask(filters), expected)
+        np.testing.assert_array_equal(index.rows(filters), np.flatnonzero(expected))
+        assert index.count(filters) == expected.sum()
+
+    def test_value_counts(self, survey_data):
+        """Test that bitmap counts match value_counts without missing or unused values."""
+        index = FilterIndex(survey_data)
+        
+        for column in ['party', 'wave', 'cluster']:
+            expected = survey_data[column].value_counts()
+            assert index.value_counts(column).to_dict() == expected[expected > 0].to_dict()
+    
+    def test_high_cardinality_column_not_indexed(self, survey_data, monkeypatch):
+        """Test that columns with too many values fall back to isin."""
+        monkeypatch.setattr(row_reduction, 'MAX_INDEXED_VALUES', 5)
+        index = FilterIndex(survey_data, columns=['party', 'score'])
+
+        assert index._columns['party'] is not None
+        assert index._columns['score'] is None
+        assert index.count([{'column': 'score', 'values': [3.0]}]) == 1
+        assert index.value_counts('score') is None
+
+    def test_missing_column_ignored(self, survey_data):
+        """Test that filters on absent columns select every row."""
+        index = FilterIndex(survey_data)
+
+        assert index.count([{'column': 'nope', 'values': [1]}]) == len(survey_data)
+
+    def test_get_filter_index_reused(self, survey_data):
+        """Test that the same frame gets the same index and a copy does not."""
+        clear_filter_index_cache()
+
+        index = get_filter_index(survey_data)
+
+        assert get_filter_index(survey_data) is index
+        assert get_filter_index(survey_data.copy()) is not index
+        assert clear_filter_index_cache() == 2
+
+    def test_replaced_column_reindexed(self, survey_data):
+        """Test that a column assigned since it was indexed is indexed again instead of reused."""
+        index = get_filter_index(survey_data)
+        index.count([{'column': 'party', 'values': ['Democrat']}])
+
+        survey_data['party'] = 'Republican'
+
+        assert index.count([{'column': 'party', 'values': ['Democrat']}]) == 0
+
+    def test_invalidated_frame_reindexed(self, survey_data):
+        """Test that values edited in place are seen after invalidate_frame_caches()."""
+        index = get_filter_index(survey_data)
+        index.count([{'column': 'wave', 'values': [9.0]}])
+
+        survey_data.loc[105, 'wave'] = 9.0
+        invalidate_frame_caches(survey_data)
+
+        assert index.rows([{'column': 'wave', 'values': [9.0]}]).tolist() == [5]
+
+    def test_unchanged_column_not_reindexed(self, survey_data, monkeypatch):
+        """Test that a repeat query reuses the bitmaps without scanning the column."""
+        index = get_filter_index(survey_data)
+        index.count([{'column': 'party', 'values': ['Democrat']}])
+        monkeypatch.setattr(row_reduction.pd, 'factorize', lambda *args, **kwargs: pytest.fail("rescanned"))
+
+        assert index.count([{'column': 'party', 'values': ['Democrat']}]) == 5
+
+    def test_rows_dropped_in_place(self, survey_data):
+        """Test that dropping rows in place resizes the index."""
+        index = get_filter_index(survey_data)
+        index.count([{'column': 'party', 'values': ['Democrat']}])
+
+        survey_data.drop(index=[100, 104], inplace=True)
+
+        np.testing.assert_array_equal(index.mask([{'column': 'party', 'values': ['Democrat']}]),
+                                      (survey_data['party'] == 'Democrat').to_numpy())
+
+
+class TestSelection:
+    """Test lazy row selections."""
+
+    def test_columns_materialized_on_demand(self, survey_data):
+        """Test that columns and frames hold only the selected rows."""
+        selection = Selection(survey_data, np.array([1, 4, 12]))
+
+        assert len(selection) == 3
+        assert 'score' in selection and 'nope' not in selection
+        assert selection['score'].tolist() == [1.5, 6.0, 18.0]
+        assert selection.index.tolist() == [101, 104, 112]
+        assert selection.mask.sum() == 3
+        pd.testing.assert_frame_equal(selection[['party', 'wave']],
+                                      survey_data[['party', 'wave']].iloc[[1, 4, 12]])
+
+    def test_all_rows(self, survey_data):
+        """Test that a selection without rows covers the whole frame."""
+        selection = Selection(survey_data)
+
+        assert len(selection) == len(survey_data)
+        assert selection.column('wave').equals(survey_data['wave'])
+        assert selection.mask.all()
+        assert selection.to_frame() is not survey_data
+
+    def test_select_does_not_copy(self, handler, survey_data):
+        """Test that select() keeps the base frame and only row positions."""
+        settings = {'filters': [{'column': 'cluster', 'values': ['Suffering']}]}
+
+        selection = handler.select(survey_data, settings)
+
+        assert selection.data is survey_data
+        assert selection.rows.tolist() == [2, 7, 11]
+
+
+class TestApplyFilters:
+    """Test RowReductionHandler filtering through the filter index."""
+
+    def test_matches_isin(self, handler, survey_data):
+        """Test that the filtered frame equals boolean indexing with isin."""
+        filters = [{'column': 'party', 'values': ['Democrat', 'Republican']},
+                   {'column': 'cluster', 'values': ['Thriving', 'Struggling']},
+                   {'column': 'nope', 'values': ['x']}]
+
+        result = handler.apply_filters(survey_data, {'filters': filters})
+
+        pd.testing.assert_frame_equal(result, survey_data[_isin_mask(survey_data, filters)])
+
+    def test_columns_subset(self, handler, survey_data):
+        """Test returning only some columns of the kept rows."""
+        settings = {'filters': [{'column': 'party', 'values': ['Independent']}]}
+
+        result = handler.apply_filters(survey_data, settings, columns=['wave', 'score'])
+
+        assert list(result.columns) == ['wave', 'score']
+        assert result.index.tolist() == [103, 108]
+
+    def test_filter_rows(self, handler, survey_data):
+        """Test getting row positions without copying the frame."""
+        settings = {'filters': [{'column': 'wave', 'values': [3.0]}]}
+
+        assert handler.filter_rows(survey_data, settings).tolist() == [2, 7, 11]
+
+    def test_no_filters_returns_copy(self, handler, survey_data):
+        """Test that no filters returns an equal, independent frame."""
+        result = handler.apply_filters(survey_data, {'filters': []})
+
+        pd.testing.assert_frame_equal(result, survey_data)
+        assert result is not survey_data
+
+    def test_all_rows_removed_raises(self, handler, survey_data):
+        """Test that filtering out every row raises ValueError."""
+        with pytest.raises(ValueError, match="removed all data rows"):
+            handler.apply_filters(survey_data, {'filters': [{'column': 'party', 'values': ['Green']}]})
+
+    def test_filters_after_in_place_change(self, handler, survey_data):
+        """Test that filtering a frame again after changing a column sees the new values."""
+        settings = {'filters': [{'column': 'party', 'values': ['Democrat']}]}
+        assert len(handler.apply_filters(survey_data, settings)) == 5
+
+        survey_data['party'] = 'Republican'
+
+        with pytest.raises(ValueError, match="removed all data rows"):
+            handler.apply_filters(survey_data, settings)
@@ -0,0 +1,260 @@
+"""
+Unit tests for wave_visualizer.visualization_techs.transition_matrix module.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from unittest.mock import patch
+
+from wave_visualizer.visualization_techs import transition_matrix
+from wave_visualizer.visualization_techs.transition_matrix import (
+    TransitionMatrix, TrajectoryCounts, get_transition_matrix, get_trajectory_counts,
+    clear_transition_cache
+)
+from wave_visualizer.utils.frame_signature import invalidate_frame_caches
+
+
+@pytest.fixture(autouse=True)
+def empty_transition_cache():
+    """Start and finish every test with an empty matrix cache."""
+    clear_transition_cache()
+    yield
+    clear_transition_cache()
+
+
+class TestTransitionMatrix:
+    """Test TransitionMatrix construction and views."""
+
+    def test_counts_match_crosstab(self, sample_data):
+        """Test that counts equal pd.crosstab over the complete rows."""
+        matrix = TransitionMatrix.from_frame(sample_data, 'W1_HFClust_labeled', 'W2_HFClust_labeled')
+        expected = pd.crosstab(sample_data['W1_HFClust_labeled'], sample_data['W2_HFClust_labeled'])
+
+        pd.testing.assert_frame_equal(matrix.count_frame(), expected,
+                                      check_names=False, check_dtype=False)
+        assert matrix.total == sample_data['W2_HFClust_labeled'].notna().sum()
+
+    def test_categorical_input_matches_text(self, sample_data):
+        """Test that categorical columns with different categories give the same counts."""
+        source = sample_data['W1_HFClust_labeled']
+        target = sample_data['W3_HFClust_labeled']
+        text = TransitionMatrix.from_series(source, target)
+
+        categorical = TransitionMatrix.from_series(
+            source.astype('category'),
+            target.astype(pd.CategoricalDtype(['Suffering', 'Thriving', 'Struggling', 'Unused']))
+        )
+
+        assert categorical.categories == text.categories
+        np.testing.assert_array_equal(categorical.counts, text.counts)
+
+    def test_percentages_and_stability(self):
+        """Test row/column percentages, diagonal and stability."""
+        matrix = TransitionMatrix.from_series(pd.Series(['A', 'A', 'A', 'B']),
+                                              pd.Series(['A', 'B', 'B', 'B']))
+
+        assert matrix.row_percentages().loc['A', 'B'] == pytest.approx(200 / 3)
+        assert matrix.column_percentages().loc['A', 'B'] == pytest.approx(200 / 3)
+        assert matrix.diagonal().to_dict() == {'A': 1, 'B': 1}
+        assert matrix.stability().to_dict() == pytest.approx({'A': 100 / 3, 'B': 100.0})
+        assert matrix.stable_count == 2
+        assert matrix.stability_rate == pytest.approx(50.0)
+
+    def test_empty_rows_have_zero_percentages(self):
+        """Test that a category never seen in the source wave has a zero row."""
+        matrix = TransitionMatrix.from_series(pd.Series(['A', 'A']), pd.Series(['A', 'B']))
+
+        assert matrix.source_categories == ['A']
+        assert matrix.target_categories == ['A', 'B']
+        assert matrix.row_percentages().loc['B'].tolist() == [0.0, 0.0]
+        assert list(matrix.stability().index) == ['A']
+
+    def test_ranked_patterns(self, sample_transition_data):
+        """Test ranking against the counts the patterns were built from."""
+        source = sample_transition_data['source'].repeat(sample_transition_data['count'])
+        target = sample_transition_data['target'].repeat(sample_transition_data['count'])
+
+        ranked = TransitionMatrix.from_series(source, target).ranked_patterns()
+
+        assert ranked['count'].tolist() == [400, 300, 170, 80, 50]
+        assert ranked['percentage'].tolist() == pytest.approx([40.0, 30.0, 17.0, 8.0, 5.0])
+        assert ranked['stable'].tolist() == [True, True, True, False, False]
+        assert len(TransitionMatrix.from_series(source, target).ranked_patterns(top=2)) == 2
+
+    def test_empty_input(self):
+        """Test that no complete rows give an empty matrix."""
+        matrix = TransitionMatrix.from_series(pd.Series([np.nan, 'A']), pd.Series(['A', np.nan]))
+
+        assert matrix.total == 0
+        assert matrix.ranked_patterns().empty
+        assert matrix.stability_rate == 0.0
+
+    def test_invalid_shape_rejected(self):
+        """Test that a non-square count array is rejected."""
+        with pytest.raises(ValueError, match="count matrix"):
+            TransitionMatrix(np.zeros((2, 3)), ['A', 'B'])
+
+
+class TestTrajectoryCounts:
+    """Test path counts through several waves."""
+
+    COLUMNS = ['W1_HFClust_labeled', 'W2_HFClust_labeled', 'W3_HFClust_labeled']
+
+    def test_transitions_match_pairwise_counts(self, sample_data):
+        """Test that every stage pair equals a direct count of respondents seen in all waves."""
+        trajectories = TrajectoryCounts.from_frame(sample_data, self.COLUMNS)
+        complete = sample_data[self.COLUMNS].dropna()
+
+        assert trajectories.total == len(complete)
+        for source_stage, target_stage in [(0, 1), (1, 2), (0, 2)]:
+            expected = TransitionMatrix.from_frame(complete, self.COLUMNS[source_stage],
+                                                   self.COLUMNS[target_stage])
+            matrix = trajectories.transition(source_stage, target_stage)
+            assert matrix.categories == expected.categories
+            np.testing.assert_array_equal(matrix.counts, expected.counts)
+        np.testing.assert_array_equal(trajectories.stage_counts(1),
+                                      complete[self.COLUMNS[1]].value_counts().sort_index().to_numpy())
+
+    def test_ranked_paths_match_groupby(self, sample_data):
+        """Test that ranked paths equal grouping the rows by every wave."""
+        trajectories = TrajectoryCounts.from_frame(sample_data, self.COLUMNS)
+        expected = sample_data.groupby(self.COLUMNS).size().sort_values(ascending=False, kind='stable')
+
+        ranked = trajectories.ranked_paths()
+
+        assert len(ranked) == len(expected)
+        assert ranked['count'].tolist() == expected.tolist()
+        assert ranked['percentage'].sum() == pytest.approx(100)
+        assert trajectories.ranked_paths(top=3)[self.COLUMNS].equals(ranked[self.COLUMNS].head(3))
+
+    def test_wide_paths_fall_back_to_code_rows(self):
+        """Test that paths too wide for one int64 give the same counts."""
+        rng = np.random.default_rng(0)
+        data = pd.DataFrame({f'W{i}': rng.integers(0, 100, 300) for i in range(1, 11)})
+        columns = list(data.columns)
+
+        trajectories = TrajectoryCounts.from_frame(data, columns)
+
+        assert trajectories._paths.ndim == 2
+        np.testing.assert_array_equal(trajectories.transition(3, 4).counts,
+                                      TransitionMatrix.from_frame(data, 'W4', 'W5').counts)
+
+    def test_filtered_counts(self, sample_data):
+        """Test counting paths of one filter value."""
+        trajectories = get_trajectory_counts(sample_data, self.COLUMNS, 'W1_PID1_labeled', 'Democrat')
+        subset = sample_data[sample_data['W1_PID1_labeled'] == 'Democrat']
+
+        assert trajectories.total == len(subset[self.COLUMNS].dropna())
+
+    def test_single_stage_rejected(self, sample_data):
+        """Test that a trajectory needs two or more waves."""
+        with pytest.raises(ValueError, match="at least two stages"):
+            TrajectoryCounts.from_frame(sample_data, self.COLUMNS[:1])
+
+
+class TestGetTransitionMatrix:
+    """Test memoization of transition matrices."""
+
+    def test_repeat_request_reuses_matrix(self, sample_data):
+        """Test that the same data, columns and filter are counted once."""
+        args = (sample_data, 'W1_HFClust_labeled', 'W3_HFClust_labeled', 'W1_PID1_labeled', 'Democrat')
+        with patch.object(transition_matrix.TransitionMatrix, 'from_frame',
+                          wraps=TransitionMatrix.from_frame) as mock_build:
+            first = get_transition_matrix(*args)
+            second = get_transition_matrix(*args)
+
+        assert first is second
+        assert mock_build.call_count == 1
+        assert first.total == (sample_data['W1_PID1_labeled'] == 'Democrat').sum()
+
+    def test_different_filter_or_data_not_shared(self, sample_data):
+        """Test that a different filter or DataFrame gives a separate matrix."""
+        unfiltered = get_transition_matrix(sample_data, 'W1_HFClust_labeled', 'W2_HFClust_labeled')
+        filtered = get_transition_matrix(sample_data, 'W1_HFClust_labeled', 'W2_HFClust_labeled',
+                                         'W1_PID1_labeled', 'Republican')
+        other = get_transition_matrix(sample_data.copy(), 'W1_HFClust_labeled', 'W2_HFClust_labeled')
+
+        assert filtered is not unfiltered
+        assert other is not unfiltered
+        assert filtered.total < unfiltered.total
+
+    def test_modified_columns_recounted(self, sample_data):
+        """Test that changing a counted or filter column in place gives a fresh count."""
+        args = ('W1_HFClust_labeled', 'W2_HFClust_labeled', 'W1_PID1_labeled', 'Democrat')
+        first = get_transition_matrix(sample_data, *args)
+        democrat = sample_data['W1_PID1_labeled'] == 'Democrat'
+
+        sample_data['W2_HFClust_labeled'] = 'Thriving'
+        recounted = get_transition_matrix(sample_data, *args)
+        sample_data['W1_PID1_labeled'] = 'Democrat'
+        refiltered = get_transition_matrix(sample_data, *args)
+
+        assert recounted is not first
+        assert recounted.total == sample_data.loc[democrat, 'W1_HFClust_labeled'].notna().sum()
+        assert recounted.column_totals[recounted.categories.index('Thriving')] == recounted.total
+        assert refiltered.total == sample_data['W1_HFClust_labeled'].notna().sum()
+
+    def test_invalidated_frame_recounted(self, sample_data):
+        """Test that values edited in place are counted after invalidate_frame_caches()."""
+        first = get_transition_matrix(sample_data, 'W1_HFClust_labeled', 'W2_HFClust_labeled')
+        sample_data.loc[sample_data['W2_HFClust_labeled'].notna(), 'W2_HFClust_labeled'] = 'Thriving'
+        invalidate_frame_caches(sample_data)
+        recounted = get_transition_matrix(sample_data, 'W1_HFClust_labeled', 'W2_HFClust_labeled')
+
+        assert recounted is not first
+        assert recounted.column_totals[recounted.categories.index('Thriving')] == recounted.total
+
+    def test_clear_cache(self, sample_data):
+        """Test that clearing the cache forces a new count."""
+        first = get_transition_matrix(sample_data, 'W1_HFClust_labeled', 'W2_HFClust_labeled')
+
+        assert clear_transition_cache() == 1
+        assert get_transition_matrix(sample_data, 'W1_HFClust_labeled', 'W2_HFClust_labeled') is not first
+
+
+class TestLoadTransitionMatrix:
+    """Test the on-disk result cache for matrices of the processed data file."""
+
+    ARGS = ('W1_HFClust_labeled', 'W3_HFClust_labeled', 'W1_PID1_labeled', 'Democrat')
+
+    def test_repeat_run_skips_data(self, mock_processed_data_file, isolated_result_cache):
+        """Test that a second run reads the stored matrix without loading data."""
+        first = transition_matrix.load_transition_matrix(*self.ARGS, data_path=mock_processed_data_file)
+        clear_transition_cache()
+
+        with patch.object(transition_matrix, 'load_processed_data') as mock_load:
+            second = transition_matrix.load_transition_matrix(*self.ARGS, data_path=mock_processed_data_file)
+
+        mock_load.assert_not_called()
+        assert len(list(isolated_result_cache.glob('*.json'))) == 1
+        assert second.categories == first.categories
+        np.testing.assert_array_equal(second.counts, first.counts)
+
+    def test_changed_data_recomputed(self, mock_processed_data_file, sample_data, isolated_result_cache):
+        """Test that rewriting the processed data file changes the key."""
+        key = transition_matrix.transition_cache_key(*self.ARGS, data_path=mock_processed_data_file)
+
+        sample_data.head(100).to_csv(mock_processed_data_file, index=False)
+
+        assert transition_matrix.transition_cache_key(*self.ARGS, data_path=mock_processed_data_file) != key
+        matrix = transition_matrix.load_transition_matrix(*self.ARGS, data_path=mock_processed_data_file)
+        assert matrix.total == (sample_data.head(100)['W1_PID1_labeled'] == 'Democrat').sum()
+
+    def test_disabled_cache(self, mock_processed_data_file, isolated_result_cache, monkeypatch):
+        """Test that an empty cache directory setting disables the cache."""
+        monkeypatch.setenv('WAVE_VISUALIZER_CACHE_DIR', '')
+
+        transition_matrix.load_transition_matrix(*self.ARGS, data_path=mock_processed_data_file)
+
+        assert transition_matrix.transition_cache_key(*self.ARGS, data_path=mock_processed_data_file) is None
+        assert not isolated_result_cache.exists()
+
+    def test_dict_round_trip(self):
+        """Test saving and rebuilding a matrix with numeric categories."""
+        matrix = TransitionMatrix(np.array([[1, 2], [3, 4]]), np.array([1.0, 2.0]))
+
+        rebuilt = TransitionMatrix.from_dict(matrix.to_dict())
+
+        assert rebuilt.categories == [1.0, 2.0]
+        np.testing.assert_array_equal(rebuilt.counts, matrix.counts)
@@ -0,0 +1,56 @@
+"""
+Unit tests for wave_visualizer.visualization_techs.transition_pattern_analysis module.
+"""
+
+import pytest
+import pandas as pd
+import plotly.graph_objects as go
+
+from wave_visualizer.visualization_techs.transition_matrix import TransitionMatrix
+from wave_visualizer.visualization_techs.transition_pattern_analysis import (
+    _pattern_table, create_pattern_analysis_visualization
+)
+
+
+class TestPatternTable:
+    """Test formatting of ranked transition patterns."""
+
+    def test_counts_match_per_row_patterns(self, sample_data):
+        """Test that grouped counts equal counting one pattern string per row."""
+        pairs = sample_data[['W1_HFClust_labeled', 'W2_HFClust_labeled']].dropna()
+        expected = pd.Series(
+            [f"{s} -> {t}" for s, t in zip(pairs.iloc[:, 0], pairs.iloc[:, 1])]
+        ).value_counts().to_dict()
+
+        table = _pattern_table(TransitionMatrix.from_frame(pairs, *pairs.columns))
+
+        assert dict(zip(table['Pattern'], table['Count'])) == expected
+        assert table['Count'].is_monotonic_decreasing
+        assert table['Percentage'].sum() == pytest.approx(100.0)
+
+    def test_stable_and_changed_types(self):
+        """Test that only same-category pairs are classified as stable."""
+        matrix = TransitionMatrix.from_series(pd.Series(['A', 'A', 'B', 'C']),
+                                              pd.Series(['A', 'B', 'B', 'A']))
+
+        table = _pattern_table(matrix)
+        types = dict(zip(table['Pattern'], table['Type']))
+
+        assert types == {'A -> A': 'Stable', 'A -> B': 'Changed',
+                         'B -> B': 'Stable', 'C -> A': 'Changed'}
+
+
+class TestCreatePatternAnalysisVisualization:
+    """Test the pattern analysis entry point."""
+
+    def test_statistics(self, sample_data):
+        """Test that statistics add up over all transitions."""
+        fig, stats = create_pattern_analysis_visualization(
+            data=sample_data, wave_config='w1_to_w2', show_plot=False
+        )
+
+        assert isinstance(fig, go.Figure)
+        assert stats['total_transitions'] == sample_data['W2_HFClust_labeled'].notna().sum()
+        assert stats['stable_count'] + stats['changed_count'] == stats['total_transitions']
+        assert stats['unique_patterns'] == 9
+        assert len(stats['top_5_patterns']) == 5
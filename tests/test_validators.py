@@ -8,8 +8,10 @@ import numpy as np
 from wave_visualizer.validators import (
     DataValidator, ParameterValidator, WaveConfigValidator,
     FilePathValidator, FilterValidator, validate_visualization_inputs,
-    sanitize_filename
+    sanitize_filename, column_value_counts, clear_validation_cache
 )
+from wave_visualizer.data_prep.cleaning.row_reduction import get_filter_index
+from wave_visualizer.utils.frame_signature import invalidate_frame_caches
 from wave_visualizer.exceptions import (
     DataValidationError, ColumnNotFoundError, WaveConfigurationError,
     SettingsError, FilteringError
@@ -186,6 +188,12 @@ class TestWaveConfigValidator:
         assert source == "all"
         assert target == "all"
     
+    def test_validate_wave_config_format_chain(self):
+        """Test that multi-stage chains span their first and last wave."""
+        source, target = WaveConfigValidator.validate_wave_config_format("w1_to_w2_to_w3")
+        assert source == "w1"
+        assert target == "w3"
+    
     def test_validate_wave_config_format_invalid(self):
         """Test wave config validation with invalid format."""
         with pytest.raises(WaveConfigurationError):
@@ -222,6 +230,65 @@ class TestFilterValidator:
             )
 
 
+class TestSinglePassValidation:
+    """Test memoized column summaries and the validated row selection."""
+    
+    def test_column_value_counts_memoized(self, sample_data):
+        """Test that counts match value_counts and are computed once per frame."""
+        clear_validation_cache()
+        
+        counts = column_value_counts(sample_data, 'W1_HFClust_labeled')
+        
+        assert counts.to_dict() == sample_data['W1_HFClust_labeled'].value_counts().to_dict()
+        assert counts.index.tolist() == sample_data['W1_HFClust_labeled'].unique().tolist()
+        assert column_value_counts(sample_data, 'W1_HFClust_labeled') is counts
+        assert column_value_counts(sample_data.copy(), 'W1_HFClust_labeled') is not counts
+        assert clear_validation_cache() == 2
+    
+    def test_column_value_counts_after_change(self, sample_data):
+        """Test that a column assigned since it was counted is counted again."""
+        column_value_counts(sample_data, 'W1_HFClust_labeled')
+        
+        sample_data['W1_HFClust_labeled'] = 'Thriving'
+        
+        assert column_value_counts(sample_data, 'W1_HFClust_labeled').to_dict() == {'Thriving': 1000}
+    
+    def test_column_value_counts_after_invalidation(self, sample_data):
+        """Test that values edited in place are counted after invalidate_frame_caches()."""
+        column_value_counts(sample_data, 'W1_HFClust_labeled')
+        
+        sample_data.loc[:, 'W1_HFClust_labeled'] = 'Thriving'
+        invalidate_frame_caches(sample_data)
+        
+        assert column_value_counts(sample_data, 'W1_HFClust_labeled').to_dict() == {'Thriving': 1000}
+    
+    def test_missing_values_not_counted(self):
+        """Test that missing values are not a category."""
+        df = pd.DataFrame({'col': ['a', None, 'b', 'a', np.nan]})
+        
+        assert column_value_counts(df, 'col').to_dict() == {'a': 2, 'b': 1}
+    
+    def test_validation_selects_filtered_rows(self, sample_data):
+        """Test that validation returns the categories and rows of the filter."""
+        result = validate_visualization_inputs(
+            sample_data, 'HFClust_labeled', 'w1_to_w2', 'W1_PID1_labeled', 'Republican'
+        )
+        
+        expected = (sample_data['W1_PID1_labeled'] == 'Republican').to_numpy()
+        assert result.columns == ['W1_HFClust_labeled', 'W2_HFClust_labeled']
+        assert sorted(result.categories['W2_HFClust_labeled']) == ['Struggling', 'Suffering', 'Thriving']
+        np.testing.assert_array_equal(result.mask, expected)
+        assert len(result.selection) == expected.sum()
+        # The filter column was counted through the frame's filter index
+        assert 'W1_PID1_labeled' in get_filter_index(sample_data)._columns
+    
+    def test_validation_without_filter_selects_all(self, sample_data):
+        """Test that an unfiltered validation selects every row."""
+        result = validate_visualization_inputs(sample_data, 'HFClust_labeled', 'w1_to_w2')
+        
+        assert len(result.selection) == len(sample_data)
+
+
 class TestConvenienceFunctions:
     """Test convenience validation functions."""
     
@@ -0,0 +1,98 @@
+"""
+Unit tests for wave_visualizer.data_prep.cleaning.value_merging_handler module.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from wave_visualizer.data_prep.cleaning.value_merging_handler import ValueMergingHandler
+
+
+@pytest.fixture
+def handler(tmp_path):
+    """Handler with rules for a labeled party column and a coded column."""
+    handler = ValueMergingHandler(output_dir=str(tmp_path))
+    handler.merging_rules = {
+        'PID1': {'Partisan': ['Democrat', 'Republican'], 'Other': ['Something else']},
+        'Q1': {'Agree': [1.0, 2.0]}
+    }
+    return handler
+
+
+class TestApplyMergingRules:
+    """Test compiled, vectorized merging."""
+
+    def test_values_merged(self, handler):
+        """Test that sources become targets and other values are kept."""
+        data = pd.Series(['Democrat', 'Independent', None, 'Something else', 'Republican'], name='PID1')
+
+        result = handler.apply_merging_rules(data, 'PID1')
+
+        assert result.tolist() == ['Partisan', 'Independent', None, 'Other', 'Partisan']
+        assert result.name == 'PID1'
+
+    def test_rules_applied_in_order(self, handler):
+        """Test that a value merged into a later source keeps moving, as before."""
+        handler.merging_rules['chain'] = {'B': ['A'], 'C': ['B']}
+
+        result = handler.apply_merging_rules(pd.Series(['A', 'B', 'D']), 'chain')
+
+        assert result.tolist() == ['C', 'C', 'D']
+
+    def test_dtype_follows_targets(self, handler):
+        """Test that text targets upcast numeric columns even without matches."""
+        matched = handler.apply_merging_rules(pd.Series([1.0, 3.0, np.nan]), 'Q1')
+        unmatched = handler.apply_merging_rules(pd.Series([3.0, 4.0]), 'Q1')
+
+        assert matched.tolist()[:2] == ['Agree', 3.0]
+        assert unmatched.dtype == object
+        assert handler.apply_merging_rules(pd.Series([1.0]), 'unknown').dtype == float
+
+    def test_categorical_recoded(self, handler):
+        """Test that categorical columns are merged through their categories."""
+        data = pd.Series(pd.Categorical(['Democrat', 'Independent', 'Republican', None]))
+
+        result = handler.apply_merging_rules(data, 'PID1')
+
+        assert list(result.cat.categories) == ['Partisan', 'Independent']
+        assert result.astype(object).where(result.notna(), None).tolist() == \
+            ['Partisan', 'Independent', 'Partisan', None]
+
+    def test_edited_rules_recompiled(self, handler):
+        """Test that rules changed in place are picked up."""
+        data = pd.Series(['Democrat'])
+        handler.apply_merging_rules(data, 'PID1')
+
+        handler.merging_rules['PID1']['Partisan'].remove('Democrat')
+
+        assert handler.apply_merging_rules(data, 'PID1').tolist() == ['Democrat']
+
+
+class TestApplyAll:
+    """Test merging every ruled column in one call."""
+
+    def test_all_ruled_columns(self, handler):
+        """Test that only ruled columns change and the input is untouched."""
+        data = pd.DataFrame({'PID1': ['Democrat', 'Independent'], 'Q1': [2.0, 5.0], 'age': [30, 40]})
+
+        result = handler.apply_all(data)
+
+        assert result['PID1'].tolist() == ['Partisan', 'Independent']
+        assert result['Q1'].tolist() == ['Agree', 5.0]
+        assert result['age'].tolist() == [30, 40]
+        assert data['PID1'].tolist() == ['Democrat', 'Independent']
+
+
+class TestPreferencesRoundTrip:
+    """Test saving and loading merging rules."""
+
+    def test_save_and_load(self, handler, tmp_path):
+        """Test that rules survive a CSV round trip."""
+        handler.merging_rules = {'PID1': handler.merging_rules['PID1']}
+        assert handler.save_preferences_to_csv()
+
+        loaded = ValueMergingHandler(output_dir=str(tmp_path))
+        assert loaded.load_preferences_from_csv()
+
+        assert loaded.merging_rules == handler.merging_rules
@@ -0,0 +1,102 @@
+"""
+Unit tests for wave_visualizer.data_prep.cleaning.value_missing_and_dropping_handler module.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from wave_visualizer.data_prep.cleaning import value_missing_and_dropping_handler
+from wave_visualizer.data_prep.cleaning.value_missing_and_dropping_handler import ValueMissingAndDroppingHandler
+from wave_visualizer.data_prep.column_profiles import get_column_profiles, clear_column_profile_cache
+
+
+@pytest.fixture(autouse=True)
+def empty_profile_cache():
+    """Start and finish every test with no memoized column profiles."""
+    clear_column_profile_cache()
+    yield
+    clear_column_profile_cache()
+
+
+@pytest.fixture
+def handler(tmp_path):
+    """Handler whose settings directory is under tmp_path."""
+    return ValueMissingAndDroppingHandler(output_dir=str(tmp_path))
+
+
+@pytest.fixture
+def mixed_data():
+    """Mixed-type frame with missing values; 'late' gains a new value in its last row."""
+    rng = np.random.default_rng(0)
+    n_rows = 3000
+    late = np.full(n_rows, np.nan)
+    late[10] = 1.0
+    late[-1] = 42.0
+    return pd.DataFrame({
+        'wave': rng.choice([1.0, 2.0, np.nan], n_rows),
+        'party': rng.choice(['Democrat', 'Republican', None], n_rows),
+        'cluster': pd.Categorical(rng.choice(['a', 'b'], n_rows), categories=['b', 'a', 'unused']),
+        'id': np.arange(n_rows),
+        'date': pd.date_range('2020-01-01', periods=n_rows, freq='h'),
+        'empty': [None] * n_rows,
+        'flag': rng.choice([True, False], n_rows),
+        'late': late,
+    })
+
+
+def _per_column_analysis(dataframe):
+    """The column-by-column analysis the handler used to run."""
+    missing_info = []
+    for column in dataframe.columns:
+        missing_count = dataframe[column].isna().sum()
+        total_count = len(dataframe)
+        missing_info.append({
+            'column': column,
+            'missing_count': missing_count,
+            'total_count': total_count,
+            'missing_percentage': (missing_count / total_count) * 100,
+            'unique_values': dataframe[column].dropna().nunique(),
+            'sample_values': str(dataframe[column].dropna().unique()[:5].tolist())
+        })
+    return pd.DataFrame(missing_info)
+
+
+class TestAnalyzeMissingValues:
+    """Test the whole-frame missing value summary."""
+
+    def test_matches_per_column_analysis(self, handler, mixed_data, monkeypatch):
+        """Test that the summary equals the per-column scans, including values past the head."""
+        monkeypatch.setattr(value_missing_and_dropping_handler, 'SAMPLE_HEAD_ROWS', 16)
+
+        result = handler.analyze_missing_values(mixed_data)
+
+        pd.testing.assert_frame_equal(result, _per_column_analysis(mixed_data))
+        assert result.set_index('column').loc['late', 'sample_values'] == '[1.0, 42.0]'
+
+    def test_not_affected_by_column_profiles(self, handler, mixed_data):
+        """Test that a frame profiled before it was changed is summarized as it is now."""
+        get_column_profiles(mixed_data)
+        mixed_data['party'] = np.arange(len(mixed_data))
+
+        result = handler.analyze_missing_values(mixed_data)
+
+        pd.testing.assert_frame_equal(result, _per_column_analysis(mixed_data))
+
+    def test_sampled_mode_keeps_exact_counts(self, handler, mixed_data):
+        """Test that sampling rows only affects sample values."""
+        exact = handler.analyze_missing_values(mixed_data)
+
+        sampled = handler.analyze_missing_values(mixed_data, sample_rows=200)
+
+        pd.testing.assert_frame_equal(sampled.drop(columns='sample_values'),
+                                      exact.drop(columns='sample_values'))
+        assert sampled.set_index('column').loc['party', 'sample_values'] in (
+            "['Democrat', 'Republican']", "['Republican', 'Democrat']")
+        assert sampled.set_index('column').loc['empty', 'sample_values'] == '[]'
+
+    def test_empty_frames(self, handler, mixed_data):
+        """Test frames without rows or without columns."""
+        pd.testing.assert_frame_equal(handler.analyze_missing_values(mixed_data.iloc[:0]),
+                                      _per_column_analysis(mixed_data.iloc[:0]))
+        assert handler.analyze_missing_values(pd.DataFrame()).empty
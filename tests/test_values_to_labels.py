@@ -0,0 +1,130 @@
+"""
+Unit tests for wave_visualizer.data_prep.cleaning.values_to_labels module.
+"""
+
+import os
+
+import pytest
+import numpy as np
+import pandas as pd
+from unittest.mock import patch
+
+from wave_visualizer.data_prep.cleaning import values_to_labels
+from wave_visualizer.data_prep.cleaning.values_to_labels import ValuesToLabelsConverter
+
+
+@pytest.fixture
+def converter(tmp_path):
+    """Converter backed by small metadata CSV files."""
+    pd.DataFrame({
+        'variable_name': ['PID1', 'HFClust'],
+        'variable_label': ['Party ID', 'Flourishing cluster']
+    }).to_csv(tmp_path / "variable_labels.csv", index=False)
+    pd.DataFrame({
+        'variable_name': ['PID1', 'PID1', 'PID1', 'HFClust', 'HFClust'],
+        'value': [1, 2, 3, 1, 2],
+        'value_label': ['Democrat', 'Republican', 'Democrat', 'Thriving', 'Struggling']
+    }).to_csv(tmp_path / "value_labels.csv", index=False)
+    return ValuesToLabelsConverter(str(tmp_path))
+
+
+class TestLoadMetadata:
+    """Test indexed, cached loading of metadata CSV files."""
+
+    def test_value_labels_indexed_by_variable(self, converter):
+        """Test the nested {variable: {value: label}} index."""
+        assert converter.value_labels == {
+            'PID1': {1: 'Democrat', 2: 'Republican', 3: 'Democrat'},
+            'HFClust': {1: 'Thriving', 2: 'Struggling'}
+        }
+        assert converter.variable_labels['HFClust'] == 'Flourishing cluster'
+
+    def test_repeat_construction_is_cached(self, converter, tmp_path):
+        """Test that unchanged metadata files are parsed only once."""
+        with patch.object(values_to_labels.pd, 'read_csv', wraps=pd.read_csv) as mock_read:
+            second = ValuesToLabelsConverter(str(tmp_path))
+
+        mock_read.assert_not_called()
+        assert second.value_labels == converter.value_labels
+
+    def test_edits_not_shared_between_converters(self, converter, tmp_path):
+        """Test that changing one converter's labels leaves the cache and other converters intact."""
+        converter.value_labels['PID1'][1] = 'Changed'
+        converter.variable_labels['PID1'] = 'Changed'
+
+        second = ValuesToLabelsConverter(str(tmp_path))
+
+        assert second.value_labels['PID1'][1] == 'Democrat'
+        assert second.variable_labels['PID1'] == 'Party ID'
+
+    def test_modified_file_is_reloaded(self, converter, tmp_path):
+        """Test that rewriting value_labels.csv is picked up."""
+        value_file = tmp_path / "value_labels.csv"
+        pd.DataFrame({
+            'variable_name': ['PID1'], 'value': [1], 'value_label': ['Dem']
+        }).to_csv(value_file, index=False)
+        stat = os.stat(value_file)
+        os.utime(value_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert ValuesToLabelsConverter(str(tmp_path)).value_labels == {'PID1': {1: 'Dem'}}
+
+
+class TestConvertColumn:
+    """Test code-to-label conversion of a single column."""
+
+    def test_codes_mapped_to_labels(self, converter):
+        """Test that codes become labels and missing values stay missing."""
+        result = converter.convert_column(pd.Series([1.0, 2.0, 3.0, np.nan]), 'PID1', verbose=False)
+
+        assert result.iloc[:3].tolist() == ['Democrat', 'Republican', 'Democrat']
+        assert pd.isna(result.iloc[3])
+
+    def test_missing_strategies(self, converter):
+        """Test handling of codes without a label."""
+        data = pd.Series([1.0, 9.0])
+
+        kept = converter.convert_column(data, 'PID1', verbose=False)
+        marked = converter.convert_column(data, 'PID1', missing_strategy="mark_missing", verbose=False)
+
+        assert kept.tolist() == ['Democrat', 9.0]
+        assert marked.tolist() == ['Democrat', 'Unknown']
+
+    def test_as_categorical(self, converter):
+        """Test that categorical output uses the distinct labels as categories."""
+        data = pd.Series([3.0, 1.0, 2.0, np.nan, 9.0])
+
+        result = converter.convert_column(data, 'PID1', as_categorical=True, verbose=False)
+
+        assert isinstance(result.dtype, pd.CategoricalDtype)
+        assert list(result.cat.categories[:2]) == ['Democrat', 'Republican']
+        assert result.astype(object).where(result.notna(), None).tolist() == \
+            ['Democrat', 'Democrat', 'Republican', None, 9.0]
+
+    def test_keep_original(self, converter):
+        """Test returning both original and labeled columns."""
+        result = converter.convert_column(pd.Series([2.0]), 'PID1', keep_original=True, verbose=False)
+
+        assert list(result.columns) == ['PID1_original', 'PID1_labeled']
+        assert result['PID1_labeled'].tolist() == ['Republican']
+
+    def test_verbose_summary(self, converter, capsys):
+        """Test that the summary is printed only in verbose mode."""
+        converter.convert_column(pd.Series([1.0]), 'PID1', verbose=False)
+        assert capsys.readouterr().out == ""
+
+        converter.convert_column(pd.Series([1.0]), 'PID1')
+        assert "Successfully converted: 1" in capsys.readouterr().out
+
+
+class TestConvertDataframe:
+    """Test converting every labeled column in one call."""
+
+    def test_all_labeled_columns(self, converter):
+        """Test that only columns with value labels are converted."""
+        data = pd.DataFrame({'PID1': [1.0, 2.0], 'HFClust': [2.0, 1.0], 'age': [30, 40]})
+
+        result = converter.convert_dataframe(data, as_categorical=True)
+
+        assert list(result.columns) == ['PID1_labeled', 'HFClust_labeled']
+        assert result['HFClust_labeled'].astype(str).tolist() == ['Struggling', 'Thriving']
+        assert result.index.equals(data.index)
@@ -0,0 +1,43 @@
+"""
+Unit tests for wave_visualizer.data_prep.wave_parser module.
+"""
+
+import pytest
+import pandas as pd
+
+from wave_visualizer.data_prep.wave_parser import WaveConfigParser
+
+
+@pytest.fixture
+def parser(tmp_path):
+    """Parser with four defined waves."""
+    pd.DataFrame({
+        'wave_name': ['Wave1', 'Wave2', 'Wave3', 'Wave4'],
+        'column_prefix': ['W1_', 'W2_', 'W3_', 'W4_'],
+    }).to_csv(tmp_path / 'wave_definitions.csv', index=False)
+    return WaveConfigParser(settings_dir=str(tmp_path))
+
+
+class TestParseWaveSequence:
+    """Test parsing every wave of a configuration."""
+
+    def test_all_waves(self, parser):
+        """Test that all_waves passes through every defined wave in order."""
+        assert parser.parse_wave_sequence('all_waves') == ['W1_', 'W2_', 'W3_', 'W4_']
+        assert parser.parse_wave_config('all_waves') == ('W1_', 'W4_')
+
+    def test_pair_and_chain(self, parser):
+        """Test that pairs keep two waves and chains keep every listed wave."""
+        assert parser.parse_wave_sequence('w2_to_w4') == ['W2_', 'W4_']
+        assert parser.parse_wave_sequence('W4_to_W1_to_W3') == ['W4_', 'W1_', 'W3_']
+        assert parser.parse_wave_config('w1_to_w2_to_w4') == ('W1_', 'W4_')
+
+    @pytest.mark.parametrize('wave_config, message', [
+        ('w1_to_w2_to_w1', 'only once'),
+        ('w1_to_w2_to_w9', 'Wave 9 not found'),
+        ('w1_to', 'Invalid wave configuration'),
+    ])
+    def test_invalid_chains_rejected(self, parser, wave_config, message):
+        """Test that repeated, undefined or malformed waves raise ValueError."""
+        with pytest.raises(ValueError, match=message):
+            parser.parse_wave_sequence(wave_config)
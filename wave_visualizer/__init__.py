@@ -40,32 +40,73 @@ License: MIT
 __version__ = "0.1.0"
 __author__ = "michaelnapoli404"
 
-# Import main components
-from .data_prep.customization import VisualizationCustomizer
-
-# Import data cleaning modules
-from .data_prep.cleaning.metadata_handler import MetadataHandler
-from .data_prep.cleaning.values_to_labels import ValuesToLabelsConverter
-from .data_prep.cleaning.value_missing_and_dropping_handler import ValueMissingAndDroppingHandler
-from .data_prep.cleaning.value_merging_handler import ValueMergingHandler
-from .data_prep.cleaning.row_reduction import RowReductionHandler
-
-from .data_prep.cleaning.cleaning import DataCleaningPipeline
-from .data_prep.color_mapping import ColorMappingHandler
-from .data_prep.export_handler import export_figure, create_exports_folder
+import importlib
+from typing import Any, List
+
+# Logging is stdlib-only, so it is imported eagerly
 from .utils.logger import configure_package_logging, get_logger
-from .validators import validate_visualization_inputs
 
-# Import visualization components  
-from .visualization_techs import (
-    create_alluvial_visualization,
-    create_heatmap_visualization,
-    create_pattern_analysis_visualization,
-    AlluvialVisualizationBuilder
-)
+# Everything else is imported on first attribute access (PEP 562), so a script
+# that only cleans data never imports plotly or Kaleido, and
+# `import wave_visualizer` itself does not import pandas.
+_LAZY_ATTRIBUTES = {
+    # Configuration
+    'VisualizationCustomizer': '.data_prep.customization',
+    'ColorMappingHandler': '.data_prep.color_mapping',
+    
+    # Data cleaning
+    'MetadataHandler': '.data_prep.cleaning.metadata_handler',
+    'ValuesToLabelsConverter': '.data_prep.cleaning.values_to_labels',
+    'ValueMissingAndDroppingHandler': '.data_prep.cleaning.value_missing_and_dropping_handler',
+    'ValueMergingHandler': '.data_prep.cleaning.value_merging_handler',
+    'RowReductionHandler': '.data_prep.cleaning.row_reduction',
+    'DataCleaningPipeline': '.data_prep.cleaning.cleaning',
+    
+    # Visualization
+    'create_alluvial_visualization': '.visualization_techs.alluvial_plots',
+    'create_heatmap_visualization': '.visualization_techs.heatmaps',
+    'create_pattern_analysis_visualization': '.visualization_techs.transition_pattern_analysis',
+    'create_visualizations_by_group': '.visualization_techs.grouped_visualizations',
+    'AlluvialVisualizationBuilder': '.visualization_techs.alluvial_builder',
+    'TransitionMatrix': '.visualization_techs.transition_matrix',
+    'get_transition_matrix': '.visualization_techs.transition_matrix',
+    'clear_transition_cache': '.visualization_techs.transition_matrix',
+    
+    # Export
+    'export_figure': '.data_prep.export_handler',
+    'export_figures': '.data_prep.export_handler',
+    'export_report': '.data_prep.export_handler',
+    'create_exports_folder': '.data_prep.export_handler',
+    'ExportHandler': '.data_prep.export_handler',
+    
+    # Data loading
+    'load_processed_data': '.data_prep.data_loader',
+    'invalidate_data_cache': '.data_prep.data_loader',
+    'invalidate_frame_caches': '.utils.frame_signature',
+    'refresh_processed_data': '.data_prep.data_loader',
+    'get_processed_columns': '.data_prep.data_loader',
+    'ColumnProfileCatalog': '.data_prep.column_profiles',
+    'get_column_profiles': '.data_prep.column_profiles',
+    
+    # Validation
+    'validate_visualization_inputs': '.validators',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Later lookups find the name directly and skip this hook
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
-# Import and expose export functions  
-from .data_prep.export_handler import export_figure
 
 # Expose main functions at package level
 __all__ = [
@@ -81,12 +122,27 @@ __all__ = [
     
     # Visualization Components
     'AlluvialVisualizationBuilder',
+    'TransitionMatrix',
+    'get_transition_matrix',
+    'clear_transition_cache',
     
     # Main Functions
     'create_alluvial_visualization',
     'create_heatmap_visualization', 
     'create_pattern_analysis_visualization',
+    'create_visualizations_by_group',
     'export_figure',
+    'export_figures',
+    'export_report',
+    
+    # Data Loading
+    'load_processed_data',
+    'invalidate_data_cache',
+    'invalidate_frame_caches',
+    'refresh_processed_data',
+    'get_processed_columns',
+    'ColumnProfileCatalog',
+    'get_column_profiles',
     
     # Utilities
     'logger',
@@ -111,6 +167,8 @@ def add_color_mapping(variable_name: str, value_name: str, color_hex: str, descr
         wave_visualizer.add_color_mapping('PID1_labeled', 'Republican', '#d62728', 'Traditional red for Republicans')
         wave_visualizer.add_color_mapping('PID1_labeled', 'Democrat', '#1f77b4', 'Traditional blue for Democrats')
     """
+    from .data_prep.color_mapping import ColorMappingHandler
+    
     handler = ColorMappingHandler()
     success = handler.add_color_mapping(variable_name, value_name, color_hex, description)
     if success:
@@ -129,6 +187,8 @@ def list_color_mappings(variable_name: str = None):
     Returns:
         Dict of color mappings
     """
+    from .data_prep.color_mapping import ColorMappingHandler
+    
     handler = ColorMappingHandler()
     
     if variable_name:
@@ -10,27 +10,158 @@ This is the entry point for the entire data cleaning pipeline.
 
 import pandas as pd
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 import warnings
 
 warnings.filterwarnings('ignore')
 
+# Handlers used by _transform_column_in_worker inside process pool workers
+_worker_handlers = None
+
+
+def _values_changed(original: pd.Series, transformed: pd.Series) -> bool:
+    """
+    Check whether a transformation changed a column.
+
+    Two categoricals are compared by value, so recoding a category no row
+    uses does not count as a change.
+    """
+    if isinstance(original.dtype, pd.CategoricalDtype) and isinstance(transformed.dtype, pd.CategoricalDtype):
+        return not transformed.astype(object).equals(original.astype(object))
+    return not transformed.equals(original)
+
+
+def _transform_column(column: str,
+                      column_data: pd.Series,
+                      existing_labeled: Optional[pd.Series],
+                      values_converter,
+                      merging_handler,
+                      categorical_labels: bool = True) -> Tuple[List[Tuple[str, pd.Series]], List[str], bool]:
+    """
+    Compute the derived columns for one raw column without touching any DataFrame.
+
+    Args:
+        column: Name of the raw column
+        column_data: Raw values of the column
+        existing_labeled: '<column>_labeled' already present in the dataset, if any
+        values_converter: ValuesToLabelsConverter used for code-to-label conversion
+        merging_handler: ValueMergingHandler holding the merging rules
+        categorical_labels: If True, labeled columns are pandas Categoricals
+
+    Returns:
+        Tuple of (derived (name, Series) pairs in insertion order, log messages,
+        whether any transformation was applied)
+    """
+    derived = []
+    messages = []
+    column_transformed = False
+    labeled_data = existing_labeled
+
+    # 1. Convert coded values to labels
+    try:
+        converted = values_converter.convert_column(column_data.copy(), column, verbose=False,
+                                                    as_categorical=categorical_labels)
+
+        # Check if conversion actually changed values
+        if not converted.equals(column_data):
+            labeled_data = converted
+            derived.append((f'{column}_labeled', converted))
+            messages.append(f"  {column}: Applied value-to-label conversion")
+            column_transformed = True
+
+    except Exception as e:
+        messages.append(f"  {column}: Error in label conversion - {str(e)}")
+
+    # 2. Apply value merging rules
+    try:
+        if column in merging_handler.merging_rules:
+            merged_data = merging_handler.apply_merging_rules(column_data, column)
+            if not merged_data.equals(column_data):
+                derived.append((f'{column}_merged', merged_data))
+                messages.append(f"  {column}: Applied value merging rules")
+                column_transformed = True
+
+    except Exception as e:
+        messages.append(f"  {column}: Error in value merging - {str(e)}")
+
+    # Apply merging to labeled version if it exists
+    try:
+        if labeled_data is not None and column in merging_handler.merging_rules:
+            merged_labeled = merging_handler.apply_merging_rules(labeled_data, column)
+            if _values_changed(labeled_data, merged_labeled):
+                derived.append((f'{column}_labeled_merged', merged_labeled))
+                messages.append(f"  {column}: Applied merging to labeled version")
+                column_transformed = True
+
+    except Exception as e:
+        messages.append(f"  {column}: Error in labeled merging - {str(e)}")
+
+    return derived, messages, column_transformed
+
+
+def _add_derived_columns(data: pd.DataFrame, derived_columns: Dict[str, pd.Series]) -> pd.DataFrame:
+    """
+    Add derived columns to a copy of data.
+
+    Columns that already exist are overwritten in place; the rest are appended
+    with a single concat, in the order given.
+
+    Args:
+        data: Raw data (not modified)
+        derived_columns: Derived column name -> values, in insertion order
+
+    Returns:
+        pd.DataFrame: New frame with the derived columns
+    """
+    result = data.copy()
+    new_columns = []
+    for name, values in derived_columns.items():
+        if name in result.columns:
+            result[name] = values
+        else:
+            new_columns.append(values.rename(name))
+    if new_columns:
+        result = pd.concat([result] + new_columns, axis=1)
+    return result
+
+
+def _init_worker(values_converter, merging_handler, categorical_labels: bool) -> None:
+    """Store the handlers once per process pool worker."""
+    global _worker_handlers
+    _worker_handlers = (values_converter, merging_handler, categorical_labels)
+
+
+def _transform_column_in_worker(column: str,
+                                column_data: pd.Series,
+                                existing_labeled: Optional[pd.Series]):
+    """Run _transform_column with the handlers stored by _init_worker."""
+    return _transform_column(column, column_data, existing_labeled, *_worker_handlers)
+
+
 class DataCleaningPipeline:
     """
     Main orchestrator for the entire data cleaning pipeline.
     Coordinates all cleaning handlers and produces visualization-ready data.
     """
     
-    def __init__(self, data_file_path: Optional[str] = None, output_dir: Optional[str] = None) -> None:
+    def __init__(self,
+                 data_file_path: Optional[str] = None,
+                 output_dir: Optional[str] = None,
+                 categorical_labels: bool = True) -> None:
         """
         Initialize the cleaning pipeline.
         
         Args:
             data_file_path: Path to the original dataset file (.sav format)
             output_dir: Directory to save processed data (defaults to package settings folder)
+            categorical_labels: If True, '_labeled' columns are pandas Categoricals whose
+                                categories follow the value-label order (one small integer
+                                code per row instead of a Python string)
         """
         self.data_file_path = Path(data_file_path) if data_file_path else None
+        self.categorical_labels = categorical_labels
         
         # Use settings folder within package if no output_dir specified
         if output_dir is None:
@@ -46,6 +177,7 @@ class DataCleaningPipeline:
         
         # Storage for processed data
         self.raw_data = None
+        self.raw_metadata = None
         self.processed_data = None
         self.processing_log = []
         
@@ -65,6 +197,9 @@ class DataCleaningPipeline:
         """
         Load the raw dataset.
         
+        The file metadata from the same read is kept in raw_metadata, so
+        metadata extraction does not need to read the file again.
+        
         Args:
             data_file_path: Path to dataset file (overrides initialization path)
             
@@ -80,11 +215,8 @@ class DataCleaningPipeline:
         try:
             print(f"Loading data from: {self.data_file_path.name}")
             
-            if self.data_file_path.suffix.lower() == '.sav':
-                import pyreadstat
-                self.raw_data, _ = pyreadstat.read_sav(str(self.data_file_path))
-            else:
-                raise ValueError("Only .sav files are currently supported")
+            from wave_visualizer.data_prep.cleaning.spss_reader import read_sav_file
+            self.raw_data, self.raw_metadata = read_sav_file(self.data_file_path)
             
             self.processing_log.append(f"Loaded raw data: {len(self.raw_data)} rows, {len(self.raw_data.columns)} columns")
             print(f"Data loaded successfully: {len(self.raw_data)} observations, {len(self.raw_data.columns)} variables")
@@ -126,12 +258,14 @@ class DataCleaningPipeline:
             # Set the data folder for metadata handler
             self.metadata_handler.data_folder = self.data_file_path.parent
             
-            # Process metadata
-            success = self.metadata_handler.extract_metadata(self.data_file_path)
+            # Process metadata, reusing the metadata read with the raw data
+            success = self.metadata_handler.extract_metadata(self.data_file_path, metadata=self.raw_metadata)
             if success:
                 success = self.metadata_handler.save_metadata_to_csv()
                 
             if success:
+                # Pick up the labels just written
+                self.values_converter._load_metadata()
                 self.processing_log.append("Extracted and saved metadata from dataset")
                 print("Metadata processing completed successfully")
                 return True
@@ -221,12 +355,63 @@ class DataCleaningPipeline:
     
 
     
-    def apply_cleaning_transformations(self, columns_to_process: Optional[List[str]] = None) -> bool:
+    def _transform_columns(self,
+                           data: pd.DataFrame,
+                           columns: List[str],
+                           n_workers: int = 1,
+                           use_processes: bool = False) -> List[Tuple[List[Tuple[str, pd.Series]], List[str], bool]]:
+        """
+        Run _transform_column for each column of data, serially or on a worker pool.
+        
+        Args:
+            data: Raw data containing every column in columns
+            columns: Columns to transform
+            n_workers: Number of parallel workers (1 processes columns serially)
+            use_processes: If True, use a process pool instead of a thread pool
+            
+        Returns:
+            List of _transform_column results, in the order of columns
+        """
+        tasks = []
+        for column in columns:
+            labeled_col = f'{column}_labeled'
+            existing_labeled = data[labeled_col] if labeled_col in data.columns else None
+            tasks.append((column, data[column], existing_labeled))
+        
+        if n_workers == 1 or len(tasks) < 2:
+            return [
+                _transform_column(column, column_data, existing_labeled,
+                                  self.values_converter, self.merging_handler, self.categorical_labels)
+                for column, column_data, existing_labeled in tasks
+            ]
+        if use_processes:
+            with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker,
+                                     initargs=(self.values_converter, self.merging_handler,
+                                               self.categorical_labels)) as pool:
+                return list(pool.map(_transform_column_in_worker, *zip(*tasks),
+                                     chunksize=max(1, len(tasks) // (n_workers * 4))))
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            return list(pool.map(
+                lambda task: _transform_column(*task, self.values_converter, self.merging_handler,
+                                               self.categorical_labels),
+                tasks
+            ))
+    
+    def apply_cleaning_transformations(self,
+                                       columns_to_process: Optional[List[str]] = None,
+                                       n_workers: int = 1,
+                                       use_processes: bool = False) -> bool:
         """
         Apply all cleaning transformations to produce the final dataset.
         
+        Each column is transformed independently, so the work can be spread
+        over a worker pool. Derived columns are added in one concat, in the
+        same order and with the same values as the serial path.
+        
         Args:
             columns_to_process: Specific columns to process, None for all columns
+            n_workers: Number of parallel workers (1 processes columns serially)
+            use_processes: If True, use a process pool instead of a thread pool
             
         Returns:
             bool: True if transformations applied successfully
@@ -239,70 +424,34 @@ class DataCleaningPipeline:
             print("Error: Raw data not loaded")
             return False
         
-        # Start with a copy of raw data
-        self.processed_data = self.raw_data.copy()
+        if n_workers < 1:
+            raise ValueError(f"n_workers must be at least 1, got {n_workers}")
         
         # Determine columns to process
         if columns_to_process is None:
-            columns_to_process = self.processed_data.columns.tolist()
+            columns_to_process = self.raw_data.columns.tolist()
         
-        transformation_count = 0
+        missing_columns = [column for column in columns_to_process if column not in self.raw_data.columns]
+        for column in missing_columns:
+            print(f"Warning: Column '{column}' not found in dataset")
+        columns_to_process = [column for column in columns_to_process if column in self.raw_data.columns]
         
-        # Apply transformations for each column
-        for column in columns_to_process:
-            if column not in self.processed_data.columns:
-                print(f"Warning: Column '{column}' not found in dataset")
-                continue
-            
-            column_transformed = False
-            
-            # 1. Convert coded values to labels
-            try:
-                original_data = self.processed_data[column].copy()
-                labeled_data = self.values_converter.convert_column(original_data, column)
-                
-                # Check if conversion actually changed values
-                if not labeled_data.equals(original_data):
-                    self.processed_data[f'{column}_labeled'] = labeled_data
-                    print(f"  {column}: Applied value-to-label conversion")
-                    column_transformed = True
-                    
-            except Exception as e:
-                print(f"  {column}: Error in label conversion - {str(e)}")
-            
-            # 2. Apply value merging rules
-            try:
-                if column in self.merging_handler.merging_rules:
-                    merged_data = self.merging_handler.apply_merging_rules(
-                        self.processed_data[column], column
-                    )
-                    if not merged_data.equals(self.processed_data[column]):
-                        self.processed_data[f'{column}_merged'] = merged_data
-                        print(f"  {column}: Applied value merging rules")
-                        column_transformed = True
-                        
-            except Exception as e:
-                print(f"  {column}: Error in value merging - {str(e)}")
-            
-            # Apply merging to labeled version if it exists
-            try:
-                labeled_col = f'{column}_labeled'
-                if labeled_col in self.processed_data.columns:
-                    if column in self.merging_handler.merging_rules:
-                        merged_labeled = self.merging_handler.apply_merging_rules(
-                            self.processed_data[labeled_col], column
-                        )
-                        if not merged_labeled.equals(self.processed_data[labeled_col]):
-                            self.processed_data[f'{column}_labeled_merged'] = merged_labeled
-                            print(f"  {column}: Applied merging to labeled version")
-                            column_transformed = True
-                            
-            except Exception as e:
-                print(f"  {column}: Error in labeled merging - {str(e)}")
-            
+        results = self._transform_columns(self.raw_data, columns_to_process, n_workers, use_processes)
+        
+        # Collect derived columns in column order; later results win on duplicate names
+        derived_columns = {}
+        transformation_count = 0
+        for derived, messages, column_transformed in results:
+            for message in messages:
+                print(message)
+            for name, values in derived:
+                derived_columns[name] = values
             if column_transformed:
                 transformation_count += 1
         
+        # Overwrite derived columns that already exist, append the rest in one concat
+        self.processed_data = _add_derived_columns(self.raw_data, derived_columns)
+        
         print(f"\nTransformations applied to {transformation_count} columns")
         self.processing_log.append(f"Applied transformations to {transformation_count} columns")
         
@@ -310,17 +459,17 @@ class DataCleaningPipeline:
         # For now, we'll just log that this step is available
         self.processing_log.append("Missing value handling settings available for application")
         
-
-        
         print("Data cleaning transformations completed successfully")
         return True
     
-    def save_processed_data(self, filename: str = "processed_data.csv") -> bool:
+    def save_processed_data(self, filename: str = "processed_data.csv", columnar: bool = True) -> bool:
         """
         Save the processed dataset.
         
         Args:
             filename: Name of the output file
+            columnar: If True, also write a Parquet copy next to the CSV (requires pyarrow).
+                      Visualizations read the Parquet copy column by column.
             
         Returns:
             bool: True if save was successful
@@ -330,19 +479,190 @@ class DataCleaningPipeline:
             return False
         
         try:
+            from wave_visualizer.data_prep.data_loader import save_columnar_data
+            
             output_file = self.output_dir / filename
             self.processed_data.to_csv(output_file, index=False)
             
             print(f"\nProcessed data saved to: {output_file}")
             print(f"Dataset shape: {self.processed_data.shape}")
-            
             self.processing_log.append(f"Saved processed data: {output_file}")
+            
+            if columnar:
+                columnar_file = save_columnar_data(self.processed_data, output_file)
+                if columnar_file is not None:
+                    print(f"Columnar copy saved to: {columnar_file}")
+                    self.processing_log.append(f"Saved columnar data: {columnar_file}")
+            
             return True
             
         except Exception as e:
             print(f"Error saving processed data: {str(e)}")
             return False
     
+    def _streaming_candidates(self, columns: List[str], file_columns: List[str]) -> Tuple[List[str], List[str]]:
+        """
+        Decide which derived columns streaming output may contain.
+        
+        Parquet needs one schema for every chunk, so derived columns are fixed
+        before the first chunk: '_labeled' for columns with value labels,
+        '_merged' and '_labeled_merged' for columns with merging rules.
+        
+        Args:
+            columns: Columns being transformed
+            file_columns: All columns in the source file
+            
+        Returns:
+            Tuple of (candidate derived columns in output order, columns to store as text)
+        """
+        candidates = []
+        text_columns = []
+        for column in columns:
+            has_labeled = f'{column}_labeled' in file_columns
+            if self.values_converter.value_labels.get(column):
+                candidates.append(f'{column}_labeled')
+                text_columns.append(f'{column}_labeled')
+                has_labeled = True
+            
+            rules = self.merging_handler.merging_rules.get(column)
+            if rules:
+                candidates.append(f'{column}_merged')
+                if any(isinstance(target, str) for target in rules):
+                    text_columns.append(f'{column}_merged')
+                if has_labeled:
+                    candidates.append(f'{column}_labeled_merged')
+                    text_columns.append(f'{column}_labeled_merged')
+        
+        return candidates, text_columns
+    
+    def run_streaming_pipeline(self,
+                               data_file_path: Optional[str] = None,
+                               chunksize: Optional[int] = None,
+                               force_reprocess: bool = False,
+                               columns_to_process: Optional[List[str]] = None,
+                               filename: str = "processed_data.csv",
+                               n_workers: int = 1) -> bool:
+        """
+        Clean a .sav file chunk by chunk, appending each chunk to the columnar output.
+        
+        Peak memory is bounded by the chunk size instead of the dataset size:
+        the raw file is never loaded as a whole and processed_data stays None.
+        Output is written only as Parquet (requires pyarrow), which
+        load_processed_data() reads in place of the CSV.
+        
+        Settings are not collected interactively, since that needs the full
+        dataset; existing missing value and merging settings are used.
+        Derived columns match apply_cleaning_transformations(), except that
+        labeled columns and columns merged into text targets are always
+        stored as text, even in chunks where every value is a numeric code.
+        
+        Args:
+            data_file_path: Path to dataset file (overrides initialization path)
+            chunksize: Number of rows per chunk (defaults to spss_reader.DEFAULT_CHUNKSIZE)
+            force_reprocess: If True, re-extract metadata from the file
+            columns_to_process: Specific columns to process, None for all columns
+            filename: Name of the processed data file (the .parquet file is written next to it)
+            n_workers: Number of parallel workers used for each chunk
+            
+        Returns:
+            bool: True if pipeline completed successfully
+        """
+        from wave_visualizer.data_prep.cleaning.spss_reader import (
+            DEFAULT_CHUNKSIZE, iter_sav_chunks, read_sav_file
+        )
+        from wave_visualizer.data_prep.data_loader import ColumnarDataWriter
+        
+        print("STARTING STREAMING DATA CLEANING PIPELINE")
+        print("="*60)
+        
+        if data_file_path:
+            self.data_file_path = Path(data_file_path)
+        if not self.data_file_path or not self.data_file_path.exists():
+            raise ValueError(f"Data file not found: {self.data_file_path}")
+        if n_workers < 1:
+            raise ValueError(f"n_workers must be at least 1, got {n_workers}")
+        chunksize = chunksize or DEFAULT_CHUNKSIZE
+        
+        writer = None
+        try:
+            # Header only: labels and column names, no data
+            _, self.raw_metadata = read_sav_file(self.data_file_path, metadataonly=True)
+            file_columns = list(self.raw_metadata.column_names)
+            print(f"Streaming {self.data_file_path.name}: {len(file_columns)} variables, "
+                  f"{chunksize:,} rows per chunk")
+            
+            if not self.ensure_metadata_processed(force_reprocess):
+                return False
+            
+            if self.missing_handler.missing_settings_file.exists():
+                self.missing_handler.load_preferences_from_csv()
+            else:
+                print("No missing value settings found - streaming without them")
+            if self.merging_handler.merging_settings_file.exists():
+                self.merging_handler.load_preferences_from_csv()
+            else:
+                print("No value merging settings found - streaming without them")
+            
+            if columns_to_process is None:
+                columns_to_process = file_columns
+            for column in columns_to_process:
+                if column not in file_columns:
+                    print(f"Warning: Column '{column}' not found in dataset")
+            columns_to_process = [column for column in columns_to_process if column in file_columns]
+            
+            candidates, text_columns = self._streaming_candidates(columns_to_process, file_columns)
+            changed = set()
+            messages = {}
+            
+            writer = ColumnarDataWriter(self.output_dir / filename, text_columns=text_columns)
+            for chunk_number, (chunk, _) in enumerate(iter_sav_chunks(self.data_file_path, chunksize), 1):
+                derived_columns = {}
+                for derived, column_messages, _ in self._transform_columns(chunk, columns_to_process, n_workers):
+                    for name, values in derived:
+                        derived_columns[name] = values
+                    messages.update(dict.fromkeys(column_messages))
+                changed.update(derived_columns)
+                
+                # Unchanged candidates hold their source values, so every chunk has the same columns
+                for name in candidates:
+                    if name not in derived_columns:
+                        source = name[:-len('_merged')] if name.endswith('_merged') else name[:-len('_labeled')]
+                        derived_columns[name] = derived_columns.get(source, chunk.get(source))
+                derived_columns = {name: derived_columns[name] for name in candidates}
+                
+                writer.write(_add_derived_columns(chunk, derived_columns))
+                print(f"  Chunk {chunk_number}: {writer.rows_written:,} rows written")
+            
+            # Candidates no chunk changed would not exist in the in-memory pipeline output
+            output_file = writer.close(drop_columns=[
+                name for name in candidates if name not in changed and name not in file_columns
+            ])
+            writer = None
+            
+            for message in messages:
+                print(message)
+            transformation_count = len({
+                column for column in columns_to_process
+                if any(name in changed for name in
+                       (f'{column}_labeled', f'{column}_merged', f'{column}_labeled_merged'))
+            })
+            print(f"\nTransformations applied to {transformation_count} columns")
+            print(f"Processed data saved to: {output_file}")
+            
+            self.processing_log.append(f"Streamed transformations to {transformation_count} columns")
+            self.processing_log.append(f"Saved columnar data: {output_file}")
+            
+            print("\n" + "="*60)
+            print("STREAMING DATA CLEANING PIPELINE COMPLETED SUCCESSFULLY!")
+            print("="*60)
+            return True
+            
+        except Exception as e:
+            if writer is not None:
+                writer.abort()
+            print(f"\nStreaming pipeline failed with error: {str(e)}")
+            return False
+    
     def show_processing_summary(self):
         """Display a summary of the processing pipeline."""
         print("\n" + "="*60)
@@ -375,7 +695,8 @@ class DataCleaningPipeline:
                          data_file_path: str = None,
                          interactive: bool = True,
                          force_reprocess: bool = False,
-                         columns_to_process: Optional[List[str]] = None) -> bool:
+                         columns_to_process: Optional[List[str]] = None,
+                         n_workers: int = 1) -> bool:
         """
         Run the complete data cleaning pipeline.
         
@@ -384,6 +705,7 @@ class DataCleaningPipeline:
             interactive: If True, prompt user for preferences
             force_reprocess: If True, reconfigure all settings
             columns_to_process: Specific columns to process
+            n_workers: Number of parallel workers for the transformation step
             
         Returns:
             bool: True if pipeline completed successfully
@@ -411,7 +733,7 @@ class DataCleaningPipeline:
 
             
             # Apply all transformations
-            if not self.apply_cleaning_transformations(columns_to_process):
+            if not self.apply_cleaning_transformations(columns_to_process, n_workers=n_workers):
                 return False
             
             # Save processed data
@@ -143,12 +143,17 @@ class MetadataHandler:
         
         return True
     
-    def extract_metadata(self, file_path: Path) -> bool:
+    def extract_metadata(self, file_path: Path, metadata: Optional[Any] = None) -> bool:
         """
         Extract metadata from the specified .sav file.
         
+        Only the file header is read; the data itself is never loaded. If the
+        caller already read the file (e.g. DataCleaningPipeline.load_raw_data),
+        pass its metadata to skip reading the file again.
+        
         Args:
             file_path: Path to the .sav file
+            metadata: pyreadstat metadata already read from file_path, if available
             
         Returns:
             bool: True if metadata extraction was successful, False otherwise
@@ -160,11 +165,15 @@ class MetadataHandler:
         print(f"File size: {file_path.stat().st_size / (1024 * 1024):.1f} MB")
         
         try:
-            import pyreadstat
+            from wave_visualizer.data_prep.cleaning.spss_reader import read_sav_file
             
-            # Read the file with metadata
-            print("Reading SPSS file...")
-            df, meta = pyreadstat.read_sav(str(file_path))
+            if metadata is None:
+                # Read the file header only
+                print("Reading SPSS metadata...")
+                _, meta = read_sav_file(file_path, metadataonly=True)
+            else:
+                print("Using metadata from the loaded dataset")
+                meta = metadata
             
             # Extract variable labels
             if meta.column_labels:
@@ -180,7 +189,8 @@ class MetadataHandler:
             print(f"  - Total variables: {len(meta.column_names)}")
             print(f"  - Variables with labels: {len(self.variable_labels)}")
             print(f"  - Variables with value labels: {len(self.value_labels)}")
-            print(f"  - Total observations: {len(df)}")
+            if meta.number_rows is not None:
+                print(f"  - Total observations: {meta.number_rows}")
             
             # Store the file path for reference
             self.data_file_path = file_path
@@ -17,15 +17,316 @@ analysis is performed on the appropriate subset of data.
 """
 
 import pandas as pd
+import numpy as np
 import os
+import threading
+import weakref
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple, Any
 import logging
 
+from wave_visualizer.data_prep.column_profiles import get_column_profiles
+from wave_visualizer.utils.frame_signature import column_token
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Columns with more distinct values than this are filtered with isin instead of bitmaps
+MAX_INDEXED_VALUES = 256
+
+# Number of filter indexes kept by get_filter_index()
+FILTER_INDEX_CACHE_SIZE = 8
+
+# Number of set bits in each byte value, for counting rows in packed bitmaps
+_POPCOUNT = np.array([bin(value).count('1') for value in range(256)], dtype=np.int64)
+
+
+class FilterIndex:
+    """
+    Packed row bitmaps per value of low-cardinality columns.
+    
+    Each indexed column keeps one np.packbits bitmap per distinct value (one
+    bit per row) plus one for missing values. A filter on several values is
+    the OR of their bitmaps, several filters are ANDed, and the result can be
+    returned as a boolean mask, row positions or a row count without touching
+    the DataFrame. Bitmaps are built the first time a column is filtered.
+    
+    Each column's bitmaps are stored with the column's change token and
+    rebuilt when the column has been replaced since; after editing values in
+    place, call invalidate_frame_caches() on the frame. The index refers to
+    its DataFrame weakly and must not outlive it.
+    """
+    
+    def __init__(self, data: pd.DataFrame, columns: Optional[Sequence[str]] = None):
+        """
+        Initialize the index.
+        
+        Args:
+            data: DataFrame to index
+            columns: Columns to index up front (others are indexed on first use)
+        """
+        self.n_rows = len(data)
+        self._data = weakref.ref(data)
+        self._columns = {}
+        self._tokens = {}
+        for column in columns or []:
+            self._column_bitmaps(column)
+    
+    def _frame(self) -> pd.DataFrame:
+        data = self._data()
+        if data is None:
+            raise ValueError("The indexed DataFrame no longer exists")
+        if len(data) != self.n_rows:
+            # Rows were added or dropped in place; every bitmap is stale
+            self.n_rows = len(data)
+            self._columns.clear()
+            self._tokens.clear()
+        return data
+    
+    def _column_bitmaps(self, column: str) -> Optional[Tuple[pd.Index, np.ndarray, np.ndarray]]:
+        """
+        Get (values, per-value bitmaps, missing bitmap) for a column, building them once.
+        
+        Returns None for columns with too many distinct values to index.
+        """
+        data = self._frame()
+        token = column_token(data, column)
+        if column in self._columns:
+            if token is not None and token == self._tokens[column]:
+                return self._columns[column]
+            logger.debug(f"Filter column '{column}' changed; rebuilding its bitmaps")
+        
+        series = data[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes, values = series.cat.codes.to_numpy(), series.cat.categories
+        else:
+            codes, values = pd.factorize(series)
+            values = pd.Index(values)
+        
+        entry = None
+        if len(values) <= MAX_INDEXED_VALUES:
+            bitmaps = np.empty((len(values), (self.n_rows + 7) // 8), dtype=np.uint8)
+            for code in range(len(values)):
+                bitmaps[code] = np.packbits(codes == code)
+            entry = (values, bitmaps, np.packbits(codes < 0))
+            logger.debug(f"Indexed filter column '{column}' ({len(values)} values)")
+        self._columns[column] = entry
+        self._tokens[column] = token
+        return entry
+    
+    def value_bitmap(self, column: str, values: Sequence[Any]) -> np.ndarray:
+        """
+        Get the packed bitmap of rows where column is one of values.
+        
+        Matches Series.isin(values), including missing values when NaN/None
+        is listed.
+        
+        Args:
+            column: Column to filter
+            values: Values to keep
+            
+        Returns:
+            np.ndarray: Packed bitmap (np.packbits layout)
+        """
+        values = list(values)
+        entry = self._column_bitmaps(column)
+        if entry is None:
+            return np.packbits(self._frame()[column].isin(values).to_numpy())
+        
+        column_values, bitmaps, missing = entry
+        positions = column_values.get_indexer(pd.Index(values, dtype=object))
+        bits = np.bitwise_or.reduce(bitmaps[positions[positions >= 0]], axis=0) \
+            if (positions >= 0).any() else np.zeros(bitmaps.shape[1], dtype=np.uint8)
+        if any(pd.isna(value) for value in values):
+            bits = bits | missing
+        return bits
+    
+    def bitmap(self, filters: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Get the packed bitmap of rows passing every filter.
+        
+        Args:
+            filters: Filter specifications ({"column": ..., "values": [...]});
+                     filters on columns not in the frame are ignored
+            
+        Returns:
+            np.ndarray: Packed bitmap (np.packbits layout)
+        """
+        columns = self._frame().columns
+        bits = np.full((self.n_rows + 7) // 8, 0xFF, dtype=np.uint8)
+        if self.n_rows % 8:
+            # Clear the padding bits after the last row
+            bits[-1] = np.uint8((0xFF << (8 - self.n_rows % 8)) & 0xFF)
+        for filter_item in filters:
+            if filter_item["column"] in columns:
+                bits &= self.value_bitmap(filter_item["column"], filter_item["values"])
+        return bits
+    
+    def mask(self, filters: List[Dict[str, Any]]) -> np.ndarray:
+        """Get a boolean row mask for filters (see bitmap())."""
+        return np.unpackbits(self.bitmap(filters), count=self.n_rows).astype(bool)
+    
+    def rows(self, filters: List[Dict[str, Any]]) -> np.ndarray:
+        """Get the positions of the rows passing filters (see bitmap())."""
+        return np.flatnonzero(np.unpackbits(self.bitmap(filters), count=self.n_rows))
+    
+    @staticmethod
+    def count_bits(bits: np.ndarray) -> int:
+        """Count the rows set in a packed bitmap."""
+        return int(_POPCOUNT[bits].sum())
+    
+    def count(self, filters: List[Dict[str, Any]]) -> int:
+        """Count the rows passing filters (see bitmap())."""
+        return self.count_bits(self.bitmap(filters))
+    
+    def value_counts(self, column: str) -> Optional[pd.Series]:
+        """
+        Count the rows holding each non-missing value of a column, from its bitmaps.
+        
+        Args:
+            column: Column to count
+        
+        Returns:
+            pd.Series of row counts indexed by value (values without rows are
+            left out), or None if the column has too many values to index
+        """
+        entry = self._column_bitmaps(column)
+        if entry is None:
+            return None
+        values, bitmaps, _ = entry
+        counts = np.array([self.count_bits(bits) for bits in bitmaps], dtype=np.int64)
+        present = counts > 0
+        return pd.Series(counts[present], index=pd.Index(values[present], dtype=object))
+
+
+# LRU of filter indexes keyed on DataFrame identity
+_filter_index_cache: 'OrderedDict[Hashable, Tuple[weakref.ref, FilterIndex]]' = OrderedDict()
+_filter_index_lock = threading.RLock()
+
+
+def get_filter_index(data: pd.DataFrame) -> FilterIndex:
+    """
+    Get the FilterIndex for a DataFrame, reusing it across calls.
+    
+    Repeated filtering of the same frame (e.g. one create_* call per party)
+    builds each column's bitmaps once. Columns replaced since are re-indexed
+    on next use, as are all columns after invalidate_frame_caches(data).
+    
+    Args:
+        data: DataFrame to filter
+        
+    Returns:
+        FilterIndex bound to data
+    """
+    key = id(data)
+    with _filter_index_lock:
+        entry = _filter_index_cache.get(key)
+        if entry is not None and entry[0]() is data:
+            _filter_index_cache.move_to_end(key)
+            return entry[1]
+        
+        index = FilterIndex(data)
+        _filter_index_cache[key] = (weakref.ref(data), index)
+        while len(_filter_index_cache) > FILTER_INDEX_CACHE_SIZE:
+            _filter_index_cache.popitem(last=False)
+        return index
+
+
+def clear_filter_index_cache() -> int:
+    """
+    Drop all cached filter indexes.
+    
+    Returns:
+        int: Number of entries removed
+    """
+    with _filter_index_lock:
+        removed = len(_filter_index_cache)
+        _filter_index_cache.clear()
+    return removed
+
+
+class Selection:
+    """
+    Lazy view of the rows of a DataFrame that passed a filter.
+    
+    Holds the base frame and the kept row positions; columns are copied out
+    only when asked for, so code that needs two or three columns of a wide
+    frame never materializes the rest.
+    """
+    
+    def __init__(self, data: pd.DataFrame, rows: Optional[np.ndarray] = None):
+        """
+        Initialize the selection.
+        
+        Args:
+            data: Base DataFrame
+            rows: Positions of the selected rows (None selects every row)
+        """
+        self.data = data
+        self.rows = None if rows is None else np.asarray(rows, dtype=np.intp)
+    
+    def __len__(self) -> int:
+        return len(self.data) if self.rows is None else len(self.rows)
+    
+    def __contains__(self, column: Hashable) -> bool:
+        return column in self.data.columns
+    
+    def __repr__(self) -> str:
+        return f"Selection({len(self):,} of {len(self.data):,} rows, {len(self.data.columns):,} columns)"
+    
+    @property
+    def columns(self) -> pd.Index:
+        """Columns available from the base frame."""
+        return self.data.columns
+    
+    @property
+    def index(self) -> pd.Index:
+        """Index labels of the selected rows."""
+        return self.data.index if self.rows is None else self.data.index[self.rows]
+    
+    @property
+    def mask(self) -> np.ndarray:
+        """Boolean mask of the selected rows over the base frame."""
+        if self.rows is None:
+            return np.ones(len(self.data), dtype=bool)
+        mask = np.zeros(len(self.data), dtype=bool)
+        mask[self.rows] = True
+        return mask
+    
+    def column(self, column: str) -> pd.Series:
+        """
+        Get one column restricted to the selected rows.
+        
+        Args:
+            column: Column name
+            
+        Returns:
+            pd.Series: The column's selected values (the base column itself
+            when every row is selected)
+        """
+        series = self.data[column]
+        return series if self.rows is None else series.iloc[self.rows]
+    
+    def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, list):
+            return self.to_frame(key)
+        return self.column(key)
+    
+    def to_frame(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Copy the selected rows of some columns into a new DataFrame.
+        
+        Args:
+            columns: Columns to copy (None copies every column)
+            
+        Returns:
+            pd.DataFrame: New frame with the selected rows and columns
+        """
+        data = self.data if columns is None else self.data[columns]
+        return data.copy() if self.rows is None else data.iloc[self.rows]
+
 
 class RowReductionHandler:
     """
@@ -53,12 +354,13 @@ class RowReductionHandler:
             List of column names that contain categorical data
         """
         categorical_columns = []
+        unique_counts = get_column_profiles(data).unique_counts
         
         for column in data.columns:
             # Check if column is object type or has limited unique values
             if (data[column].dtype == 'object' or 
                 (data[column].dtype in ['int64', 'float64'] and 
-                 data[column].nunique() <= 20)):  # Assume <=20 unique values means categorical
+                 unique_counts[column] <= 20)):  # Assume <=20 unique values means categorical
                 categorical_columns.append(column)
                 
         return categorical_columns
@@ -75,17 +377,24 @@ class RowReductionHandler:
             print(f"  WARNING: Column '{column}' not found in dataset")
             return
             
+        profiles = get_column_profiles(data, [column])
+        null_count = profiles.missing_count(column)
+        unique_count = profiles.unique_count(column)
+        
         print(f"\nColumn: {column}")
         print(f"Data type: {data[column].dtype}")
         print(f"Total values: {len(data[column])}")
-        print(f"Non-null values: {data[column].count()}")
-        print(f"Null values: {data[column].isnull().sum()}")
-        print(f"Unique values: {data[column].nunique()}")
+        print(f"Non-null values: {len(data) - null_count}")
+        print(f"Null values: {null_count}")
+        print(f"Unique values: {unique_count}")
         
         # Show value counts for categorical data
-        if data[column].nunique() <= 20:
+        if unique_count <= 20:
             print("\nValue counts:")
-            value_counts = data[column].value_counts(dropna=False)
+            value_counts = profiles.value_counts(column)
+            if null_count:
+                value_counts = pd.concat([value_counts, pd.Series({np.nan: null_count})])
+                value_counts = value_counts.sort_values(ascending=False, kind='stable')
             for value, count in value_counts.head(10).items():
                 percentage = (count / len(data)) * 100
                 print(f"  {value}: {count} ({percentage:.1f}%)")
@@ -192,13 +501,19 @@ class RowReductionHandler:
             # Display column information
             self.display_column_info(data, column)
             
-            # Get unique values
-            unique_values = data[column].dropna().unique()
+            # Get unique values and their row counts
+            profiles = get_column_profiles(data, [column])
+            if profiles.is_complete(column):
+                value_counts = profiles.value_counts(column, sort=False)
+            else:
+                value_counts = data[column].value_counts(sort=False)
+            row_counts = value_counts.to_dict()
+            unique_values = value_counts.index.tolist()
             unique_values = sorted(unique_values) if len(unique_values) < 50 else unique_values
             
             print(f"\nUnique values in {column}:")
             for i, value in enumerate(unique_values, 1):
-                count = (data[column] == value).sum()
+                count = row_counts[value]
                 percentage = (count / len(data)) * 100
                 print(f"{i}. {value} ({count} rows, {percentage:.1f}%)")
             
@@ -286,23 +601,44 @@ class RowReductionHandler:
         except ValueError:
             print("Invalid input.")
     
-    def apply_filters(self, data: pd.DataFrame, settings: Dict[str, Any]) -> pd.DataFrame:
+    def filter_rows(self, data: pd.DataFrame, settings: Dict[str, Any]) -> np.ndarray:
         """
-        Apply filtering criteria to the data.
+        Get the positions of the rows passing the filters, without copying the data.
         
         Args:
             data: DataFrame to filter
             settings: Dictionary containing filter specifications
             
         Returns:
-            Filtered DataFrame
+            np.ndarray: Row positions (for data.iloc / data.take)
+        """
+        return get_filter_index(data).rows(settings.get("filters") or [])
+    
+    def select(self, data: pd.DataFrame, settings: Dict[str, Any]) -> Selection:
+        """
+        Select the rows passing the filters without copying any data.
+        
+        Filters are combined on the frame's cached FilterIndex. Progress and
+        the final row counts are reported as by apply_filters().
+        
+        Args:
+            data: DataFrame to filter
+            settings: Dictionary containing filter specifications
+            
+        Returns:
+            Selection of data's kept rows
+            
+        Raises:
+            ValueError: If the filters remove every row
         """
         if not settings.get("filters"):
             logger.info("No filters specified. Returning original data.")
-            return data.copy()
+            return Selection(data)
         
         original_count = len(data)
-        filtered_data = data.copy()
+        index = get_filter_index(data)
+        bits = None
+        before_count = original_count
         
         logger.info(f"Applying {len(settings['filters'])} filters to {original_count:,} rows")
         
@@ -310,17 +646,23 @@ class RowReductionHandler:
             column = filter_item["column"]
             values = filter_item["values"]
             
-            if column not in filtered_data.columns:
+            if column not in data.columns:
                 logger.warning(f"Filter {i}: Column '{column}' not found. Skipping.")
                 continue
             
-            before_count = len(filtered_data)
-            filtered_data = filtered_data[filtered_data[column].isin(values)]
-            after_count = len(filtered_data)
+            column_bits = index.value_bitmap(column, values)
+            bits = column_bits if bits is None else bits & column_bits
+            after_count = FilterIndex.count_bits(bits)
             
             logger.info(f"Filter {i} ({column}): {before_count:,} → {after_count:,} rows")
+            before_count = after_count
         
-        final_count = len(filtered_data)
+        if bits is None:
+            selection = Selection(data)
+        else:
+            selection = Selection(data, np.flatnonzero(np.unpackbits(bits, count=original_count)))
+        
+        final_count = len(selection)
         removed_count = original_count - final_count
         removal_rate = (removed_count / original_count) * 100
         
@@ -335,7 +677,27 @@ class RowReductionHandler:
         elif final_count < 100:
             logger.warning(f"Very few rows remain ({final_count}). Consider reviewing filters.")
         
-        return filtered_data
+        return selection
+    
+    def apply_filters(self,
+                      data: pd.DataFrame,
+                      settings: Dict[str, Any],
+                      columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Apply filtering criteria to the data.
+        
+        Filters are combined on the frame's cached FilterIndex (see select()),
+        and the kept rows are copied once at the end.
+        
+        Args:
+            data: DataFrame to filter
+            settings: Dictionary containing filter specifications
+            columns: Only return these columns (None returns every column)
+            
+        Returns:
+            Filtered DataFrame
+        """
+        return self.select(data, settings).to_frame(columns)
     
     def save_settings(self, settings: Dict[str, Any]) -> None:
         """
@@ -0,0 +1,82 @@
+"""
+SPSS Reader
+
+Single entry point for reading SPSS .sav files. One pyreadstat pass returns
+both the data and the file metadata (variable labels, value labels), so the
+cleaning pipeline can hand the same metadata to MetadataHandler instead of
+reading the file a second time. A metadata-only mode reads just the file
+header when only labels are needed, and a chunked mode streams files that
+are too large to load at once.
+"""
+
+import pandas as pd
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Tuple, Union
+
+# Default number of rows per chunk for streaming reads
+DEFAULT_CHUNKSIZE = 100_000
+
+
+def _validate_sav_path(file_path: Union[str, Path]) -> Path:
+    """Return file_path as a Path, rejecting anything but .sav files."""
+    file_path = Path(file_path)
+    if file_path.suffix.lower() != '.sav':
+        raise ValueError("Only .sav files are currently supported")
+    return file_path
+
+
+def read_sav_file(file_path: Union[str, Path],
+                  metadataonly: bool = False,
+                  usecols: Optional[List[str]] = None) -> Tuple[pd.DataFrame, Any]:
+    """
+    Read an SPSS .sav file, returning the data and its metadata from one pass.
+
+    Args:
+        file_path: Path to the .sav file
+        metadataonly: If True, read only the metadata (the returned DataFrame is empty)
+        usecols: Columns to read, None for all columns
+
+    Returns:
+        Tuple of (DataFrame, pyreadstat metadata container)
+
+    Raises:
+        ImportError: If pyreadstat is not installed
+        ValueError: If the file is not a .sav file
+    """
+    file_path = _validate_sav_path(file_path)
+
+    import pyreadstat
+
+    return pyreadstat.read_sav(str(file_path), metadataonly=metadataonly, usecols=usecols)
+
+
+def iter_sav_chunks(file_path: Union[str, Path],
+                    chunksize: int = DEFAULT_CHUNKSIZE,
+                    usecols: Optional[List[str]] = None) -> Iterator[Tuple[pd.DataFrame, Any]]:
+    """
+    Stream an SPSS .sav file in blocks of rows.
+
+    Only one chunk is held in memory at a time. Every chunk carries the file
+    metadata.
+
+    Args:
+        file_path: Path to the .sav file
+        chunksize: Number of rows per chunk
+        usecols: Columns to read, None for all columns
+
+    Yields:
+        Tuple of (DataFrame chunk, pyreadstat metadata container)
+
+    Raises:
+        ImportError: If pyreadstat is not installed
+        ValueError: If the file is not a .sav file or chunksize is not positive
+    """
+    file_path = _validate_sav_path(file_path)
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, got {chunksize}")
+
+    import pyreadstat
+
+    yield from pyreadstat.read_file_in_chunks(
+        pyreadstat.read_sav, str(file_path), chunksize=chunksize, usecols=usecols
+    )
@@ -13,11 +13,67 @@ Example use cases:
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 import warnings
 
+from wave_visualizer.data_prep.column_profiles import get_column_profiles
+
 warnings.filterwarnings('ignore')
 
+
+def _compile_rules(merging_rules: Dict[Any, List[Any]]) -> Tuple[pd.Index, np.ndarray, List[Any]]:
+    """
+    Compile one column's merging rules into a flat source -> target lookup.
+
+    Rules are applied in order, so a value merged into a target that is itself
+    a later source keeps moving (e.g. A -> B then B -> C sends A to C). Each
+    source is resolved through that chain once here, so applying the rules is
+    a single lookup per value.
+
+    Args:
+        merging_rules: Target -> [source values] rules for one column
+
+    Returns:
+        Tuple of (Index of source values, final target per source (object array),
+        targets in rule order)
+    """
+    pairs = [(source, target) for target, sources in merging_rules.items() for source in sources]
+
+    lookup = {}
+    for source, _ in pairs:
+        # Missing sources never compare equal to a value, so they never match
+        if pd.isna(source) or source in lookup:
+            continue
+        value = source
+        for pair_source, pair_target in pairs:
+            if value == pair_source:
+                value = pair_target
+        lookup[source] = value
+
+    targets = np.empty(len(lookup), dtype=object)
+    targets[:] = list(lookup.values())
+    return pd.Index(list(lookup)), targets, list(merging_rules)
+
+
+def _merged_dtype(dtype, targets: List[Any]):
+    """
+    Get the dtype a column ends up with after targets are assigned into it.
+
+    Assigning a target pandas cannot hold in the column's dtype (e.g. a label
+    into a float column) upcasts the column even when no row matches. The
+    assignment is replayed on an empty Series to get the same dtype.
+    """
+    probe = pd.Series([], dtype=dtype)
+    no_rows = np.zeros(0, dtype=bool)
+    for target in targets:
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                probe.loc[no_rows] = target
+        except (TypeError, ValueError):
+            probe = probe.astype(object)
+    return probe.dtype
+
 class ValueMergingHandler:
     """
     Handles user preferences for merging categorical values into target groups.
@@ -44,6 +100,9 @@ class ValueMergingHandler:
         # Storage for user preferences
         self.merging_rules = {}
         
+        # Compiled lookups per column, rebuilt when that column's rules change
+        self._compiled_rules = {}
+        
     def analyze_column_values(self, dataframe: pd.DataFrame, column_name: str) -> Dict[str, Any]:
         """
         Analyze unique values in a column to help user decide on merging.
@@ -58,6 +117,19 @@ class ValueMergingHandler:
         if column_name not in dataframe.columns:
             raise ValueError(f"Column '{column_name}' not found in dataframe")
         
+        # Low-cardinality columns are answered from the shared column profiles
+        profiles = get_column_profiles(dataframe, [column_name])
+        if profiles.is_complete(column_name):
+            unique_values = profiles.unique_values(column_name)
+            return {
+                'column_name': column_name,
+                'total_non_missing': profiles.n_rows - profiles.missing_count(column_name),
+                'unique_count': len(unique_values),
+                'unique_values': unique_values,
+                'value_counts': profiles.value_counts(column_name).to_dict(),
+                'sample_values': unique_values[:10]
+            }
+        
         column_data = dataframe[column_name].dropna()
         unique_values = column_data.unique()
         value_counts = column_data.value_counts()
@@ -266,8 +338,9 @@ class ValueMergingHandler:
         if columns_to_process is None:
             # Let user choose columns
             categorical_columns = []
+            unique_counts = get_column_profiles(dataframe).unique_counts
             for col in dataframe.columns:
-                if dataframe[col].dtype == 'object' or dataframe[col].nunique() < 20:
+                if dataframe[col].dtype == 'object' or unique_counts[col] < 20:
                     categorical_columns.append(col)
             
             if not categorical_columns:
@@ -276,8 +349,7 @@ class ValueMergingHandler:
             
             print(f"Found {len(categorical_columns)} potential columns for value merging:")
             for i, col in enumerate(categorical_columns[:20], 1):
-                unique_count = dataframe[col].nunique()
-                print(f"  {i:2d}. {col} ({unique_count} unique values)")
+                print(f"  {i:2d}. {col} ({unique_counts[col]} unique values)")
             
             if len(categorical_columns) > 20:
                 print(f"      ... and {len(categorical_columns) - 20} more columns")
@@ -370,18 +442,10 @@ class ValueMergingHandler:
             
             # Convert CSV back to nested dictionary structure
             self.merging_rules = {}
-            for _, row in merging_df.iterrows():
-                column = row['column_name']
-                source_val = row['source_value']
-                target_val = row['target_value']
-                
-                if column not in self.merging_rules:
-                    self.merging_rules[column] = {}
-                
-                if target_val not in self.merging_rules[column]:
-                    self.merging_rules[column][target_val] = []
-                
-                self.merging_rules[column][target_val].append(source_val)
+            for column, source_val, target_val in zip(merging_df['column_name'].tolist(),
+                                                      merging_df['source_value'].tolist(),
+                                                      merging_df['target_value'].tolist()):
+                self.merging_rules.setdefault(column, {}).setdefault(target_val, []).append(source_val)
             
             print(f"Loaded merging settings for {len(self.merging_rules)} columns")
             return True
@@ -402,10 +466,38 @@ class ValueMergingHandler:
         """
         return self.merging_rules.get(column_name, {})
     
+    def _get_compiled_rules(self, column_name: str) -> Optional[Tuple[pd.Index, np.ndarray, List[Any]]]:
+        """
+        Get the compiled lookup for a column, compiling it if its rules changed.
+        
+        Args:
+            column_name: Name of the column
+            
+        Returns:
+            Output of _compile_rules, or None if the column has no rules
+        """
+        merging_rules = self.get_merging_rules(column_name)
+        if not merging_rules:
+            return None
+        
+        # merging_rules is a public dict that callers edit in place, so compare
+        # a snapshot of the rules instead of trusting a stored copy
+        snapshot = tuple((target, tuple(sources)) for target, sources in merging_rules.items())
+        cached = self._compiled_rules.get(column_name)
+        if cached is None or cached[0] != snapshot:
+            cached = (snapshot, _compile_rules(merging_rules))
+            self._compiled_rules[column_name] = cached
+        return cached[1]
+    
     def apply_merging_rules(self, column_data: pd.Series, column_name: str) -> pd.Series:
         """
         Apply merging rules to a column of data.
         
+        The column's rules are compiled once into a source -> target lookup and
+        applied in one vectorized pass, so the cost does not grow with the
+        number of rules. Categorical columns are recoded through their
+        categories without touching the rows.
+        
         Args:
             column_data: Pandas Series containing the data
             column_name: Name of the column (for looking up rules)
@@ -413,19 +505,61 @@ class ValueMergingHandler:
         Returns:
             pd.Series: Data with merging rules applied
         """
-        merging_rules = self.get_merging_rules(column_name)
+        compiled = self._get_compiled_rules(column_name)
         
-        if not merging_rules:
+        if compiled is None:
             return column_data.copy()
         
-        merged_data = column_data.copy()
+        sources, targets, rule_targets = compiled
+        
+        if isinstance(column_data.dtype, pd.CategoricalDtype):
+            # Recode the categories; categories merged into the same target collapse
+            categories = column_data.cat.categories
+            positions = sources.get_indexer(categories)
+            merged_categories = np.where(positions >= 0, targets[positions], categories.astype(object))
+            new_categories = pd.Index(merged_categories).unique()
+            category_codes = new_categories.get_indexer(merged_categories)
+            codes = column_data.cat.codes.to_numpy()
+            new_codes = np.where(codes >= 0, category_codes[codes], -1)
+            return pd.Series(
+                pd.Categorical.from_codes(new_codes, new_categories, ordered=column_data.cat.ordered),
+                index=column_data.index, name=column_data.name
+            )
+        
+        positions = sources.get_indexer(column_data)
+        matched = positions >= 0
+        dtype = _merged_dtype(column_data.dtype, rule_targets)
+        
+        if not isinstance(dtype, np.dtype):
+            # Extension dtypes: let pandas place the values
+            merged_data = column_data.astype(dtype)
+            if matched.any():
+                merged_data.loc[matched] = targets[positions[matched]]
+            return merged_data
+        
+        values = column_data.to_numpy(dtype=dtype, copy=True)
+        if matched.any():
+            values[matched] = targets[positions[matched]]
+        return pd.Series(values, index=column_data.index, name=column_data.name)
+    
+    def apply_all(self, dataframe: pd.DataFrame, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Apply merging rules to every ruled column of a DataFrame in one call.
         
-        # Apply each merging rule
-        for target_value, source_values in merging_rules.items():
-            for source_value in source_values:
-                mask = (merged_data == source_value)
-                merged_data.loc[mask] = target_value
+        Args:
+            dataframe: DataFrame to merge (not modified)
+            columns: Columns to merge (defaults to every column with merging rules)
+            
+        Returns:
+            pd.DataFrame: Copy of dataframe with the merged columns replaced
+        """
+        if columns is None:
+            columns = [column for column in dataframe.columns if column in self.merging_rules]
         
+        merged_data = dataframe.copy()
+        for column in columns:
+            if column in dataframe.columns:
+                merged_data[column] = self.apply_merging_rules(dataframe[column], column)
         return merged_data
     
     def process_merging_preferences(self, 
@@ -20,6 +20,50 @@ import warnings
 
 warnings.filterwarnings('ignore')
 
+# Rows read first when looking for each column's first distinct values
+SAMPLE_HEAD_ROWS = 1024
+
+# Sample values listed per column by analyze_missing_values
+SAMPLE_VALUE_COUNT = 5
+
+
+def _leading_unique_values(data: pd.DataFrame, unique_counts: np.ndarray,
+                           n_values: int) -> List[List[Any]]:
+    """
+    Get each column's first distinct non-missing values, in order of appearance.
+    
+    A short head of the frame is read first; only columns whose head holds
+    fewer distinct values than the column has (up to n_values) are read
+    further, with the head growing eightfold each round. The result equals
+    dropna().unique()[:n_values] per column without scanning most columns.
+    
+    Args:
+        data: DataFrame to read
+        unique_counts: Distinct non-missing values per column, by position
+        n_values: Number of values wanted per column
+        
+    Returns:
+        List of value lists, one per column
+    """
+    needed = np.minimum(np.asarray(unique_counts, dtype=np.int64), n_values)
+    samples = [[] for _ in range(data.shape[1])]
+    pending = np.flatnonzero(needed > 0)
+    head_rows = SAMPLE_HEAD_ROWS
+    
+    while len(pending):
+        head = data.iloc[:head_rows, pending]
+        whole_column = head_rows >= len(data)
+        unresolved = []
+        for offset, position in enumerate(pending):
+            values = head.iloc[:, offset].dropna().unique()[:n_values].tolist()
+            samples[position] = values
+            if len(values) < needed[position] and not whole_column:
+                unresolved.append(position)
+        pending = np.array(unresolved, dtype=np.int64)
+        head_rows *= 8
+    
+    return samples
+
 class ValueMissingAndDroppingHandler:
     """
     Handles user preferences for missing value treatment and specific value dropping.
@@ -48,37 +92,48 @@ class ValueMissingAndDroppingHandler:
         self.missing_strategies = {}
         self.drop_values = {}
         
-    def analyze_missing_values(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+    def analyze_missing_values(self, dataframe: pd.DataFrame,
+                               sample_rows: Optional[int] = None) -> pd.DataFrame:
         """
         Analyze missing values in the dataset.
         
+        Missing and unique counts are whole-frame reductions (isna().sum() and
+        nunique()); sample values come from a short head of each column, read
+        further only where needed.
+        
         Args:
             dataframe: DataFrame to analyze
+            sample_rows: If given, take sample values from this many randomly
+                         chosen rows (in row order) instead of the whole column;
+                         faster on very long frames, but rare values may be missed
             
         Returns:
             pd.DataFrame: Summary of missing values by column
         """
-        missing_summary = []
-        
-        for column in dataframe.columns:
-            missing_count = dataframe[column].isna().sum()
-            total_count = len(dataframe)
-            missing_pct = (missing_count / total_count) * 100
-            
-            # Get unique values for context
-            unique_values = dataframe[column].dropna().nunique()
-            sample_values = dataframe[column].dropna().unique()[:5].tolist()
-            
-            missing_summary.append({
-                'column': column,
-                'missing_count': missing_count,
-                'total_count': total_count,
-                'missing_percentage': missing_pct,
-                'unique_values': unique_values,
-                'sample_values': str(sample_values)
-            })
-        
-        return pd.DataFrame(missing_summary)
+        if len(dataframe.columns) == 0:
+            return pd.DataFrame()
+        
+        total_count = len(dataframe)
+        missing_counts = dataframe.isna().sum().to_numpy()
+        unique_counts = dataframe.nunique(dropna=True).to_numpy()
+        
+        sampled = dataframe
+        if sample_rows is not None and sample_rows < total_count:
+            rows = np.random.default_rng(0).choice(total_count, size=sample_rows, replace=False)
+            sampled = dataframe.iloc[np.sort(rows)]
+        sample_values = _leading_unique_values(sampled, unique_counts, SAMPLE_VALUE_COUNT)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            missing_pct = (missing_counts / total_count) * 100
+        
+        return pd.DataFrame({
+            'column': list(dataframe.columns),
+            'missing_count': missing_counts.astype(np.int64),
+            'total_count': total_count,
+            'missing_percentage': missing_pct.astype(np.float64),
+            'unique_values': unique_counts.astype(np.int64),
+            'sample_values': [str(values) for values in sample_values]
+        })
     
     def get_user_missing_strategy(self, 
                                  column_name: str, 
@@ -11,11 +11,44 @@ mappings to transform coded data into meaningful text.
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import Dict, Any, Optional, Union, List
+from typing import Dict, Any, Optional, Union, List, Tuple
 import warnings
 
+from wave_visualizer.utils.file_cache import FileCache
+
 warnings.filterwarnings('ignore')
 
+# Parsed metadata CSV files, shared by all converters
+_metadata_cache = FileCache("label_metadata")
+
+
+def _index_variable_labels(path: Path) -> Dict[str, str]:
+    """Parse variable_labels.csv into {variable_name: variable_label}."""
+    var_labels_df = pd.read_csv(path)
+    return dict(zip(
+        var_labels_df['variable_name'].tolist(),
+        var_labels_df['variable_label'].tolist()
+    ))
+
+
+def _index_value_labels(path: Path) -> Dict[str, Dict[Any, str]]:
+    """
+    Parse value_labels.csv into {variable_name: {value: value_label}}.
+    
+    Rows are grouped by variable in a single groupby pass, keeping the
+    variables in file order.
+    """
+    value_labels_df = pd.read_csv(path)
+    values = value_labels_df['value'].to_numpy()
+    labels = value_labels_df['value_label'].to_numpy()
+    
+    row_groups = value_labels_df.groupby('variable_name', sort=False).indices
+    return {
+        variable: dict(zip(values[rows].tolist(), labels[rows].tolist()))
+        for variable, rows in row_groups.items()
+    }
+
+
 class ValuesToLabelsConverter:
     """
     Converts coded values to human-readable labels using metadata CSV files.
@@ -49,34 +82,30 @@ class ValuesToLabelsConverter:
         """
         Load metadata from CSV files created by metadata_handler.
         
+        Parsed files are cached in memory (keyed on path, modification time and
+        size), so creating another converter for unchanged metadata is cheap.
+        
         Returns:
             bool: True if metadata loaded successfully, False otherwise
         """
         try:
             # Load variable labels
             if self.variable_labels_file.exists():
-                var_labels_df = pd.read_csv(self.variable_labels_file)
-                self.variable_labels = dict(zip(
-                    var_labels_df['variable_name'], 
-                    var_labels_df['variable_label']
-                ))
+                self.variable_labels = dict(
+                    _metadata_cache.get(self.variable_labels_file, _index_variable_labels)
+                )
                 print(f"Loaded {len(self.variable_labels)} variable labels")
             else:
                 print(f"Warning: Variable labels file not found: {self.variable_labels_file}")
                 print("Run metadata_handler first to generate metadata CSV files")
             
-            # Load value labels
+            # Load value labels (copy the per-variable mappings so edits stay
+            # local to this converter and never reach the shared cache)
             if self.value_labels_file.exists():
-                value_labels_df = pd.read_csv(self.value_labels_file)
-                
-                # Group by variable to create nested dictionary
-                for variable in value_labels_df['variable_name'].unique():
-                    var_data = value_labels_df[value_labels_df['variable_name'] == variable]
-                    self.value_labels[variable] = dict(zip(
-                        var_data['value'], 
-                        var_data['value_label']
-                    ))
-                
+                cached = _metadata_cache.get(self.value_labels_file, _index_value_labels)
+                self.value_labels = {
+                    variable: dict(labels) for variable, labels in cached.items()
+                }
                 print(f"Loaded value labels for {len(self.value_labels)} variables")
             else:
                 print(f"Warning: Value labels file not found: {self.value_labels_file}")
@@ -92,7 +121,9 @@ class ValuesToLabelsConverter:
                       column_data: pd.Series, 
                       variable_name: str,
                       keep_original: bool = False,
-                      missing_strategy: str = "keep_original") -> Union[pd.Series, pd.DataFrame]:
+                      missing_strategy: str = "keep_original",
+                      as_categorical: bool = False,
+                      verbose: bool = True) -> Union[pd.Series, pd.DataFrame]:
         """
         Convert coded values in a column to human-readable labels.
         
@@ -101,17 +132,21 @@ class ValuesToLabelsConverter:
             variable_name: Name of the variable (for looking up metadata)
             keep_original: If True, return DataFrame with both original and labeled columns
             missing_strategy: How to handle values without labels ("keep_original", "mark_missing", "drop")
+            as_categorical: If True, return a pandas Categorical with the labels as categories
+            verbose: If True, print a conversion summary for the column
             
         Returns:
             pd.Series or pd.DataFrame: Converted data with labels
         """
-        print(f"Converting column '{variable_name}' from codes to labels...")
+        if verbose:
+            print(f"Converting column '{variable_name}' from codes to labels...")
         
         # Get value labels for this variable
         value_mapping = self.value_labels.get(variable_name, {})
         
         if not value_mapping:
-            print(f"  No value labels found for '{variable_name}' - keeping original values")
+            if verbose:
+                print(f"  No value labels found for '{variable_name}' - keeping original values")
             if keep_original:
                 return pd.DataFrame({
                     f'{variable_name}_original': column_data,
@@ -120,48 +155,25 @@ class ValuesToLabelsConverter:
             else:
                 return column_data.copy()
         
-        # Create labeled column
-        labeled_column = column_data.copy()
-        
-        # Track conversion statistics
-        total_values = len(column_data)
-        converted_count = 0
-        missing_count = 0
-        
-        # Apply value mappings
-        for original_value, label in value_mapping.items():
-            mask = (column_data == original_value)
-            converted_count += mask.sum()
-            labeled_column.loc[mask] = label
-        
-        # Handle values without labels based on strategy
-        unconverted_mask = ~column_data.isin(value_mapping.keys()) & column_data.notna()
-        unconverted_count = unconverted_mask.sum()
-        
-        if unconverted_count > 0:
-            if missing_strategy == "keep_original":
-                # Keep original values for unmapped codes
-                pass  # labeled_column already has original values
-            elif missing_strategy == "mark_missing":
-                # Mark unmapped values as "Unknown"
-                labeled_column.loc[unconverted_mask] = "Unknown"
-            elif missing_strategy == "drop":
-                # This will be handled at the dataset level, not here
-                print(f"  Note: {unconverted_count} values marked for dropping (unmapped codes)")
-        
-        # Count actual missing values (NaN)
-        missing_count = column_data.isna().sum()
-        
-        # Print conversion summary
-        print(f"  Conversion summary:")
-        print(f"    - Total values: {total_values}")
-        print(f"    - Successfully converted: {converted_count}")
-        print(f"    - Unmapped codes: {unconverted_count}")
-        print(f"    - Missing (NaN): {missing_count}")
-        print(f"    - Available labels: {len(value_mapping)}")
-        
-        # Show some example mappings
-        if value_mapping:
+        labeled_column, converted_count, unconverted_count = self._map_labels(
+            column_data, value_mapping, missing_strategy, as_categorical
+        )
+        
+        if unconverted_count > 0 and missing_strategy == "drop" and verbose:
+            # This will be handled at the dataset level, not here
+            print(f"  Note: {unconverted_count} values marked for dropping (unmapped codes)")
+        
+        if verbose:
+            # Print conversion summary
+            missing_count = int(column_data.isna().sum())
+            print(f"  Conversion summary:")
+            print(f"    - Total values: {len(column_data)}")
+            print(f"    - Successfully converted: {converted_count}")
+            print(f"    - Unmapped codes: {unconverted_count}")
+            print(f"    - Missing (NaN): {missing_count}")
+            print(f"    - Available labels: {len(value_mapping)}")
+            
+            # Show some example mappings
             print(f"  Example mappings:")
             for i, (code, label) in enumerate(list(value_mapping.items())[:3]):
                 print(f"    {code} → '{label}'")
@@ -176,6 +188,125 @@ class ValuesToLabelsConverter:
         else:
             return labeled_column
     
+    def _map_labels(self,
+                    column_data: pd.Series,
+                    value_mapping: Dict[Any, str],
+                    missing_strategy: str,
+                    as_categorical: bool) -> Tuple[pd.Series, int, int]:
+        """
+        Map codes to labels in one vectorized pass.
+        
+        Args:
+            column_data: Original coded values
+            value_mapping: Code to label mapping for the variable
+            missing_strategy: How to handle values without labels
+            as_categorical: If True, return a Categorical
+            
+        Returns:
+            Tuple of (labeled Series, converted count, unmapped count)
+        """
+        # One hash lookup per row: position of each value among the labeled codes (-1 if none)
+        positions = pd.Index(list(value_mapping.keys())).get_indexer(column_data)
+        mapped = positions >= 0
+        unconverted_mask = ~mapped & column_data.notna().to_numpy()
+        converted_count = int(mapped.sum())
+        unconverted_count = int(unconverted_mask.sum())
+        
+        if as_categorical:
+            labeled_column = self._labels_to_categorical(
+                column_data, value_mapping, positions, unconverted_mask, missing_strategy
+            )
+        else:
+            # Trailing NaN slot: position -1 (unmapped or missing) takes it
+            labels = np.array(list(value_mapping.values()) + [np.nan], dtype=object)
+            values = labels[positions]
+            if unconverted_count:
+                if missing_strategy == "mark_missing":
+                    # Mark unmapped values as "Unknown"
+                    values[unconverted_mask] = "Unknown"
+                else:
+                    # Keep original values for unmapped codes
+                    values[unconverted_mask] = column_data[unconverted_mask].to_numpy(dtype=object)
+            labeled_column = pd.Series(values, index=column_data.index, name=column_data.name)
+        
+        return labeled_column, converted_count, unconverted_count
+    
+    @staticmethod
+    def _labels_to_categorical(column_data: pd.Series,
+                               value_mapping: Dict[Any, str],
+                               positions: np.ndarray,
+                               unconverted_mask: np.ndarray,
+                               missing_strategy: str) -> pd.Series:
+        """
+        Build a Categorical column straight from label positions.
+        
+        Categories are the distinct labels in metadata order. Unmapped values
+        become "Unknown" (mark_missing) or are added as extra categories.
+        
+        Args:
+            column_data: Original coded values
+            value_mapping: Code to label mapping for the variable
+            positions: Index of each value in value_mapping's keys (-1 if unmapped)
+            unconverted_mask: Non-missing values without a label
+            missing_strategy: How to handle values without labels
+            
+        Returns:
+            pd.Series: Categorical labels aligned with column_data
+        """
+        labels = pd.Index(list(value_mapping.values()), dtype=object)
+        categories = labels.unique()
+        # Several codes can share a label; map each code to its label's category
+        label_codes = categories.get_indexer(labels)
+        codes = np.where(positions >= 0, label_codes[positions], -1)
+        
+        if unconverted_mask.any():
+            if missing_strategy == "mark_missing":
+                extra = pd.Index(["Unknown"], dtype=object)
+            else:
+                extra = pd.Index(pd.unique(column_data[unconverted_mask]), dtype=object)
+            categories = categories.append(extra).unique()
+            codes[unconverted_mask] = (
+                categories.get_loc("Unknown") if missing_strategy == "mark_missing"
+                else categories.get_indexer(column_data[unconverted_mask])
+            )
+        
+        return pd.Series(pd.Categorical.from_codes(codes, categories=categories),
+                         index=column_data.index, name=column_data.name)
+    
+    def convert_dataframe(self,
+                          dataframe: pd.DataFrame,
+                          columns: Optional[List[str]] = None,
+                          missing_strategy: str = "keep_original",
+                          as_categorical: bool = False) -> pd.DataFrame:
+        """
+        Convert every labeled column of a DataFrame in one call, without per-column output.
+        
+        Args:
+            dataframe: DataFrame containing the coded data
+            columns: Columns to convert (defaults to every column with value labels)
+            missing_strategy: How to handle values without labels
+            as_categorical: If True, labeled columns are pandas Categoricals
+            
+        Returns:
+            pd.DataFrame: One '<column>_labeled' column per column with value labels,
+                          aligned with dataframe
+        """
+        if columns is None:
+            columns = [column for column in dataframe.columns if column in self.value_labels]
+        
+        converted = {}
+        for column in columns:
+            if column not in dataframe.columns or column not in self.value_labels:
+                continue
+            converted[f'{column}_labeled'], _, _ = self._map_labels(
+                dataframe[column], self.value_labels[column], missing_strategy, as_categorical
+            )
+        
+        print(f"Converted {len(converted)} columns to labels")
+        if not converted:
+            return pd.DataFrame(index=dataframe.index)
+        return pd.concat(converted, axis=1)
+    
     def convert_multiple_columns(self, 
                                 dataframe: pd.DataFrame, 
                                 columns: List[str],
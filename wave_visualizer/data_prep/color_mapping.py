@@ -11,8 +11,32 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import warnings
 
+from ..utils.file_cache import FileCache
+
 warnings.filterwarnings('ignore')
 
+# Parsed color mapping CSV files, shared by all handlers
+_color_mapping_cache = FileCache("color_mappings")
+
+
+def _index_color_mappings(path: Path) -> Dict[str, Dict[str, str]]:
+    """
+    Parse value_color_mappings.csv into {variable_name: {value_name: color_hex}}.
+    
+    Rows are grouped by variable in a single groupby pass, keeping the
+    variables in file order.
+    """
+    mappings_df = pd.read_csv(path)
+    value_names = mappings_df['value_name'].to_numpy()
+    colors = mappings_df['color_hex'].to_numpy()
+    
+    row_groups = mappings_df.groupby('variable_name', sort=False).indices
+    return {
+        variable: dict(zip(value_names[rows].tolist(), colors[rows].tolist()))
+        for variable, rows in row_groups.items()
+    }
+
+
 class ColorMappingHandler:
     """
     Handles semantic color mappings for visualization variables.
@@ -46,15 +70,11 @@ class ColorMappingHandler:
                 print("No value color mappings found - will use default schemes")
                 return True
             
-            mappings_df = pd.read_csv(self.color_mappings_file)
-            
-            # Group by variable to create nested dictionary
-            for variable in mappings_df['variable_name'].unique():
-                var_data = mappings_df[mappings_df['variable_name'] == variable]
-                self.value_color_mappings[variable] = dict(zip(
-                    var_data['value_name'], 
-                    var_data['color_hex']
-                ))
+            # Copy the cached index: add_color_mapping() edits these dictionaries
+            cached = _color_mapping_cache.get(self.color_mappings_file, _index_color_mappings)
+            self.value_color_mappings = {
+                variable: dict(mappings) for variable, mappings in cached.items()
+            }
             
             print(f"Loaded color mappings for {len(self.value_color_mappings)} variables")
             return True
@@ -144,6 +164,7 @@ class ColorMappingHandler:
             if rows:
                 mappings_df = pd.DataFrame(rows)
                 mappings_df.to_csv(self.color_mappings_file, index=False)
+                _color_mapping_cache.invalidate(self.color_mappings_file)
                 print(f"Color mappings saved: {len(rows)} entries")
             
             return True
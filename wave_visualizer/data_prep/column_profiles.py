@@ -0,0 +1,518 @@
+"""
+Column Profile Catalog for Wave Visualizer
+
+Per-column statistics of a dataset - missing counts, distinct value counts,
+the most common values and a few sample values - computed once and shared by
+the cleaning handlers and validators, which would otherwise each re-scan
+every column for nunique(), isna().sum() and value_counts().
+
+Catalogs are memoized per DataFrame object. Every column profile is kept
+with the column's change token (see utils.frame_signature), so columns added
+or replaced since are re-profiled on the next get_column_profiles() call (and
+never reported by peek_column_profiles()); values edited in place are
+re-profiled after invalidate_frame_caches(). Checking a token does not read
+the column, so a memoized catalog costs next to nothing to reuse. For the
+processed dataset the catalog is also persisted as a sidecar file next to it
+(processed_data.profile.json), tagged with the data file's fingerprint, so a
+later process reads the profile instead of scanning ~1,100 columns again. A
+sidecar whose fingerprint no longer matches the data is rebuilt on first use.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from ..utils.frame_signature import ColumnToken, column_token
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+PROFILE_SUFFIX = ".profile.json"
+
+# Bump when the layout of the sidecar changes, so old files are rebuilt
+PROFILE_FORMAT_VERSION = 3
+
+# Most common values kept per column; columns with at most this many distinct
+# values have complete value counts
+DEFAULT_TOP_K = 50
+
+# First distinct values kept per column, in order of appearance
+SAMPLE_SIZE = 10
+
+# Number of catalogs kept by get_column_profiles()
+PROFILE_CACHE_SIZE = 8
+
+
+class ColumnProfileCatalog:
+    """
+    Missing counts, distinct counts and common values of every column of a dataset.
+
+    Value counts exclude missing values and are kept in order of first
+    appearance. Columns with more than top_k distinct values keep only their
+    top_k most common values (see is_complete()).
+    """
+
+    def __init__(self, n_rows: int, profiles: Dict[str, Dict[str, Any]], top_k: int = DEFAULT_TOP_K,
+                 tokens: Optional[Dict[str, Optional[ColumnToken]]] = None):
+        """
+        Initialize the catalog.
+
+        Args:
+            n_rows: Number of rows of the profiled dataset
+            profiles: Per column: 'missing' and 'unique' counts, 'counts' (pd.Series
+                      of row counts indexed by value) and 'samples' (list of values)
+            top_k: Number of common values kept per column
+            tokens: Change tokens of the profiled columns (columns without one
+                    are treated as out of date by changed_columns())
+        """
+        self.n_rows = n_rows
+        self.top_k = top_k
+        self._profiles = profiles
+        self._tokens = dict(tokens or {})
+
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame, top_k: int = DEFAULT_TOP_K,
+                   sample_size: int = SAMPLE_SIZE,
+                   columns: Optional[Sequence[str]] = None) -> 'ColumnProfileCatalog':
+        """
+        Profile the columns of a DataFrame.
+
+        Missing counts come from one whole-frame isna().sum(); each column is
+        then factorized once, which gives its distinct count, value counts and
+        sample values together.
+
+        Args:
+            data: DataFrame to profile
+            top_k: Number of common values to keep per column
+            sample_size: Number of first distinct values to keep per column
+            columns: Only profile these columns (None profiles every column)
+
+        Returns:
+            ColumnProfileCatalog for data
+        """
+        if columns is None:
+            columns = list(data.columns)
+            missing_counts = data.isna().sum().to_numpy()
+        else:
+            missing_counts = [data[column].isna().sum() for column in columns]
+        profiles = {}
+        for position, column in enumerate(columns):
+            series = data[column]
+            codes, uniques = pd.factorize(series)
+            counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+            keep = np.arange(len(uniques))
+            if len(uniques) > top_k:
+                # Most common values, ties broken by first appearance, kept in appearance order
+                keep = np.sort(np.argsort(-counts, kind='stable')[:top_k])
+            profiles[column] = {
+                'missing': int(missing_counts[position]),
+                'unique': len(uniques),
+                'counts': pd.Series(counts[keep], index=pd.Index(uniques[keep], dtype=object)),
+                'samples': list(uniques[:sample_size].tolist()),
+            }
+        logger.debug(f"Profiled {len(profiles)} columns ({len(data):,} rows)")
+        tokens = {column: column_token(data, column) for column in columns}
+        return cls(len(data), profiles, top_k, tokens)
+
+    def changed_columns(self, data: pd.DataFrame, columns: Optional[Sequence[str]] = None) -> List[str]:
+        """
+        Find columns of a frame whose profile is missing or out of date.
+
+        Only the columns' change tokens are compared, so this does not read
+        any values.
+
+        Args:
+            data: Frame the catalog was built from
+            columns: Columns to check (None checks every column of data)
+
+        Returns:
+            List of columns that are not profiled or that were replaced (or
+            invalidated) since
+        """
+        changed = []
+        for column in data.columns if columns is None else columns:
+            token = self._tokens.get(column)
+            if column not in self._profiles or token is None or token != column_token(data, column):
+                changed.append(column)
+        return changed
+
+    def is_current(self, data: pd.DataFrame, columns: Optional[Sequence[str]] = None) -> bool:
+        """
+        Check that the catalog describes a frame's current contents.
+
+        Args:
+            data: Frame the catalog was built from
+            columns: Only check these columns (None checks every column of data)
+
+        Returns:
+            bool: True if the row count matches and no checked column changed
+        """
+        return len(data) == self.n_rows and not self.changed_columns(data, columns)
+
+    def refresh(self, data: pd.DataFrame, columns: Optional[Sequence[str]] = None) -> 'ColumnProfileCatalog':
+        """
+        Bring the catalog up to date with a frame, re-profiling only changed columns.
+
+        Args:
+            data: Frame the catalog was built from
+            columns: Only bring these columns up to date (None updates every
+                     column of data and drops columns it no longer has)
+
+        Returns:
+            ColumnProfileCatalog of data's current columns (self if nothing changed)
+        """
+        if len(data) != self.n_rows:
+            return self.from_frame(data, self.top_k)
+        changed = self.changed_columns(data, columns)
+        order = list(data.columns) if columns is None else self.columns + [
+            column for column in changed if column not in self._profiles]
+        if not changed and order == self.columns:
+            return self
+
+        logger.debug(f"Re-profiling {len(changed)} changed columns")
+        updated = self.from_frame(data, self.top_k, columns=changed)
+        profiles = {column: (updated if column in updated else self)._profiles[column] for column in order}
+        tokens = {column: (updated if column in updated else self)._tokens.get(column) for column in order}
+        return ColumnProfileCatalog(self.n_rows, profiles, self.top_k, tokens)
+
+    @property
+    def columns(self) -> List[str]:
+        """Profiled column names."""
+        return list(self._profiles)
+
+    def __contains__(self, column: Hashable) -> bool:
+        return column in self._profiles
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def __repr__(self) -> str:
+        return f"ColumnProfileCatalog({len(self)} columns, {self.n_rows:,} rows)"
+
+    @property
+    def missing_counts(self) -> pd.Series:
+        """Missing values per column."""
+        return pd.Series({column: profile['missing'] for column, profile in self._profiles.items()},
+                         dtype=np.int64)
+
+    @property
+    def unique_counts(self) -> pd.Series:
+        """Distinct non-missing values per column (as Series.nunique())."""
+        return pd.Series({column: profile['unique'] for column, profile in self._profiles.items()},
+                         dtype=np.int64)
+
+    def missing_count(self, column: str) -> int:
+        """Missing values in a column."""
+        return self._profiles[column]['missing']
+
+    def unique_count(self, column: str) -> int:
+        """Distinct non-missing values in a column."""
+        return self._profiles[column]['unique']
+
+    def is_complete(self, column: str) -> bool:
+        """Whether the column's value counts cover every distinct value."""
+        profile = self._profiles[column]
+        return len(profile['counts']) == profile['unique']
+
+    def value_counts(self, column: str, sort: bool = True) -> pd.Series:
+        """
+        Get the row counts of a column's (most common) non-missing values.
+
+        Args:
+            column: Profiled column
+            sort: Order by descending count (ties in order of appearance);
+                  False keeps order of first appearance
+
+        Returns:
+            pd.Series of counts indexed by value (only the top_k most common
+            values unless is_complete(column))
+        """
+        counts = self._profiles[column]['counts']
+        if sort:
+            counts = counts.sort_values(ascending=False, kind='stable')
+        return counts.copy()
+
+    def unique_values(self, column: str) -> Optional[List[Any]]:
+        """
+        Get a column's distinct non-missing values in order of first appearance.
+
+        Returns:
+            List of values (as Series.unique()), or None if the column has more
+            than top_k distinct values
+        """
+        if not self.is_complete(column):
+            return None
+        return self._profiles[column]['counts'].index.tolist()
+
+    def sample_values(self, column: str, n: int = SAMPLE_SIZE) -> List[Any]:
+        """Get up to n of a column's first distinct non-missing values."""
+        return self._profiles[column]['samples'][:n]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to JSON-compatible primitives."""
+        return {
+            'n_rows': self.n_rows,
+            'top_k': self.top_k,
+            'columns': {
+                str(column): {
+                    'missing': profile['missing'],
+                    'unique': profile['unique'],
+                    'values': profile['counts'].index.tolist(),
+                    'counts': profile['counts'].tolist(),
+                    'samples': profile['samples'],
+                }
+                for column, profile in self._profiles.items()
+            }
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any],
+                  tokens: Optional[Dict[str, Optional[ColumnToken]]] = None) -> 'ColumnProfileCatalog':
+        """
+        Rebuild a catalog from to_dict() output.
+
+        Args:
+            payload: to_dict() output
+            tokens: Change tokens of the columns of the frame the payload
+                    describes (None treats every column as out of date)
+        """
+        profiles = {
+            column: {
+                'missing': entry['missing'],
+                'unique': entry['unique'],
+                'counts': pd.Series(entry['counts'], index=pd.Index(entry['values'], dtype=object),
+                                    dtype=np.int64),
+                'samples': entry['samples'],
+            }
+            for column, entry in payload['columns'].items()
+        }
+        return cls(payload['n_rows'], profiles, payload.get('top_k', DEFAULT_TOP_K), tokens)
+
+
+def get_profile_path(data_path: Union[str, Path]) -> Path:
+    """
+    Get the sidecar path of a processed data file's column profiles.
+
+    Args:
+        data_path: Path of the processed data (CSV) file
+
+    Returns:
+        Path: processed_data.profile.json next to the data file
+    """
+    return Path(data_path).with_suffix(PROFILE_SUFFIX)
+
+
+def save_column_profiles(catalog: ColumnProfileCatalog, data_path: Union[str, Path],
+                         fingerprint: str) -> Optional[Path]:
+    """
+    Write a catalog as the sidecar of a processed data file.
+
+    Args:
+        catalog: Profiles of the data file's contents
+        data_path: Path of the processed data file
+        fingerprint: processed_data_fingerprint() of the profiled contents
+
+    Returns:
+        Path of the sidecar, or None if it could not be written
+    """
+    path = get_profile_path(data_path)
+    payload = {'version': PROFILE_FORMAT_VERSION, 'fingerprint': fingerprint, **catalog.to_dict()}
+    try:
+        # Write then rename, so readers never see a partial file
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, default=str)
+        os.replace(tmp_name, path)
+    except OSError as e:
+        logger.warning(f"Could not write column profiles: {e}")
+        return None
+    logger.debug(f"Column profiles written: {path}")
+    return path
+
+
+def load_column_profiles(data_path: Union[str, Path],
+                         fingerprint: Optional[str] = None,
+                         tokens: Optional[Dict[str, Optional[ColumnToken]]] = None
+                         ) -> Optional[ColumnProfileCatalog]:
+    """
+    Read the sidecar of a processed data file if it describes the current contents.
+
+    Args:
+        data_path: Path of the processed data file
+        fingerprint: Expected data fingerprint (defaults to the file's current one)
+        tokens: Change tokens of the columns of the frame loaded from the
+                file, for ColumnProfileCatalog.from_dict()
+
+    Returns:
+        ColumnProfileCatalog, or None if the sidecar is missing, unreadable or stale
+    """
+    if fingerprint is None:
+        from .data_loader import processed_data_fingerprint
+        fingerprint = processed_data_fingerprint(data_path)
+
+    path = get_profile_path(data_path)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.debug(f"Ignoring unreadable column profiles {path.name}: {e}")
+        return None
+
+    if payload.get('version') != PROFILE_FORMAT_VERSION or payload.get('fingerprint') != fingerprint:
+        logger.debug(f"Column profiles {path.name} are stale")
+        return None
+    return ColumnProfileCatalog.from_dict(payload, tokens)
+
+
+# LRU of catalogs keyed on DataFrame identity
+_profile_cache: 'OrderedDict[Hashable, Tuple[weakref.ref, ColumnProfileCatalog]]' = OrderedDict()
+# Sidecar (data path, fingerprint) of frames loaded from processed data files,
+# with the change tokens of their columns as loaded
+_profile_sources: Dict[Hashable, Tuple[weakref.ref, Path, str, Dict[str, Optional[ColumnToken]]]] = {}
+_profile_lock = threading.RLock()
+
+
+def register_profile_source(data: pd.DataFrame, data_path: Union[str, Path], fingerprint: str) -> None:
+    """
+    Record that a frame holds the full contents of a processed data file.
+
+    The frame's catalog is then read from (or written to) the file's sidecar
+    by get_column_profiles() instead of being computed every process. Columns
+    replaced after loading are re-profiled from the frame rather than taken
+    from the sidecar.
+
+    Args:
+        data: DataFrame loaded from data_path
+        data_path: Path of the processed data file
+        fingerprint: processed_data_fingerprint() of the loaded contents
+    """
+    with _profile_lock:
+        entry = _profile_sources.get(id(data))
+        if entry is not None and entry[0]() is data and entry[1:3] == (Path(data_path), fingerprint):
+            # Already registered when first loaded
+            return
+        tokens = {column: column_token(data, column) for column in data.columns}
+        _profile_sources[id(data)] = (weakref.ref(data), Path(data_path), fingerprint, tokens)
+        # Drop entries of frames that no longer exist
+        for key in [key for key, entry in _profile_sources.items() if entry[0]() is None]:
+            del _profile_sources[key]
+
+
+def _cached_profiles(data: pd.DataFrame) -> Optional[ColumnProfileCatalog]:
+    """Get the memoized catalog of a frame, current or not."""
+    with _profile_lock:
+        entry = _profile_cache.get(id(data))
+        if entry is not None and entry[0]() is data:
+            _profile_cache.move_to_end(id(data))
+            return entry[1]
+    return None
+
+
+def peek_column_profiles(data: pd.DataFrame,
+                         columns: Optional[Sequence[str]] = None) -> Optional[ColumnProfileCatalog]:
+    """
+    Get the catalog of a frame if one was already built or loaded and is current.
+
+    Args:
+        data: Profiled DataFrame
+        columns: Columns the caller will read (None requires every column of
+                 data to be current)
+
+    Returns:
+        ColumnProfileCatalog, or None if there is none or the frame's rows or
+        any of the columns changed since it was built
+    """
+    catalog = _cached_profiles(data)
+    if catalog is None or not catalog.is_current(data, columns):
+        return None
+    return catalog
+
+
+def get_column_profiles(data: pd.DataFrame, columns: Optional[Sequence[str]] = None) -> ColumnProfileCatalog:
+    """
+    Get the column profiles of a DataFrame, computing them once.
+
+    Catalogs are memoized per DataFrame object; columns replaced since (or
+    every column, after invalidate_frame_caches()) are re-profiled, see
+    ColumnProfileCatalog.refresh(). A frame returned by load_processed_data()
+    reads its catalog from the sidecar file when the sidecar matches the data,
+    and writes it there otherwise.
+
+    Args:
+        data: DataFrame to profile
+        columns: Columns the caller will read; only these are checked and
+                 brought up to date (None checks every column). Profiles of
+                 other columns may then be out of date.
+
+    Returns:
+        ColumnProfileCatalog for data
+    """
+    catalog = _cached_profiles(data)
+    if catalog is not None:
+        refreshed = catalog.refresh(data, columns)
+        if refreshed is not catalog:
+            _remember_profiles(data, refreshed)
+        return refreshed
+
+    with _profile_lock:
+        source = _profile_sources.get(id(data))
+    if source is not None and source[0]() is not data:
+        source = None
+
+    if source is not None:
+        _, data_path, fingerprint, loaded_tokens = source
+        stored = load_column_profiles(data_path, fingerprint, loaded_tokens)
+        if stored is not None and list(map(str, data.columns)) != stored.columns:
+            stored = None
+        if stored is not None:
+            # Columns replaced since loading are profiled from the frame
+            catalog = stored.refresh(data, columns)
+        else:
+            catalog = ColumnProfileCatalog.from_frame(data)
+            # Only the file's own contents belong in its sidecar
+            if not _changed_since_loading(data, loaded_tokens):
+                save_column_profiles(catalog, data_path, fingerprint)
+    else:
+        catalog = ColumnProfileCatalog.from_frame(data)
+
+    _remember_profiles(data, catalog)
+    return catalog
+
+
+def _changed_since_loading(data: pd.DataFrame, loaded_tokens: Dict[str, Optional[ColumnToken]]) -> bool:
+    """Check whether any column of a loaded frame was added, removed or replaced since loading."""
+    if list(data.columns) != list(loaded_tokens):
+        return True
+    return any(token is None or token != column_token(data, column) for column, token in loaded_tokens.items())
+
+
+def _remember_profiles(data: pd.DataFrame, catalog: ColumnProfileCatalog) -> None:
+    """Memoize a frame's catalog, evicting the least recently used ones."""
+    with _profile_lock:
+        _profile_cache[id(data)] = (weakref.ref(data), catalog)
+        _profile_cache.move_to_end(id(data))
+        while len(_profile_cache) > PROFILE_CACHE_SIZE:
+            _profile_cache.popitem(last=False)
+
+
+def clear_column_profile_cache() -> int:
+    """
+    Drop all memoized catalogs (sidecar files are kept).
+
+    Returns:
+        int: Number of entries removed
+    """
+    with _profile_lock:
+        removed = len(_profile_cache)
+        _profile_cache.clear()
+    return removed
@@ -0,0 +1,494 @@
+"""
+Processed Data Loader for Wave Visualizer
+
+Single entry point for reading and writing the cleaned dataset produced by the
+cleaning pipeline. Every visualization function loads its default data through
+here, so a file is parsed once per process and later calls reuse the same frame.
+
+The dataset is stored as CSV and, when pyarrow is installed, as a Parquet file
+next to it. The Parquet copy keeps categorical dtypes and lets callers read
+only the columns they need (e.g. two wave columns and a filter column instead
+of all ~1,100 survey variables). Text columns load as categoricals from either
+file, so filtering and transition counting work on small integer codes.
+
+The cache is keyed on the file's path, modification time and size, so
+re-running the cleaning pipeline is picked up automatically. Use
+invalidate_data_cache() or refresh_processed_data() to force a re-read.
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Union
+
+import pandas as pd
+
+from ..exceptions import ColumnNotFoundError, DataLoadingError
+from ..utils.file_cache import FileCache, file_signature
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+PROCESSED_DATA_FILENAME = "processed_data.csv"
+COLUMNAR_SUFFIX = ".parquet"
+
+# Process-wide caches of parsed processed-data files and their column lists
+_data_cache = FileCache("processed_data")
+_columns_cache = FileCache("processed_data_columns")
+
+
+def get_processed_data_path() -> Path:
+    """
+    Get the default location of the processed dataset.
+
+    Returns:
+        Path: settings/processed_data.csv inside the package
+    """
+    from wave_visualizer.settings import SETTINGS_DIR
+    return SETTINGS_DIR / PROCESSED_DATA_FILENAME
+
+
+def columnar_support_available() -> bool:
+    """
+    Check whether the optional pyarrow dependency is installed.
+
+    Returns:
+        bool: True if Parquet files can be read and written
+    """
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def get_columnar_path(data_path: Union[str, Path]) -> Path:
+    """
+    Get the Parquet companion path for a processed data file.
+
+    Args:
+        data_path: Path to the CSV (or Parquet) processed data file
+
+    Returns:
+        Path: Same location with a .parquet suffix
+    """
+    return Path(data_path).with_suffix(COLUMNAR_SUFFIX)
+
+
+def _resolve_source(path: Path) -> Path:
+    """
+    Pick the file to read for a processed data path.
+
+    The Parquet companion is preferred when it exists, pyarrow is available and
+    it is at least as new as the CSV, so a stale Parquet file left over from an
+    older pipeline run is never read in place of fresh CSV output.
+    """
+    if path.suffix.lower() == COLUMNAR_SUFFIX:
+        return path
+
+    columnar_path = get_columnar_path(path)
+    if not columnar_path.exists() or not columnar_support_available():
+        return path
+    if path.exists() and columnar_path.stat().st_mtime_ns < path.stat().st_mtime_ns:
+        logger.debug(f"Ignoring stale columnar file: {columnar_path}")
+        return path
+    return columnar_path
+
+
+def _read_processed_file(path: Path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Parse a processed data file from disk (cache miss path)."""
+    logger.debug(f"Reading processed data from disk: {path} "
+                 f"({'all' if columns is None else len(columns)} columns)")
+    if path.suffix.lower() == COLUMNAR_SUFFIX:
+        return pd.read_parquet(path, columns=columns)
+    data = pd.read_csv(path, usecols=columns)
+    # usecols keeps file order; return the caller's order like read_parquet does
+    if columns is not None:
+        data = data[columns]
+    # Text columns become categoricals, as they are in the Parquet file
+    return to_columnar_frame(data)
+
+
+def _read_column_names(path: Path) -> List[str]:
+    """Read only the column names of a processed data file."""
+    if path.suffix.lower() == COLUMNAR_SUFFIX:
+        import pyarrow.parquet as pq
+        return [name for name in pq.read_schema(path).names
+                if not name.startswith('__index_level_')]
+    return pd.read_csv(path, nrows=0).columns.tolist()
+
+
+def get_processed_columns(data_path: Optional[Union[str, Path]] = None) -> List[str]:
+    """
+    List the columns of the processed dataset without loading its values.
+
+    Args:
+        data_path: Path to the processed data file (defaults to settings/processed_data.csv)
+
+    Returns:
+        List[str]: Column names in file order
+
+    Raises:
+        DataLoadingError: If the file is missing or cannot be parsed
+    """
+    path = Path(data_path) if data_path is not None else get_processed_data_path()
+    source = _resolve_source(path)
+    try:
+        return list(_columns_cache.get(source, _read_column_names))
+    except FileNotFoundError:
+        raise DataLoadingError(
+            "Processed data file not found. Please run the data cleaning pipeline first.",
+            f"Expected file: {path}"
+        )
+    except Exception as e:
+        raise DataLoadingError(f"Failed to read processed data columns: {str(e)}")
+
+
+def processed_data_fingerprint(data_path: Optional[Union[str, Path]] = None) -> Optional[str]:
+    """
+    Identify the current contents of the processed dataset without reading it.
+
+    The fingerprint covers the file load_processed_data() would read (the
+    Parquet companion or the CSV) and its modification time and size, so it
+    changes whenever the cleaning pipeline rewrites the data.
+
+    Args:
+        data_path: Path to the processed data file (defaults to settings/processed_data.csv)
+
+    Returns:
+        str: Hex digest, or None if the file does not exist
+    """
+    path = Path(data_path) if data_path is not None else get_processed_data_path()
+    signature = file_signature(_resolve_source(path))
+    if signature is None:
+        return None
+    return hashlib.sha256(repr(signature).encode()).hexdigest()
+
+
+def load_processed_data(data_path: Optional[Union[str, Path]] = None,
+                        columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """
+    Load the processed dataset, reusing the in-memory copy when the file is unchanged.
+
+    The returned DataFrame is shared between callers and must be treated as
+    read-only; filter or copy it before modifying.
+
+    Args:
+        data_path: Path to the processed data file (defaults to settings/processed_data.csv)
+        columns: Only load these columns (None loads every column). Projection is
+                 cheapest with the Parquet companion file, which is read column by column.
+
+    Returns:
+        pd.DataFrame: The processed dataset (or the requested columns of it)
+
+    Raises:
+        DataLoadingError: If the file is missing or cannot be parsed
+        ColumnNotFoundError: If a requested column does not exist in the file
+    """
+    path = Path(data_path) if data_path is not None else get_processed_data_path()
+    source = _resolve_source(path)
+
+    try:
+        if columns is None:
+            data = _data_cache.get(source, _read_processed_file)
+            # Column profiles of the full frame live in a sidecar next to the data
+            from .column_profiles import register_profile_source
+            register_profile_source(data, path, processed_data_fingerprint(path))
+            return data
+
+        # Deduplicate while keeping the caller's order
+        requested = list(dict.fromkeys(columns))
+        available = get_processed_columns(path)
+        missing = [column for column in requested if column not in available]
+        if missing:
+            raise ColumnNotFoundError(column_name=missing[0], available_columns=available)
+
+        # A fully loaded frame already holds every column; slice it instead of
+        # reading again. The slice is cached too, so repeated requests return
+        # the same frame (and reuse results memoized on it).
+        full_data = _data_cache.peek(source)
+
+        def slice_full_data(file_path: Path) -> pd.DataFrame:
+            return full_data[requested]
+
+        def read_columns(file_path: Path) -> pd.DataFrame:
+            return _read_processed_file(file_path, requested)
+
+        loader = slice_full_data if full_data is not None else read_columns
+        return _data_cache.get(source, loader, key=tuple(requested))
+    except FileNotFoundError:
+        raise DataLoadingError(
+            "Processed data file not found. Please run the data cleaning pipeline first.",
+            f"Expected file: {path}"
+        )
+    except (DataLoadingError, ColumnNotFoundError):
+        raise
+    except Exception as e:
+        raise DataLoadingError(f"Failed to load processed data: {str(e)}")
+
+
+def _text_categorical(series: pd.Series) -> pd.Series:
+    """
+    Make a categorical's categories all text, keeping their order.
+
+    Labeled columns can carry leftover numeric codes as extra categories
+    (e.g. 9.0 next to 'Democrat'); Parquet dictionaries need one type, so
+    those are renamed to their CSV text ('9.0').
+    """
+    categories = series.cat.categories
+    if categories.inferred_type in ('string', 'empty'):
+        return series
+    text = categories.astype(str)
+    if text.is_unique:
+        return series.cat.rename_categories(text)
+    return series.astype(object).where(series.notna(), series.astype(str)).astype('category')
+
+
+def to_columnar_frame(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Prepare a processed DataFrame for columnar storage.
+
+    Object columns are stored the way a CSV round trip would read them back:
+    numeric-only columns become floats and text columns become categoricals
+    (one small integer code per row instead of a Python string). Columns that
+    are already categorical keep their categories and order, with any
+    non-text categories written as text.
+
+    Args:
+        data: Processed dataset
+
+    Returns:
+        pd.DataFrame: Frame with Parquet-compatible, compact column dtypes
+    """
+    converted = {}
+    for column in data.columns:
+        series = data[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            text_series = _text_categorical(series)
+            if text_series is not series:
+                converted[column] = text_series
+            continue
+        if series.dtype != object:
+            continue
+
+        kind = pd.api.types.infer_dtype(series, skipna=True)
+        if kind in ('floating', 'integer', 'mixed-integer-float', 'empty'):
+            converted[column] = pd.to_numeric(series, errors='coerce')
+        elif kind in ('date', 'datetime', 'time', 'boolean', 'bytes'):
+            continue
+        else:
+            # Mixed labels and leftover codes are written as text, matching CSV
+            text = series.where(series.isna(), series.astype(str))
+            converted[column] = text.astype('category')
+
+    if not converted:
+        return data
+    return data.assign(**converted)
+
+
+def save_columnar_data(data: pd.DataFrame, data_path: Union[str, Path]) -> Optional[Path]:
+    """
+    Write the Parquet companion file for a processed dataset.
+
+    Args:
+        data: Processed dataset
+        data_path: Path of the CSV output (the .parquet file is written next to it)
+
+    Returns:
+        Path of the written file, or None if pyarrow is not installed
+    """
+    if not columnar_support_available():
+        logger.warning("pyarrow not installed - skipping columnar output "
+                       "(install with: pip install wave-visualizer[columnar])")
+        return None
+
+    columnar_path = get_columnar_path(data_path)
+    to_columnar_frame(data).to_parquet(columnar_path, index=False)
+    logger.debug(f"Columnar data written: {columnar_path}")
+    return columnar_path
+
+
+class ColumnarDataWriter:
+    """
+    Append processed data to a Parquet file one chunk at a time.
+
+    Used by the streaming cleaning pipeline, so the processed dataset is never
+    held in memory as a whole. Each chunk becomes one row group. The schema is
+    fixed by the first chunk; object columns, and any column listed in
+    text_columns, are stored as dictionary-encoded text so chunks with
+    different mixes of labels and codes share one schema. Categorical chunks
+    are written with their categories as the dictionary, so a label order
+    shared by every chunk is kept in the file. Text columns that turn out to
+    hold only numbers in every chunk are converted back to floats by close(),
+    matching to_columnar_frame().
+
+    The file is written to a temporary path and moved into place by close().
+
+    Example:
+        with ColumnarDataWriter(output_file, text_columns=derived) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+    """
+
+    def __init__(self, data_path: Union[str, Path], text_columns: Iterable[str] = ()):
+        """
+        Initialize the writer.
+
+        Args:
+            data_path: Path of the CSV output (the .parquet file is written next to it)
+            text_columns: Columns to store as text regardless of the first chunk's dtype
+        """
+        if not columnar_support_available():
+            raise DataLoadingError(
+                "pyarrow is required for columnar output",
+                "Install with: pip install wave-visualizer[columnar]"
+            )
+        self.path = get_columnar_path(data_path)
+        self.text_columns = set(text_columns)
+        self.rows_written = 0
+        self._temp_path = self.path.with_name(self.path.name + ".tmp")
+        self._schema = None
+        self._writer = None
+        self._numeric_text = None
+
+    def __enter__(self) -> 'ColumnarDataWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _text_column(self, series: pd.Series) -> pd.Series:
+        """Render a column as text the way a CSV round trip would."""
+        return series.where(series.isna(), series.astype(str)).astype(object)
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        """
+        Append a chunk of rows.
+
+        Args:
+            chunk: Rows to append; must have the same columns as the first chunk
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        text = [column for column in chunk.columns
+                if column in self.text_columns or chunk[column].dtype == object
+                or isinstance(chunk[column].dtype, pd.CategoricalDtype)]
+        if self._numeric_text is None:
+            self._numeric_text = set(text)
+        for column in list(self._numeric_text):
+            kind = pd.api.types.infer_dtype(chunk[column], skipna=True)
+            if kind not in ('floating', 'integer', 'mixed-integer-float', 'empty'):
+                self._numeric_text.discard(column)
+        if text:
+            chunk = chunk.assign(**{
+                column: _text_categorical(chunk[column])
+                if isinstance(chunk[column].dtype, pd.CategoricalDtype) else self._text_column(chunk[column])
+                for column in text
+            })
+
+        if self._writer is None:
+            inferred = pa.Schema.from_pandas(chunk, preserve_index=False)
+            text_type = pa.dictionary(pa.int32(), pa.string())
+            self._schema = pa.schema([
+                pa.field(field.name, text_type) if field.name in text else field.remove_metadata()
+                for field in inferred
+            ])
+            self._writer = pq.ParquetWriter(self._temp_path, self._schema)
+
+        self._writer.write_table(pa.Table.from_pandas(chunk, schema=self._schema, preserve_index=False))
+        self.rows_written += len(chunk)
+
+    def close(self, drop_columns: Sequence[str] = ()) -> Path:
+        """
+        Finish the file and move it into place.
+
+        Args:
+            drop_columns: Columns to leave out of the final file (the file is
+                          copied row group by row group, so memory stays bounded)
+
+        Returns:
+            Path of the written Parquet file
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self._writer is None:
+            raise DataLoadingError("No data was written to the columnar output")
+        self._writer.close()
+        self._writer = None
+
+        drop = set(drop_columns)
+        numeric = self._numeric_text - drop
+        if drop or numeric:
+            # Copy row group by row group, leaving out dropped columns and
+            # turning all-numeric text columns back into floats
+            keep = [name for name in self._schema.names if name not in drop]
+            schema = pa.schema([
+                pa.field(name, pa.float64()) if name in numeric else self._schema.field(name)
+                for name in keep
+            ])
+            source = pq.ParquetFile(self._temp_path)
+            rewritten_path = self._temp_path.with_name(self._temp_path.name + ".rewrite")
+            with pq.ParquetWriter(rewritten_path, schema) as writer:
+                for group in range(source.num_row_groups):
+                    table = source.read_row_group(group, columns=keep)
+                    for name in numeric:
+                        index = table.schema.get_field_index(name)
+                        values = table.column(index).cast(pa.string()).cast(pa.float64())
+                        table = table.set_column(index, schema.field(name), values)
+                    writer.write_table(table)
+            source.close()
+            rewritten_path.replace(self._temp_path)
+
+        self._temp_path.replace(self.path)
+        logger.debug(f"Columnar data written: {self.path} ({self.rows_written:,} rows)")
+        return self.path
+
+    def abort(self) -> None:
+        """Discard a partially written file."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self._temp_path.unlink(missing_ok=True)
+
+
+def invalidate_data_cache(data_path: Optional[Union[str, Path]] = None) -> int:
+    """
+    Clear cached processed data.
+
+    Args:
+        data_path: Only clear this file's entries (None clears the whole cache)
+
+    Returns:
+        int: Number of cache entries removed
+    """
+    if data_path is None:
+        removed = _data_cache.invalidate()
+        _columns_cache.invalidate()
+    else:
+        removed = 0
+        for path in (Path(data_path), get_columnar_path(data_path)):
+            removed += _data_cache.invalidate(path)
+            _columns_cache.invalidate(path)
+    logger.debug(f"Processed data cache cleared ({removed} entries)")
+    return removed
+
+
+def refresh_processed_data(data_path: Optional[Union[str, Path]] = None,
+                           columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """
+    Drop any cached copy of the processed dataset and load it again from disk.
+
+    Args:
+        data_path: Path to the processed data file (defaults to settings/processed_data.csv)
+        columns: Only load these columns (None loads every column)
+
+    Returns:
+        pd.DataFrame: The freshly loaded dataset
+    """
+    path = Path(data_path) if data_path is not None else get_processed_data_path()
+    invalidate_data_cache(path)
+    return load_processed_data(path, columns=columns)
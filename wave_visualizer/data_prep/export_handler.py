@@ -3,20 +3,285 @@ Export Handler for Wave Visualizer
 
 Handles exporting visualizations to both HTML and image formats
 in an 'exports' folder relative to the calling script.
+
+Every exported file is recorded in exports/.fingerprints.json with a hash of
+the figure's JSON payload and the export options. Exporting a figure that is
+identical to the one already on disk skips both the HTML write and the
+Kaleido render.
+
+export_figures() exports a batch of figures through one ImageRenderer, which
+keeps a Kaleido browser open for the whole batch instead of starting one per
+image, and reports how long each figure took.
+
+HTML exports embed plotly.js (~3.5 MB) in every file by default. With
+include_plotlyjs='directory' they reference one shared plotly.min.js in the
+exports folder instead, and export_report() writes several figures into a
+single HTML page that loads plotly.js once.
 """
 
 import os
+import json
+import time
+import asyncio
+import hashlib
+import html
 import inspect
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+import plotly
 import plotly.io as pio
 import plotly.graph_objects as go
+from plotly.basedatatypes import BaseFigure
+from plotly.offline import get_plotlyjs
+from plotly.utils import PlotlyJSONEncoder
 from ..utils.logger import get_logger
 from ..exceptions import ExportError, handle_exception
 from ..validators import ParameterValidator, sanitize_filename
 
 logger = get_logger(__name__)
 
+# Manifest of exported files and the fingerprints they were written from
+FINGERPRINT_FILENAME = ".fingerprints.json"
+
+# Shared plotly.js bundle referenced by HTML exports in 'directory' mode
+PLOTLYJS_FILENAME = "plotly.min.js"
+
+# How an HTML export loads plotly.js: embedded, shared file, or CDN
+PLOTLYJS_MODES = (True, 'directory', 'cdn')
+
+# Options passed to the writer of each format (part of the fingerprint)
+EXPORT_OPTIONS: Dict[str, Dict[str, Any]] = {
+    'html': {},
+    'png': {'width': 1200, 'height': 800, 'scale': 2},
+    'svg': {},
+    'pdf': {},
+}
+
+
+def _dict_fingerprint(fig_dict: Dict[str, Any]) -> Optional[str]:
+    """Hash a figure dict's canonical JSON form (None if it cannot be serialized)."""
+    try:
+        payload = json.dumps(fig_dict, cls=PlotlyJSONEncoder, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def figure_fingerprint(fig: go.Figure) -> Optional[str]:
+    """
+    Hash a figure's full JSON payload (data, layout, frames).
+    
+    Args:
+        fig: Plotly figure object
+        
+    Returns:
+        str: SHA-256 hex digest, or None if fig is not a plotly figure or cannot be serialized
+    """
+    if not isinstance(fig, BaseFigure):
+        return None
+    return _dict_fingerprint(fig.to_dict())
+
+
+def _format_options(include_plotlyjs: Union[bool, str] = True) -> Dict[str, Dict[str, Any]]:
+    """
+    Get the writer options of every format for an HTML plotly.js mode.
+    
+    Args:
+        include_plotlyjs: One of PLOTLYJS_MODES
+        
+    Returns:
+        dict: Format -> writer options
+        
+    Raises:
+        ExportError: If include_plotlyjs is not a supported mode
+    """
+    if include_plotlyjs is not True and include_plotlyjs not in PLOTLYJS_MODES[1:]:
+        raise ExportError(PLOTLYJS_FILENAME, 'html',
+                          ValueError(f"Unsupported include_plotlyjs. Valid modes: {list(PLOTLYJS_MODES)}"))
+    if include_plotlyjs is True:
+        return EXPORT_OPTIONS
+    return {**EXPORT_OPTIONS, 'html': {**EXPORT_OPTIONS['html'], 'include_plotlyjs': include_plotlyjs}}
+
+
+class _FigurePayload:
+    """A figure's dict and fingerprint, built once and shared by every export format."""
+    
+    def __init__(self, fig: go.Figure) -> None:
+        self.figure = fig
+        self.fig_dict = fig.to_dict() if isinstance(fig, BaseFigure) else None
+        self.digest = _dict_fingerprint(self.fig_dict) if self.fig_dict is not None else None
+    
+    def write_html(self, filepath: str, **options: Any) -> None:
+        if self.fig_dict is None:
+            self.figure.write_html(filepath, **options)
+        else:
+            pio.write_html(self.fig_dict, filepath, validate=False, **options)
+    
+    def to_html(self, **options: Any) -> str:
+        if self.fig_dict is None:
+            return self.figure.to_html(**options)
+        return pio.to_html(self.fig_dict, validate=False, **options)
+    
+    def write_image(self, filepath: str, **options: Any) -> None:
+        if self.fig_dict is None:
+            self.figure.write_image(filepath, **options)
+        else:
+            pio.write_image(self.fig_dict, filepath, validate=False, **options)
+
+
+def _export_fingerprint(figure_digest: str, format_type: str,
+                        options: Optional[Dict[str, Any]] = None) -> str:
+    """Combine a figure digest with a format's writer options and the plotly version."""
+    if options is None:
+        options = EXPORT_OPTIONS[format_type]
+    options = json.dumps({'format': format_type, 'options': options,
+                          'plotly': plotly.__version__}, sort_keys=True)
+    return hashlib.sha256(f"{figure_digest}\0{options}".encode()).hexdigest()
+
+
+class ImageRenderer:
+    """
+    Kaleido browser kept open across image exports.
+    
+    fig.write_image() starts and stops a headless browser for every image.
+    Inside a `with ImageRenderer():` block the browser is started once, on
+    the first render, and every image is rendered by it. Requires Kaleido
+    v1+; otherwise (or if the browser cannot be started) render() falls back
+    to fig.write_image().
+    """
+    
+    def __init__(self, n_workers: int = 1, timeout: float = 90) -> None:
+        """
+        Initialize the renderer (the browser is started on first use).
+        
+        Args:
+            n_workers: Number of browser tabs rendering concurrently
+            timeout: Seconds to wait for one render
+        """
+        self.n_workers = max(1, int(n_workers))
+        self.timeout = timeout
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped: Optional[asyncio.Event] = None
+        self._kaleido = None
+        self._failed = False
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def supported() -> bool:
+        """Check for Kaleido v1+ (a persistent browser API) and plotly export defaults."""
+        try:
+            import kaleido
+        except ImportError:
+            return False
+        return hasattr(kaleido, 'Kaleido') and hasattr(pio, 'defaults')
+    
+    @property
+    def running(self) -> bool:
+        """Whether the browser is open."""
+        return self._kaleido is not None
+    
+    def start(self) -> bool:
+        """
+        Open the browser if it is not open yet.
+        
+        Returns:
+            bool: True if renders go through the warm browser
+        """
+        with self._lock:
+            if self._kaleido is not None:
+                return True
+            if self._failed or not self.supported():
+                return False
+            
+            import kaleido
+            ready: Future = Future()
+            loop = asyncio.new_event_loop()
+            
+            async def serve() -> None:
+                self._stopped = asyncio.Event()
+                try:
+                    async with kaleido.Kaleido(n=self.n_workers, timeout=self.timeout) as renderer:
+                        ready.set_result(renderer)
+                        await self._stopped.wait()
+                except Exception as e:
+                    if not ready.done():
+                        ready.set_exception(e)
+                    else:
+                        logger.warning(f"Image renderer stopped with an error: {e}")
+            
+            thread = threading.Thread(target=loop.run_until_complete, args=(serve(),),
+                                      name="wave-visualizer-renderer", daemon=True)
+            thread.start()
+            try:
+                self._kaleido = ready.result(timeout=self.timeout)
+            except Exception as e:
+                thread.join()
+                loop.close()
+                self._failed = True
+                logger.warning(f"Could not start image renderer, exporting images one by one: {e}")
+                return False
+            
+            self._loop, self._thread = loop, thread
+            logger.debug(f"Image renderer started ({self.n_workers} tab(s))")
+            return True
+    
+    def render(self, fig: go.Figure, filepath: str, format_type: str, **options: Any) -> None:
+        """
+        Render a figure to an image file.
+        
+        Safe to call from several threads at once; concurrent renders share
+        the browser's tabs.
+        
+        Args:
+            fig: Plotly figure object
+            filepath: Output path
+            format_type: Image format ('png', 'svg', 'pdf')
+            **options: width, height and scale (plotly defaults when omitted)
+        """
+        self._render(_FigurePayload(fig), filepath, format_type, **options)
+    
+    def _render(self, payload: _FigurePayload, filepath: str, format_type: str, **options: Any) -> None:
+        """Render a prepared figure payload (see render())."""
+        if payload.fig_dict is None or not self.start():
+            payload.write_image(filepath, format=format_type, **options)
+            return
+        
+        spec = {
+            'fig': payload.fig_dict,
+            'path': filepath,
+            'opts': {
+                'format': format_type,
+                'width': options.get('width') or pio.defaults.default_width,
+                'height': options.get('height') or pio.defaults.default_height,
+                'scale': options.get('scale') or pio.defaults.default_scale,
+            },
+        }
+        job = asyncio.run_coroutine_threadsafe(
+            self._kaleido.write_fig_from_object([spec], cancel_on_error=True), self._loop
+        )
+        job.result()
+    
+    def stop(self) -> None:
+        """Close the browser (a later render starts it again)."""
+        with self._lock:
+            if self._kaleido is None:
+                return
+            self._loop.call_soon_threadsafe(self._stopped.set)
+            self._thread.join()
+            self._loop.close()
+            self._kaleido = self._loop = self._thread = None
+            logger.debug("Image renderer stopped")
+    
+    def __enter__(self) -> 'ImageRenderer':
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
 
 class ExportHandler:
     """Handles exporting visualizations in multiple formats."""
@@ -31,27 +296,90 @@ class ExportHandler:
             # Kaleido not properly installed or configured, continue without it
             # This will still allow HTML exports to work
             pass
+        self._manifest_lock = threading.Lock()
         
     def export_visualization(self, 
                            fig: go.Figure, 
                            filename: str, 
-                           formats: Optional[List[str]] = None) -> Dict[str, str]:
+                           formats: Optional[List[str]] = None,
+                           force: bool = False,
+                           n_workers: int = 1,
+                           include_plotlyjs: Union[bool, str] = True) -> Dict[str, str]:
         """
         Export a plotly figure to multiple formats in an exports folder.
         
+        Files whose recorded fingerprint matches the figure and export options
+        are left as they are instead of being written again. The figure is
+        converted to a dict once and shared by every format.
+        
         Args:
             fig: Plotly figure object
             filename: Base filename (without extension)
             formats: List of formats to export ['html', 'png', 'svg', 'pdf']
+            force: Write every file even if it is unchanged
+            n_workers: Number of formats written concurrently (1 writes them in order)
+            include_plotlyjs: True embeds plotly.js in the HTML file, 'directory'
+                references a shared plotly.min.js in the exports folder, 'cdn' loads it online
         
         Returns:
             dict: Paths to exported files
         """
+        filename = sanitize_filename(filename)
+        formats = self._validate_formats(filename, formats)
+        options = _format_options(include_plotlyjs)
+        exports_dir = self._get_exports_directory()
+        
+        results = self._export_batch([(filename, fig)], formats, exports_dir, force, n_workers,
+                                     options=options)
+        return results[filename]['files']
+    
+    def export_figures(self,
+                       figures: Union[Mapping[str, go.Figure], Iterable[Tuple[str, go.Figure]]],
+                       formats: Optional[List[str]] = None,
+                       force: bool = False,
+                       n_renderers: Optional[int] = None,
+                       n_workers: int = 1,
+                       include_plotlyjs: Union[bool, str] = True) -> Dict[str, Dict[str, Any]]:
+        """
+        Export a batch of figures, keeping one image renderer warm for all of them.
+        
+        Unchanged files are skipped as in export_visualization(). With
+        n_workers > 1 the files of every figure are written concurrently on a
+        thread pool: HTML serialization overlaps with image rendering, which
+        runs in the renderer's browser tabs.
+        
+        Args:
+            figures: {filename: figure} or (filename, figure) pairs
+            formats: List of formats to export ['html', 'png', 'svg', 'pdf']
+            force: Write every file even if it is unchanged
+            n_renderers: Number of browser tabs the renderer keeps open (defaults to n_workers)
+            n_workers: Number of files written concurrently (1 writes them in order)
+            include_plotlyjs: How HTML files load plotly.js (see export_visualization());
+                'directory' writes the bundle once for the whole batch
+        
+        Returns:
+            dict: filename -> {'files': {format: path}, 'seconds': {format: seconds},
+                  'skipped': [formats left unchanged], 'total_seconds': seconds}
+        """
+        items = list(figures.items()) if isinstance(figures, Mapping) else list(figures)
+        batch = [(sanitize_filename(filename), fig) for filename, fig in items]
+        formats = self._validate_formats(batch[0][0] if batch else 'figures', formats)
+        options = _format_options(include_plotlyjs)
+        exports_dir = self._get_exports_directory()
+        
+        with ImageRenderer(n_workers=n_renderers or n_workers) as renderer:
+            results = self._export_batch(batch, formats, exports_dir, force, n_workers, renderer,
+                                         options=options)
+        for filename, result in results.items():
+            logger.info(f"Exported {filename} in {result['total_seconds']:.2f}s")
+        return results
+    
+    @staticmethod
+    def _validate_formats(filename: str, formats: Optional[List[str]]) -> List[str]:
+        """Validate the requested formats (defaults to html and png)."""
         if formats is None:
             formats = ['html', 'png']
         
-        # Validate inputs
-        filename = sanitize_filename(filename)
         formats = ParameterValidator.validate_list_parameter(formats, "formats", min_length=1, element_type=str)
         
         # Validate format types
@@ -59,46 +387,266 @@ class ExportHandler:
         for fmt in formats:
             if fmt not in valid_formats:
                 raise ExportError(filename, fmt, ValueError(f"Unsupported format. Valid formats: {valid_formats}"))
-            
+        return formats
+    
+    def _get_exports_directory(self) -> str:
+        """Create (if needed) and return the exports folder in the caller's directory."""
         # Get the directory of the calling script
         caller_dir = self._get_caller_directory()
         
         # Create exports folder in caller's directory
         exports_dir = os.path.join(caller_dir, 'exports')
         os.makedirs(exports_dir, exist_ok=True)
+        return exports_dir
+    
+    def _export_batch(self,
+                      batch: List[Tuple[str, go.Figure]],
+                      formats: List[str],
+                      exports_dir: str,
+                      force: bool,
+                      n_workers: int = 1,
+                      renderer: Optional[ImageRenderer] = None,
+                      options: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Write every figure of a batch in each format, skipping files that are already current.
+        
+        Args:
+            batch: (sanitized filename, figure) pairs
+            formats: Validated formats
+            exports_dir: Exports folder
+            force: Write every file even if it is unchanged
+            n_workers: Number of files written concurrently
+            renderer: Warm image renderer (None renders with plotly's write_image)
+            options: Writer options per format (defaults to EXPORT_OPTIONS)
+        
+        Returns:
+            dict: filename -> {'files', 'seconds', 'skipped', 'total_seconds'}
+        """
+        options = EXPORT_OPTIONS if options is None else options
+        manifest = self._read_manifest(exports_dir)
+        if 'html' in formats and options['html'].get('include_plotlyjs') == 'directory':
+            self._ensure_plotlyjs_bundle(exports_dir, manifest)
+        results = {}
+        jobs = []
         
-        exported_files = {}
+        for filename, fig in batch:
+            started = time.perf_counter()
+            payload = _FigurePayload(fig)
+            result = {'files': {}, 'seconds': {}, 'skipped': [], 'started': started}
+            results[filename] = result
+            
+            for format_type in formats:
+                filepath = os.path.join(exports_dir, f"{filename}.{format_type}")
+                fingerprint = (_export_fingerprint(payload.digest, format_type, options[format_type])
+                               if payload.digest else None)
+                
+                if not force and fingerprint and \
+                        self._is_current(filepath, manifest.get(os.path.basename(filepath)), fingerprint):
+                    result['files'][format_type] = filepath
+                    result['skipped'].append(format_type)
+                    result['seconds'][format_type] = 0.0
+                    logger.info(f"{format_type.upper()} unchanged, skipped: {filepath}")
+                    continue
+                jobs.append((filename, format_type, filepath, fingerprint, payload))
         
-        for format_type in formats:
+        def write(job: Tuple[str, str, str, Optional[str], _FigurePayload]) -> Tuple[float, float]:
+            _, format_type, filepath, _, payload = job
+            started = time.perf_counter()
             try:
                 if format_type == 'html':
-                    filepath = os.path.join(exports_dir, f"{filename}.html")
-                    fig.write_html(filepath)
-                    exported_files['html'] = filepath
-                    logger.info(f"HTML exported: {filepath}")
-                    
-                elif format_type == 'png':
-                    filepath = os.path.join(exports_dir, f"{filename}.png")
-                    fig.write_image(filepath, width=1200, height=800, scale=2)
-                    exported_files['png'] = filepath
-                    logger.info(f"PNG exported: {filepath}")
-                    
-                elif format_type == 'svg':
-                    filepath = os.path.join(exports_dir, f"{filename}.svg")
-                    fig.write_image(filepath)
-                    exported_files['svg'] = filepath
-                    logger.info(f"SVG exported: {filepath}")
-                    
-                elif format_type == 'pdf':
-                    filepath = os.path.join(exports_dir, f"{filename}.pdf")
-                    fig.write_image(filepath)
-                    exported_files['pdf'] = filepath
-                    logger.info(f"PDF exported: {filepath}")
-                    
+                    payload.write_html(filepath, **options['html'])
+                elif renderer is not None:
+                    renderer._render(payload, filepath, format_type, **options[format_type])
+                else:
+                    payload.write_image(filepath, **options[format_type])
             except Exception as e:
                 raise ExportError(filepath, format_type, e)
-                
-        return exported_files
+            finished = time.perf_counter()
+            logger.info(f"{format_type.upper()} exported: {filepath}")
+            return finished - started, finished
+        
+        written = {}
+        error = None
+        if n_workers > 1 and len(jobs) > 1:
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                futures = [executor.submit(write, job) for job in jobs]
+                outcomes = []
+                for future in futures:
+                    try:
+                        outcomes.append(future.result())
+                    except ExportError as e:
+                        outcomes.append(None)
+                        error = error or e
+        else:
+            outcomes = []
+            for job in jobs:
+                try:
+                    outcomes.append(write(job))
+                except ExportError as e:
+                    error = e
+                    break
+        
+        for job, outcome in zip(jobs, outcomes):
+            if outcome is None:
+                continue
+            filename, format_type, filepath, fingerprint, _ = job
+            result = results[filename]
+            result['files'][format_type] = filepath
+            result['seconds'][format_type], result['finished'] = outcome
+            if fingerprint:
+                written[os.path.basename(filepath)] = fingerprint
+        
+        # Files written before a failure are still recorded
+        if written:
+            self._record_fingerprints(exports_dir, written)
+        if error is not None:
+            raise error
+        
+        for result in results.values():
+            started = result.pop('started')
+            finished = result.pop('finished', None)
+            result['files'] = {fmt: result['files'][fmt] for fmt in formats if fmt in result['files']}
+            result['total_seconds'] = (finished - started) if finished is not None else 0.0
+        return results
+    
+    def export_report(self,
+                      figures: Union[Mapping[str, go.Figure], Iterable[Tuple[str, go.Figure]]],
+                      filename: str,
+                      title: Optional[str] = None,
+                      include_plotlyjs: Union[bool, str] = 'directory',
+                      force: bool = False) -> str:
+        """
+        Export several figures into one HTML report that loads plotly.js once.
+        
+        Args:
+            figures: {section title: figure} or (section title, figure) pairs, in page order
+            filename: Report filename (without extension)
+            title: Page heading (defaults to filename)
+            include_plotlyjs: 'directory' references the shared plotly.min.js in the
+                exports folder, True embeds it once, 'cdn' loads it online
+            force: Write the report even if it is unchanged
+        
+        Returns:
+            str: Path to the report
+        """
+        filename = sanitize_filename(filename)
+        items = list(figures.items()) if isinstance(figures, Mapping) else list(figures)
+        items = ParameterValidator.validate_list_parameter(items, "figures", min_length=1)
+        options = _format_options(include_plotlyjs)['html']
+        exports_dir = self._get_exports_directory()
+        filepath = os.path.join(exports_dir, f"{filename}.html")
+        title = filename if title is None else title
+        
+        manifest = self._read_manifest(exports_dir)
+        if include_plotlyjs == 'directory':
+            self._ensure_plotlyjs_bundle(exports_dir, manifest)
+        
+        payloads = [(str(name), _FigurePayload(fig)) for name, fig in items]
+        fingerprint = None
+        if all(payload.digest for _, payload in payloads):
+            sections = json.dumps([[name, payload.digest] for name, payload in payloads])
+            fingerprint = _export_fingerprint(hashlib.sha256(f"{title}\0{sections}".encode()).hexdigest(),
+                                              'report', options)
+            if not force and self._is_current(filepath, manifest.get(os.path.basename(filepath)), fingerprint):
+                logger.info(f"Report unchanged, skipped: {filepath}")
+                return filepath
+        
+        try:
+            body = []
+            for position, (name, payload) in enumerate(payloads):
+                # Only the first figure carries the plotly.js script tag
+                div = payload.to_html(full_html=False,
+                                      include_plotlyjs=include_plotlyjs if position == 0 else False)
+                body.append(f"<section>\n<h2>{html.escape(name)}</h2>\n{div}\n</section>")
+            page = ("<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\" />\n"
+                    f"<title>{html.escape(title)}</title>\n</head>\n<body>\n"
+                    f"<h1>{html.escape(title)}</h1>\n" + "\n".join(body) + "\n</body>\n</html>\n")
+            with open(filepath, 'w', encoding='utf-8') as f:
+                f.write(page)
+        except Exception as e:
+            raise ExportError(filepath, 'html', e)
+        
+        if fingerprint:
+            self._record_fingerprints(exports_dir, {os.path.basename(filepath): fingerprint})
+        logger.info(f"Report exported ({len(payloads)} figures): {filepath}")
+        return filepath
+    
+    def _ensure_plotlyjs_bundle(self, exports_dir: str, manifest: Dict[str, Dict[str, Any]]) -> str:
+        """
+        Write the shared plotly.min.js into an exports folder unless the current version is there.
+        
+        Args:
+            exports_dir: Exports folder
+            manifest: Fingerprint manifest of the folder
+        
+        Returns:
+            str: Path to the bundle
+        """
+        filepath = os.path.join(exports_dir, PLOTLYJS_FILENAME)
+        fingerprint = hashlib.sha256(f"{PLOTLYJS_FILENAME}\0{plotly.__version__}".encode()).hexdigest()
+        with self._manifest_lock:
+            current = self._is_current(filepath, manifest.get(PLOTLYJS_FILENAME), fingerprint)
+            if not current:
+                try:
+                    # Write then rename, so HTML written meanwhile never sees a partial bundle
+                    fd, tmp_name = tempfile.mkstemp(dir=exports_dir, suffix='.tmp')
+                    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                        f.write(get_plotlyjs())
+                    os.replace(tmp_name, filepath)
+                except OSError as e:
+                    raise ExportError(filepath, 'js', e)
+        if not current:
+            self._record_fingerprints(exports_dir, {PLOTLYJS_FILENAME: fingerprint})
+            logger.info(f"plotly.js bundle written: {filepath}")
+        return filepath
+    
+    @staticmethod
+    def _is_current(filepath: str, entry: Optional[Dict[str, Any]], fingerprint: str) -> bool:
+        """Check that a file exists unmodified since it was written from fingerprint."""
+        if not entry or entry.get('fingerprint') != fingerprint:
+            return False
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return False
+        return entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns
+    
+    @staticmethod
+    def _read_manifest(exports_dir: str) -> Dict[str, Dict[str, Any]]:
+        """Read the fingerprint manifest of an exports folder."""
+        try:
+            with open(os.path.join(exports_dir, FINGERPRINT_FILENAME), 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+    
+    def _record_fingerprints(self, exports_dir: str, written: Dict[str, str]) -> None:
+        """
+        Record the fingerprints of freshly written files in the manifest.
+        
+        Args:
+            exports_dir: Exports folder holding the files and manifest
+            written: File name -> fingerprint for each file just written
+        """
+        with self._manifest_lock:
+            manifest = self._read_manifest(exports_dir)
+            for name, fingerprint in written.items():
+                try:
+                    stat = os.stat(os.path.join(exports_dir, name))
+                except OSError:
+                    # Nothing on disk to vouch for (e.g. the writer was a stub)
+                    manifest.pop(name, None)
+                    continue
+                manifest[name] = {'fingerprint': fingerprint, 'size': stat.st_size,
+                                  'mtime_ns': stat.st_mtime_ns}
+            try:
+                fd, tmp_name = tempfile.mkstemp(dir=exports_dir, suffix='.tmp')
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(manifest, f, indent=1, sort_keys=True)
+                os.replace(tmp_name, os.path.join(exports_dir, FINGERPRINT_FILENAME))
+            except OSError as e:
+                logger.warning(f"Could not update export fingerprints: {e}")
     
     def _get_caller_directory(self) -> str:
         """Get the directory of the script that's calling the export function."""
@@ -132,7 +680,10 @@ _export_handler = ExportHandler()
 
 def export_figure(fig: go.Figure, 
                   filename: str, 
-                  formats: Optional[List[str]] = None) -> Dict[str, str]:
+                  formats: Optional[List[str]] = None,
+                  force: bool = False,
+                  n_workers: int = 1,
+                  include_plotlyjs: Union[bool, str] = True) -> Dict[str, str]:
     """
     Convenience function to export a figure.
     
@@ -140,11 +691,74 @@ def export_figure(fig: go.Figure,
         fig: Plotly figure object
         filename: Base filename (without extension)
         formats: List of formats to export
+        force: Write every file even if an identical export already exists
+        n_workers: Number of formats written concurrently
+        include_plotlyjs: True embeds plotly.js in the HTML file, 'directory' shares one
+            plotly.min.js in the exports folder, 'cdn' loads it online
         
     Returns:
         dict: Paths to exported files
     """
-    return _export_handler.export_visualization(fig, filename, formats)
+    return _export_handler.export_visualization(fig, filename, formats, force=force, n_workers=n_workers,
+                                                include_plotlyjs=include_plotlyjs)
+
+
+def export_figures(figures: Union[Mapping[str, go.Figure], Iterable[Tuple[str, go.Figure]]],
+                   formats: Optional[List[str]] = None,
+                   force: bool = False,
+                   n_renderers: Optional[int] = None,
+                   n_workers: int = 1,
+                   include_plotlyjs: Union[bool, str] = True) -> Dict[str, Dict[str, Any]]:
+    """
+    Convenience function to export several figures with one warm image renderer.
+    
+    Args:
+        figures: {filename: figure} or (filename, figure) pairs
+        formats: List of formats to export
+        force: Write every file even if an identical export already exists
+        n_renderers: Number of browser tabs the renderer keeps open (defaults to n_workers)
+        n_workers: Number of files written concurrently
+        include_plotlyjs: How HTML files load plotly.js (True, 'directory' or 'cdn')
+        
+    Returns:
+        dict: filename -> {'files', 'seconds', 'skipped', 'total_seconds'}
+        
+    Example:
+        results = wave_visualizer.export_figures(
+            {'democrat_heatmap': fig1, 'republican_heatmap': fig2}, formats=['html', 'png']
+        )
+        print(results['democrat_heatmap']['seconds']['png'])
+    """
+    return _export_handler.export_figures(figures, formats, force=force,
+                                          n_renderers=n_renderers, n_workers=n_workers,
+                                          include_plotlyjs=include_plotlyjs)
+
+
+def export_report(figures: Union[Mapping[str, go.Figure], Iterable[Tuple[str, go.Figure]]],
+                  filename: str,
+                  title: Optional[str] = None,
+                  include_plotlyjs: Union[bool, str] = 'directory',
+                  force: bool = False) -> str:
+    """
+    Convenience function to export several figures as one HTML report.
+    
+    Args:
+        figures: {section title: figure} or (section title, figure) pairs
+        filename: Report filename (without extension)
+        title: Page heading (defaults to filename)
+        include_plotlyjs: 'directory' (shared plotly.min.js), True (embedded once) or 'cdn'
+        force: Write the report even if an identical one already exists
+        
+    Returns:
+        str: Path to the report
+        
+    Example:
+        wave_visualizer.export_report(
+            {'Democrat': fig1, 'Republican': fig2}, 'party_report', title='W1 to W3 by party'
+        )
+    """
+    return _export_handler.export_report(figures, filename, title=title,
+                                         include_plotlyjs=include_plotlyjs, force=force)
 
 
 def create_exports_folder() -> str:
@@ -38,6 +38,9 @@ class WaveConfigParser:
         # Regex pattern to match wave configurations like 'w1_to_w2', 'w4_to_w7', etc.
         self.wave_pattern = re.compile(r'^w(\d+)_to_w(\d+)$', re.IGNORECASE)
         
+        # Multi-stage chains like 'w1_to_w2_to_w3'
+        self.wave_chain_pattern = re.compile(r'^w\d+(?:_to_w\d+){2,}$', re.IGNORECASE)
+        
     def _load_wave_definitions(self) -> bool:
         """Load wave definitions from CSV file."""
         try:
@@ -126,6 +129,11 @@ class WaveConfigParser:
                 # Fallback to W1→W3
                 return 'W1_', 'W3_'
         
+        # Chains collapse to their first and last wave, like all_waves
+        if self.wave_chain_pattern.match(wave_config.strip()):
+            prefixes = self.parse_wave_sequence(wave_config)
+            return prefixes[0], prefixes[-1]
+        
         # Try to parse using regex
         match = self.wave_pattern.match(wave_config.strip())
         
@@ -164,6 +172,42 @@ class WaveConfigParser:
                 f"Or use 'all_waves' for multi-wave analysis"
             )
     
+    def parse_wave_sequence(self, wave_config: str) -> List[str]:
+        """
+        Parse a wave configuration into every wave it passes through, in order.
+        
+        Args:
+            wave_config: 'w1_to_w3', a chain such as 'w1_to_w2_to_w3', or 'all_waves'
+            
+        Returns:
+            List of wave prefixes (e.g., ['W1_', 'W2_', 'W3_'])
+            
+        Examples:
+            'w1_to_w3' → ['W1_', 'W3_']
+            'w1_to_w2_to_w3' → ['W1_', 'W2_', 'W3_']
+            'all_waves' → every defined wave, e.g. ['W1_', 'W2_', 'W3_']
+        """
+        config = wave_config.strip()
+        if config.lower() == 'all_waves':
+            available_waves = sorted(self.wave_numbers.keys())
+            if len(available_waves) < 2:
+                # Fallback to W1→W3, as parse_wave_config does
+                return ['W1_', 'W3_']
+            return [self.wave_numbers[wave][1] for wave in available_waves]
+        
+        if not self.wave_chain_pattern.match(config):
+            return list(self.parse_wave_config(config))
+        
+        wave_nums = [int(number) for number in re.findall(r'\d+', config)]
+        if len(set(wave_nums)) != len(wave_nums):
+            raise ValueError(f"Each wave may appear only once in a chain, got: {wave_config}")
+        
+        missing = [wave for wave in wave_nums if wave not in self.wave_numbers]
+        if missing:
+            raise ValueError(f"Wave {missing[0]} not found in wave definitions. Available waves: {list(self.wave_numbers.keys())}")
+        
+        return [self.wave_numbers[wave][1] for wave in wave_nums]
+    
     def generate_column_names(self, source_wave_prefix: str, target_wave_prefix: str, variable_name: str) -> Tuple[str, str]:
         """
         Generate source and target column names based on wave prefixes from CSV.
@@ -214,7 +258,8 @@ class WaveConfigParser:
             "  - 'w2_to_w3': Wave 2 to Wave 3 transition\n"
             "  - 'w1_to_w5': Wave 1 to Wave 5 transition (long-term)\n"
             "  - 'w4_to_w7': Wave 4 to Wave 7 transition\n"
-            "  - 'all_waves': Multi-wave analysis (defaults to W1→W3)\n"
+            "  - 'w1_to_w2_to_w3': Multi-stage chain through each listed wave\n"
+            "  - 'all_waves': Multi-wave analysis through every defined wave\n"
             "  - Any 'w<N>_to_w<M>' where N and M are positive integers"
         )
 
@@ -241,6 +286,19 @@ def parse_wave_config(wave_config: str) -> Tuple[str, str]:
     parser = _get_wave_parser()
     return parser.parse_wave_config(wave_config)
 
+def parse_wave_sequence(wave_config: str) -> List[str]:
+    """
+    Convenience function to parse every wave of a configuration.
+    
+    Args:
+        wave_config: Wave configuration string (pair, chain or 'all_waves')
+        
+    Returns:
+        List of wave prefixes in order
+    """
+    parser = _get_wave_parser()
+    return parser.parse_wave_sequence(wave_config)
+
 def generate_column_names(source_wave_prefix: str, target_wave_prefix: str, variable_name: str) -> Tuple[str, str]:
     """
     Convenience function to generate column names.
@@ -0,0 +1,130 @@
+"""
+File-backed in-memory cache for wave_visualizer package.
+
+Keeps the parsed contents of settings and data files in memory, keyed on the
+file's resolved path, modification time and size. A repeated load of an
+unchanged file is a dictionary lookup; editing or replacing the file changes
+its signature and the next load parses it again.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Union
+
+# (resolved path, mtime in nanoseconds, size in bytes)
+FileSignature = Tuple[str, int, int]
+
+
+def file_signature(path: Union[str, Path]) -> Optional[FileSignature]:
+    """
+    Get the cache signature of a file.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Tuple of (resolved path, mtime_ns, size), or None if the file does not exist
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (str(Path(path).resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+class FileCache:
+    """Thread-safe cache of values parsed from files."""
+
+    def __init__(self, name: str) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            name: Descriptive name used in repr and log messages
+        """
+        self.name = name
+        self._entries: Dict[Tuple[str, Hashable], Tuple[FileSignature, Any]] = {}
+        self._lock = threading.RLock()
+
+    def get(self,
+            path: Union[str, Path],
+            loader: Callable[[Path], Any],
+            key: Hashable = None) -> Any:
+        """
+        Return the cached value for a file, parsing it with loader on a miss.
+
+        Args:
+            path: Path to the file
+            loader: Callable that parses the file and returns the value to cache
+            key: Optional extra key for storing several views of the same file
+
+        Returns:
+            The cached or freshly loaded value
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        signature = file_signature(path)
+        if signature is None:
+            raise FileNotFoundError(str(path))
+
+        cache_key = (signature[0], key)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+
+        value = loader(Path(path))
+        with self._lock:
+            self._entries[cache_key] = (signature, value)
+        return value
+
+    def peek(self, path: Union[str, Path], key: Hashable = None) -> Optional[Any]:
+        """
+        Return the cached value for a file without loading it.
+
+        Args:
+            path: Path to the file
+            key: Optional extra key used when the value was stored
+
+        Returns:
+            The cached value if present and still current, otherwise None
+        """
+        signature = file_signature(path)
+        if signature is None:
+            return None
+        with self._lock:
+            entry = self._entries.get((signature[0], key))
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+        return None
+
+    def invalidate(self, path: Optional[Union[str, Path]] = None) -> int:
+        """
+        Drop cached entries.
+
+        Args:
+            path: Only drop entries for this file (None drops everything)
+
+        Returns:
+            int: Number of entries removed
+        """
+        with self._lock:
+            if path is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+
+            resolved = str(Path(path).resolve())
+            stale = [cache_key for cache_key in self._entries if cache_key[0] == resolved]
+            for cache_key in stale:
+                del self._entries[cache_key]
+            return len(stale)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"FileCache(name={self.name!r}, entries={len(self)})"
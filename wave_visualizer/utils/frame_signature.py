@@ -0,0 +1,149 @@
+"""
+Change tokens of DataFrame columns for wave_visualizer package.
+
+In-memory caches of results derived from a DataFrame (filter bitmaps,
+transition matrices, column profiles, value counts) are keyed on the frame's
+identity, and every result is stored with a ColumnToken of each column it was
+computed from. A token records the frame's version and the identity, length
+and dtype of the array holding the column's values; it is reused only while
+all of these are unchanged, so checking it costs microseconds regardless of
+the column's size (hashing the values would cost as much as recounting them).
+
+Assigning, replacing, adding or removing a column gives it new values
+arrays and is picked up automatically. Editing values in place
+(df.loc[...] = ..., fillna(inplace=True), ...) writes into the same arrays
+and cannot be seen this way: call invalidate_frame_caches(df) afterwards,
+which bumps the frame's version and so retires every result cached for it.
+"""
+
+import threading
+import weakref
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+# Version of each invalidated frame, keyed on DataFrame identity; frames never
+# invalidated are at version 0
+_frame_versions: Dict[Hashable, Tuple[weakref.ref, int]] = {}
+_frame_versions_lock = threading.Lock()
+
+
+def frame_version(data: pd.DataFrame) -> int:
+    """
+    Get the number of times invalidate_frame_caches() was called for a frame.
+
+    Args:
+        data: DataFrame
+
+    Returns:
+        int: Version of the frame (0 if never invalidated)
+    """
+    with _frame_versions_lock:
+        entry = _frame_versions.get(id(data))
+    if entry is not None and entry[0]() is data:
+        return entry[1]
+    return 0
+
+
+def invalidate_frame_caches(data: pd.DataFrame) -> int:
+    """
+    Retire every cached result derived from a DataFrame.
+
+    Call after editing a frame's values in place; columns that are assigned,
+    added or removed are detected without it. Filter indexes, transition
+    matrices, column profiles and value counts of the frame are recomputed on
+    next use.
+
+    Args:
+        data: DataFrame that was modified in place
+
+    Returns:
+        int: New version of the frame
+    """
+    version = frame_version(data) + 1
+    with _frame_versions_lock:
+        _frame_versions[id(data)] = (weakref.ref(data), version)
+        # Drop entries of frames that no longer exist
+        for key in [key for key, entry in _frame_versions.items() if entry[0]() is None]:
+            del _frame_versions[key]
+    logger.debug(f"Frame caches invalidated (version {version})")
+    return version
+
+
+def _root_array(array: np.ndarray) -> np.ndarray:
+    """Get the array that owns a view's memory."""
+    while isinstance(array.base, np.ndarray):
+        array = array.base
+    return array
+
+
+class ColumnToken:
+    """
+    Cheap identity of a column's values at one point in time.
+
+    Two tokens of the same frame's column are equal while the frame was not
+    invalidated and the column still holds the same values arrays. The arrays
+    are referenced weakly, so a token never keeps replaced values alive and
+    never matches arrays allocated later at the same address.
+    """
+
+    __slots__ = ('_key', '_owners')
+
+    def __init__(self, key: Tuple[Any, ...], owners: Tuple[Any, ...]):
+        self._key = key
+        self._owners = tuple(weakref.ref(owner) for owner in owners)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ColumnToken):
+            return NotImplemented
+        return (self._key == other._key and len(self._owners) == len(other._owners)
+                and all(mine() is not None and mine() is theirs()
+                        for mine, theirs in zip(self._owners, other._owners)))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ColumnToken{self._key}"
+
+
+def column_token(data: pd.DataFrame, column: Hashable) -> Optional[ColumnToken]:
+    """
+    Get the change token of a DataFrame column.
+
+    Args:
+        data: DataFrame containing the column
+        column: Column name
+
+    Returns:
+        ColumnToken, or None if the column is missing or its values cannot be
+        tracked (callers should then not cache anything derived from it)
+    """
+    if column not in data.columns:
+        return None
+    series = data[column]
+    if not isinstance(series, pd.Series):
+        # Duplicate column labels
+        return None
+
+    values = series.array
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        owners = (_root_array(values.codes), series.cat.categories)
+    elif isinstance(series.dtype, np.dtype):
+        # series.array wraps the block's ndarray in a new object on every call
+        owners = (_root_array(series.to_numpy()),)
+    else:
+        owners = (values,)
+
+    buffer = owners[0]
+    address = buffer.__array_interface__['data'][0] if isinstance(buffer, np.ndarray) else 0
+    key = (frame_version(data), len(series), str(series.dtype), address)
+    try:
+        return ColumnToken(key, owners)
+    except TypeError:
+        return None
+
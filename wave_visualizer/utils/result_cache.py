@@ -0,0 +1,252 @@
+"""
+Persistent on-disk result cache for wave_visualizer package.
+
+Stores small JSON results (transition tables and the like) under a
+content-addressed name: the SHA-256 of the inputs that produced them (data
+fingerprint, columns, filter, settings file hashes, ...). A later run with
+the same inputs reads the result back instead of loading and counting the
+data again; any change to an input changes the key, so stale entries are
+never returned, only evicted.
+
+The cache is off unless WAVE_VISUALIZER_CACHE_DIR names the directory to
+keep it in (e.g. ~/.wave_visualizer/cache); nothing is written to disk
+otherwise. WAVE_VISUALIZER_CACHE_MAX_BYTES changes the size cap (64 MB by
+default). Least recently used entries are removed once the cap is exceeded.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+from .file_cache import FileCache
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_DIR_ENV = "WAVE_VISUALIZER_CACHE_DIR"
+CACHE_MAX_BYTES_ENV = "WAVE_VISUALIZER_CACHE_MAX_BYTES"
+
+# Default size cap for the cache directory
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Bump when the layout of stored results changes, so old entries are ignored
+CACHE_FORMAT_VERSION = 1
+
+ENTRY_SUFFIX = ".json"
+
+# Content hashes of settings files, keyed on path, mtime and size
+_file_hash_cache = FileCache("file_hashes")
+
+# Cache directories already reported in the log
+_reported_dirs = set()
+
+
+def file_hash(path: Union[str, Path]) -> str:
+    """
+    Get the SHA-256 of a file's contents, rehashing only when the file changes.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        str: Hex digest
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    def _hash(file_path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    return _file_hash_cache.get(path, _hash)
+
+
+def files_fingerprint(paths: Iterable[Union[str, Path]]) -> str:
+    """
+    Get one digest for the names and contents of several files.
+
+    Args:
+        paths: Files to include (missing files are recorded as missing)
+
+    Returns:
+        str: Hex digest that changes when any file is added, removed or edited
+    """
+    digest = hashlib.sha256()
+    for path in sorted(str(path) for path in paths):
+        try:
+            content = file_hash(path)
+        except FileNotFoundError:
+            content = "missing"
+        digest.update(f"{path}\0{content}\n".encode())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Content-addressed JSON results on disk with an LRU size cap."""
+
+    def __init__(self, cache_dir: Union[str, Path], max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """
+        Initialize the cache (the directory is created on first write).
+
+        Args:
+            cache_dir: Directory holding the cache entries
+            max_bytes: Total size above which least recently used entries are evicted
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(inputs: Dict[str, Any]) -> str:
+        """
+        Build the content address for a set of inputs.
+
+        Args:
+            inputs: JSON-serializable description of everything the result depends on
+
+        Returns:
+            str: SHA-256 hex digest of the canonical JSON form of inputs
+        """
+        payload = json.dumps({'version': CACHE_FORMAT_VERSION, 'inputs': inputs},
+                             sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Read a stored result.
+
+        Args:
+            key: Content address from make_key()
+
+        Returns:
+            The stored value, or None if absent or unreadable
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                value = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable cache entry {path.name}: {e}")
+            return None
+
+        try:
+            # Mark as recently used for LRU eviction
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def put(self, key: str, value: Any) -> bool:
+        """
+        Store a result, then evict old entries if the cache is over its cap.
+
+        Args:
+            key: Content address from make_key()
+            value: JSON-serializable result
+
+        Returns:
+            bool: True if the value was written
+        """
+        try:
+            payload = json.dumps(value)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Result not cacheable: {e}")
+            return False
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so readers never see a partial entry
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp_name, self._entry_path(key))
+        except OSError as e:
+            logger.warning(f"Could not write result cache entry: {e}")
+            return False
+
+        self.evict()
+        return True
+
+    def evict(self, max_bytes: Optional[int] = None) -> int:
+        """
+        Remove least recently used entries until the cache fits its cap.
+
+        Args:
+            max_bytes: Size to shrink to (defaults to the cache's cap)
+
+        Returns:
+            int: Number of entries removed
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        with self._lock:
+            entries = []
+            for path in self.cache_dir.glob(f"*{ENTRY_SUFFIX}"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            removed = 0
+            for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+                if total <= limit:
+                    break
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+
+        if removed:
+            logger.debug(f"Evicted {removed} result cache entries")
+        return removed
+
+    def clear(self) -> int:
+        """
+        Remove every entry.
+
+        Returns:
+            int: Number of entries removed
+        """
+        return self.evict(max_bytes=0)
+
+    def __repr__(self) -> str:
+        return f"ResultCache(cache_dir={str(self.cache_dir)!r}, max_bytes={self.max_bytes})"
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    """
+    Get the result cache configured by the environment.
+
+    Returns:
+        ResultCache, or None if WAVE_VISUALIZER_CACHE_DIR is not set (or empty)
+    """
+    cache_dir = os.environ.get(CACHE_DIR_ENV, "").strip()
+    if not cache_dir:
+        return None
+    cache_dir = Path(cache_dir).expanduser()
+
+    try:
+        max_bytes = int(os.environ.get(CACHE_MAX_BYTES_ENV, DEFAULT_MAX_BYTES))
+    except ValueError:
+        logger.warning(f"Ignoring invalid {CACHE_MAX_BYTES_ENV}; using {DEFAULT_MAX_BYTES}")
+        max_bytes = DEFAULT_MAX_BYTES
+
+    if cache_dir not in _reported_dirs:
+        _reported_dirs.add(cache_dir)
+        logger.info(f"Result cache enabled: {cache_dir} (up to {max_bytes:,} bytes)")
+    return ResultCache(cache_dir, max_bytes)
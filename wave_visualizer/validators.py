@@ -7,18 +7,99 @@ parameter correctness, and graceful error handling throughout the package.
 
 import pandas as pd
 import numpy as np
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, List, Optional, Union, Dict, Tuple
+from typing import Any, Hashable, List, Optional, Union, Dict, Tuple
 import re
 import os
+import threading
+import weakref
 from .exceptions import (
     DataValidationError, ColumnNotFoundError, WaveConfigurationError,
     FilteringError, SettingsError
 )
+from .utils.frame_signature import ColumnToken, column_token
 from .utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Number of column value summaries kept by column_value_counts()
+COLUMN_SUMMARY_CACHE_SIZE = 64
+
+# LRU of per-column value counts keyed on (DataFrame identity, column), stored
+# with the column's change token
+_column_summary_cache: 'OrderedDict[Tuple[Hashable, ...], Tuple[weakref.ref, Optional[ColumnToken], pd.Series]]' = OrderedDict()
+_column_summary_lock = threading.RLock()
+
+
+def column_value_counts(data: pd.DataFrame, column: str) -> pd.Series:
+    """
+    Count the rows holding each non-missing value of a column, in one pass.
+    
+    Values are in order of first appearance (as Series.unique()). Results are
+    memoized per DataFrame object, so validating a batch of figures over the
+    same frame counts each column once; a column replaced since, or every
+    column after invalidate_frame_caches(data), is counted again.
+    
+    Args:
+        data: DataFrame containing the column
+        column: Column to count
+        
+    Returns:
+        pd.Series: Row counts indexed by value
+    """
+    key = (id(data), column)
+    token = column_token(data, column)
+    with _column_summary_lock:
+        entry = _column_summary_cache.get(key)
+        if entry is not None and entry[0]() is data and token is not None and entry[1] == token:
+            _column_summary_cache.move_to_end(key)
+            return entry[2]
+    
+    # A column profiled with complete counts needs no scan
+    from .data_prep.column_profiles import peek_column_profiles
+    profiles = peek_column_profiles(data, [column])
+    if profiles is not None and column in profiles and profiles.is_complete(column):
+        return profiles.value_counts(column, sort=False)
+    
+    codes, values = pd.factorize(data[column])
+    counts = pd.Series(np.bincount(codes[codes >= 0], minlength=len(values)),
+                       index=pd.Index(values, dtype=object))
+    
+    with _column_summary_lock:
+        _column_summary_cache[key] = (weakref.ref(data), token, counts)
+        _column_summary_cache.move_to_end(key)
+        while len(_column_summary_cache) > COLUMN_SUMMARY_CACHE_SIZE:
+            _column_summary_cache.popitem(last=False)
+    return counts
+
+
+def clear_validation_cache() -> int:
+    """
+    Drop all memoized column value counts.
+    
+    Returns:
+        int: Number of entries removed
+    """
+    with _column_summary_lock:
+        removed = len(_column_summary_cache)
+        _column_summary_cache.clear()
+    return removed
+
+
+@dataclass
+class ValidatedInputs:
+    """Result of validate_visualization_inputs(): what was checked and the rows selected."""
+    columns: List[str]
+    categories: Dict[str, List[Any]] = field(default_factory=dict)
+    selection: Any = None
+    
+    @property
+    def mask(self) -> np.ndarray:
+        """Boolean mask of the rows passing the filter."""
+        return self.selection.mask
+
 
 class DataValidator:
     """Validates DataFrame inputs and data quality."""
@@ -119,7 +200,7 @@ class DataValidator:
         Raises:
             DataValidationError: If column is not suitable for categorical analysis
         """
-        unique_count = data[column_name].nunique()
+        unique_count = len(column_value_counts(data, column_name))
         
         if unique_count > max_unique:
             raise DataValidationError(
@@ -308,6 +389,11 @@ class WaveConfigValidator:
             if wave_config == 'all_waves':
                 return 'all', 'all'
             
+            # Multi-stage chains (e.g., w1_to_w2_to_w3) span their first and last wave
+            chain = re.match(r'^w(\d+)(?:_to_w\d+)+_to_w(\d+)$', wave_config)
+            if chain:
+                return f"w{chain.group(1)}", f"w{chain.group(2)}"
+            
             raise WaveConfigurationError(
                 wave_config,
                 ["w1_to_w2", "w2_to_w3", "w1_to_w3", "all_waves", "w{N}_to_w{M}"]
@@ -443,8 +529,13 @@ class FilterValidator:
                 available_columns=list(data.columns)
             )
         
-        # Get available values in the column
-        available_values = data[filter_column].dropna().unique().tolist()
+        # Counts per value come from the frame's filter index, so the rows are
+        # selected afterwards from the same single pass over the column
+        from .data_prep.cleaning.row_reduction import get_filter_index
+        value_counts = get_filter_index(data).value_counts(filter_column)
+        if value_counts is None:
+            value_counts = column_value_counts(data, filter_column)
+        available_values = value_counts.index.tolist()
         
         # Check if filter value exists
         if filter_value not in available_values:
@@ -455,7 +546,7 @@ class FilterValidator:
             )
         
         # Check if filtering would result in empty dataset
-        filtered_count = (data[filter_column] == filter_value).sum()
+        filtered_count = int(value_counts.iloc[available_values.index(filter_value)])
         if filtered_count == 0:
             raise FilteringError(
                 filter_column=filter_column,
@@ -470,9 +561,13 @@ class FilterValidator:
 # Convenience functions for common validations
 def validate_visualization_inputs(data: pd.DataFrame, variable_name: str,
                                 wave_config: str, filter_column: Optional[str] = None,
-                                filter_value: Optional[str] = None) -> None:
+                                filter_value: Optional[str] = None) -> ValidatedInputs:
     """
-    Validate all inputs for visualization creation.
+    Validate all inputs for visualization creation and select the filtered rows.
+    
+    Each column is read once: the wave columns' distinct values are memoized
+    per DataFrame (see column_value_counts()), and the filter column's value
+    counts come from the same filter index that selects the rows.
     
     Args:
         data: Input DataFrame
@@ -481,9 +576,14 @@ def validate_visualization_inputs(data: pd.DataFrame, variable_name: str,
         filter_column: Optional filter column
         filter_value: Optional filter value
         
+    Returns:
+        ValidatedInputs: Validated columns, their categories and the selected rows
+        
     Raises:
         Various validation errors if inputs are invalid
     """
+    from .data_prep.cleaning.row_reduction import Selection, get_filter_index
+    
     # Validate DataFrame
     DataValidator.validate_dataframe(data, min_rows=10, min_cols=2)
     
@@ -504,17 +604,29 @@ def validate_visualization_inputs(data: pd.DataFrame, variable_name: str,
         DataValidator.validate_column_exists(data, target_column, "visualization")
         DataValidator.validate_categorical_column(data, source_column)
         DataValidator.validate_categorical_column(data, target_column)
+        columns = [source_column, target_column]
         
     except Exception:
         # Fallback to checking the base variable name if wave parsing fails
         DataValidator.validate_column_exists(data, variable_name, "visualization")
         DataValidator.validate_categorical_column(data, variable_name)
+        columns = [variable_name]
+    
+    result = ValidatedInputs(
+        columns=columns,
+        categories={column: column_value_counts(data, column).index.tolist() for column in columns}
+    )
     
     # Validate filtering if specified  
     if filter_column and filter_value:
         FilterValidator.validate_filter_operation(data, filter_column, filter_value)
+        filters = [{"column": filter_column, "values": [filter_value]}]
+        result.selection = Selection(data, get_filter_index(data).rows(filters))
+    else:
+        result.selection = Selection(data)
     
     logger.debug("All visualization inputs validated successfully")
+    return result
 
 
 def sanitize_filename(filename: str) -> str:
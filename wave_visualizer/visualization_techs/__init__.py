@@ -2,19 +2,54 @@
 Visualization Technologies Module
 
 This module provides various visualization techniques for analyzing survey data transitions.
+
+Names are imported from their submodules on first access (PEP 562), so the
+transition counting engine can be used without importing plotly.
 """
 
-# Import main visualization functions
-from .alluvial_plots import create_alluvial_visualization
-from .heatmaps import create_heatmap_visualization  
-from .transition_pattern_analysis import create_pattern_analysis_visualization
+import importlib
+from typing import Any, List
+
+_LAZY_ATTRIBUTES = {
+    # Main visualization functions
+    'create_alluvial_visualization': '.alluvial_plots',
+    'create_heatmap_visualization': '.heatmaps',
+    'create_pattern_analysis_visualization': '.transition_pattern_analysis',
+    'create_visualizations_by_group': '.grouped_visualizations',
+
+    # Builder classes
+    'AlluvialVisualizationBuilder': '.alluvial_builder',
+
+    # Shared transition counting engine
+    'TransitionMatrix': '.transition_matrix',
+    'get_transition_matrix': '.transition_matrix',
+    'clear_transition_cache': '.transition_matrix',
+    'group_transition_matrices': '.transition_matrix',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
-# Import builder classes
-from .alluvial_builder import AlluvialVisualizationBuilder
 
 __all__ = [
     'create_alluvial_visualization',
-    'create_heatmap_visualization', 
+    'create_heatmap_visualization',
     'create_pattern_analysis_visualization',
-    'AlluvialVisualizationBuilder'
-] 
\ No newline at end of file
+    'create_visualizations_by_group',
+    'AlluvialVisualizationBuilder',
+    'TransitionMatrix',
+    'get_transition_matrix',
+    'clear_transition_cache',
+    'group_transition_matrices'
+]
@@ -4,6 +4,10 @@ Alluvial Visualization Builder
 Refactored builder pattern implementation for creating alluvial visualizations.
 Breaks down the large create_alluvial_visualization function into manageable,
 focused methods with clear responsibilities.
+
+Wave configurations spanning more than two waves ('all_waves' or a chain such
+as 'w1_to_w2_to_w3') are drawn as one column of nodes per wave, with link
+weights taken from a single count of every respondent's full path.
 """
 
 import pandas as pd
@@ -12,14 +16,58 @@ import numpy as np
 from typing import Dict, List, Optional, Tuple, Any
 from ..interfaces import VisualizationBuilder
 from ..data_prep.customization import VisualizationCustomizer
-from ..data_prep.wave_parser import parse_wave_config
+from ..data_prep.wave_parser import parse_wave_config, parse_wave_sequence, generate_column_names
+from ..data_prep.data_loader import load_processed_data
+from .transition_matrix import (
+    TransitionMatrix, TrajectoryCounts, get_transition_matrix, get_trajectory_counts,
+    transition_cache_key, load_cached_transition_matrix, store_transition_matrix
+)
 from ..utils.logger import get_logger, log_step, log_success
-from ..exceptions import DataLoadingError, VisualizationError
-from ..validators import validate_visualization_inputs
+from ..exceptions import VisualizationError
+from ..validators import DataValidator, validate_visualization_inputs
+from ..data_prep.cleaning.row_reduction import Selection
 
 logger = get_logger(__name__)
 
 
+def _link_color(color: str, alpha: float = 0.6) -> str:
+    """Convert a hex color to semi-transparent rgba (other colors are returned as is)."""
+    if color.startswith('#'):
+        rgb = tuple(int(color[i:i+2], 16) for i in (1, 3, 5))
+        return f"rgba({rgb[0]}, {rgb[1]}, {rgb[2]}, {alpha})"
+    return color
+
+
+def _labels(values) -> np.ndarray:
+    """Convert category values to an object array of display strings."""
+    return np.array([str(value) for value in values], dtype=object)
+
+
+def _format_distinct(values: np.ndarray, spec: str) -> np.ndarray:
+    """Format every element of an array, calling format() once per distinct value."""
+    codes, uniques = pd.factorize(values)
+    return _labels(format(value, spec) for value in uniques)[codes]
+
+
+def _link_hover_text(source_labels: np.ndarray, target_labels: np.ndarray,
+                     counts: np.ndarray, percentages: np.ndarray) -> np.ndarray:
+    """
+    Build the hover text of every Sankey link with whole-array string operations.
+    
+    Args:
+        source_labels: Object array of source node labels, one per link
+        target_labels: Object array of target node labels, one per link
+        counts: Respondents on each link
+        percentages: Share of all respondents on each link
+        
+    Returns:
+        np.ndarray: Object array of 'source → target<br>Count: n<br>Percentage: p%' strings
+    """
+    return (source_labels + ' → ' + target_labels
+            + '<br>Count: ' + _format_distinct(counts, ',')
+            + '<br>Percentage: ' + _format_distinct(percentages, '.1f') + '%')
+
+
 class AlluvialVisualizationBuilder(VisualizationBuilder):
     """Builder for creating alluvial visualizations with step-by-step configuration."""
     
@@ -36,7 +84,15 @@ class AlluvialVisualizationBuilder(VisualizationBuilder):
         # Internal state
         self._source_wave_prefix: Optional[str] = None
         self._target_wave_prefix: Optional[str] = None
+        self._wave_prefixes: Optional[List[str]] = None
         self._config: Optional[Dict[str, Any]] = None
+        self._matrix: Optional[TransitionMatrix] = None
+        self._trajectories: Optional[TrajectoryCounts] = None
+        self._precomputed_matrix: Optional[TransitionMatrix] = None
+        self._precomputed_trajectories: Optional[TrajectoryCounts] = None
+        self._result_cache_key: Optional[str] = None
+        self._selection: Optional[Selection] = None
+        self._data_loaded: bool = False
         
         logger.debug("AlluvialVisualizationBuilder initialized")
     
@@ -51,11 +107,12 @@ class AlluvialVisualizationBuilder(VisualizationBuilder):
             Self for method chaining
         """
         if data is None:
-            self._data = self._load_default_data()
+            # Loaded on build, once the columns this visualization needs are known
+            self._data = None
+            logger.debug("Data set: processed data will be loaded on build")
         else:
             self._data = data
-        
-        logger.debug(f"Data set: {len(self._data)} rows, {len(self._data.columns)} columns")
+            logger.debug(f"Data set: {len(self._data)} rows, {len(self._data.columns)} columns")
         return self
     
     def set_variable(self, variable_name: str) -> 'AlluvialVisualizationBuilder':
@@ -116,6 +173,45 @@ class AlluvialVisualizationBuilder(VisualizationBuilder):
         logger.debug(f"Custom title set: {title}")
         return self
     
+    def set_transition_matrix(self, matrix: TransitionMatrix) -> 'AlluvialVisualizationBuilder':
+        """
+        Use precomputed transition counts instead of counting from data.
+        
+        The matrix must already reflect any filter; a filter set with
+        apply_filter() then only labels the title. A matrix only holds one
+        pair of waves, so build() rejects multi-wave configurations; use
+        set_trajectory_counts() for those.
+        
+        Args:
+            matrix: Transition counts for this variable and wave configuration
+            
+        Returns:
+            Self for method chaining
+        """
+        self._precomputed_matrix = matrix
+        self._precomputed_trajectories = None
+        logger.debug(f"Transition matrix set: {matrix}")
+        return self
+    
+    def set_trajectory_counts(self, trajectories: TrajectoryCounts) -> 'AlluvialVisualizationBuilder':
+        """
+        Use precomputed path counts instead of counting from data.
+        
+        The counts must already reflect any filter, and their stages must be
+        the variable's columns for every wave of the configuration; build()
+        rejects counts over other columns.
+        
+        Args:
+            trajectories: Path counts for this variable and wave configuration
+            
+        Returns:
+            Self for method chaining
+        """
+        self._precomputed_trajectories = trajectories
+        self._precomputed_matrix = None
+        logger.debug(f"Trajectory counts set: {trajectories}")
+        return self
+    
     def build(self) -> Tuple[go.Figure, Dict[str, Any]]:
         """
         Build and return the visualization.
@@ -128,6 +224,7 @@ class AlluvialVisualizationBuilder(VisualizationBuilder):
         """
         try:
             log_step(logger, 1, "Building Alluvial Visualization")
+            self._reset_build_state()
             
             # Step 1: Prepare data
             self._prepare_data()
@@ -151,70 +248,141 @@ class AlluvialVisualizationBuilder(VisualizationBuilder):
             logger.error(f"Failed to build alluvial visualization: {e}")
             raise VisualizationError(f"Visualization build failed: {str(e)}")
     
-    def _load_default_data(self) -> pd.DataFrame:
-        """Load default processed data."""
+    def _reset_build_state(self) -> None:
+        """Drop counts and data derived by an earlier build(), keeping the configuration."""
+        if self._data_loaded:
+            self._data = None
+            self._data_loaded = False
+        self._matrix = None
+        self._trajectories = None
+        self._result_cache_key = None
+        self._selection = None
+    
+    def _load_default_data(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Load default processed data.
+        
+        Args:
+            columns: Only load these columns (None loads the full dataset)
+        """
         logger.info("Loading processed data automatically...")
         
-        # Get the path relative to this package, not current working directory
-        from pathlib import Path
-        package_dir = Path(__file__).parent.parent.parent
-        data_path = package_dir / 'wave_visualizer' / 'settings' / 'processed_data.csv'
+        # Shared process-wide cache; raises DataLoadingError if the file is missing
+        data = load_processed_data(columns=columns)
+        logger.info(f"Data loaded: {len(data):,} observations")
+        return data
+    
+    def _get_stage_columns(self) -> Optional[List[str]]:
+        """
+        Get the variable's column in every wave of the configuration, in order.
         
+        Returns:
+            List of column names, or None if the wave configuration cannot be parsed
+        """
         try:
-            data = pd.read_csv(data_path)
-            logger.info(f"Data loaded: {len(data):,} observations")
-            return data
-        except FileNotFoundError:
-            raise DataLoadingError(
-                "Processed data file not found. Please run the data cleaning pipeline first.",
-                f"Expected file: {data_path}"
-            )
-        except Exception as e:
-            raise DataLoadingError(f"Failed to load processed data: {str(e)}")
+            prefixes = parse_wave_sequence(self._wave_config)
+        except ValueError:
+            return None
+        return [f"{prefix}{self._variable_name}" for prefix in prefixes]
+    
+    def _get_required_columns(self) -> Optional[List[str]]:
+        """
+        Get the columns this visualization reads (every wave column and the filter column).
+        
+        Returns:
+            List of column names, or None if the wave configuration cannot be parsed
+        """
+        columns = self._get_stage_columns()
+        if columns is None:
+            return None
+        
+        if self._filter_column and self._filter_value:
+            columns.append(self._filter_column)
+        return columns
+    
+    def _is_multistage(self) -> bool:
+        """Check whether the figure gets more than two columns of nodes."""
+        return self._wave_prefixes is not None and len(self._wave_prefixes) > 2
+    
+    def _use_precomputed_counts(self) -> bool:
+        """
+        Take this build's counts from set_transition_matrix() / set_trajectory_counts().
+        
+        Returns:
+            bool: True if precomputed counts were set
+            
+        Raises:
+            VisualizationError: If the counts do not cover the configuration's waves
+        """
+        stage_columns = self._get_stage_columns()
+        if self._precomputed_trajectories is not None:
+            trajectories = self._precomputed_trajectories
+            if stage_columns is not None and trajectories.stages != stage_columns:
+                raise VisualizationError(
+                    f"Precomputed trajectory counts cover {trajectories.stages}, but wave "
+                    f"configuration '{self._wave_config}' needs {stage_columns}"
+                )
+            logger.debug("Using precomputed trajectory counts; skipping data preparation")
+            if len(trajectories.stages) > 2:
+                self._trajectories = trajectories
+            else:
+                self._matrix = trajectories.transition(0, 1)
+            return True
+        
+        if self._precomputed_matrix is not None:
+            if stage_columns is not None and len(stage_columns) > 2:
+                raise VisualizationError(
+                    f"A precomputed transition matrix holds one pair of waves, but wave "
+                    f"configuration '{self._wave_config}' has {len(stage_columns)}; "
+                    f"use set_trajectory_counts()"
+                )
+            logger.debug("Using precomputed transition matrix; skipping data preparation")
+            self._matrix = self._precomputed_matrix
+            return True
+        return False
     
     def _prepare_data(self) -> None:
         """Prepare and validate data for visualization."""
-        if self._data is None:
-            self._data = self._load_default_data()
+        if self._use_precomputed_counts():
+            return
         
-        # Comprehensive input validation
-        validate_visualization_inputs(
+        if self._data is None:
+            # An earlier run on the same processed data file, columns, filter
+            # and settings left its counts in the result cache
+            columns = self._get_required_columns()
+            stage_columns = self._get_stage_columns()
+            if stage_columns is not None and len(stage_columns) == 2:
+                self._result_cache_key = transition_cache_key(
+                    columns[0], columns[1], self._filter_column, self._filter_value
+                )
+                cached = load_cached_transition_matrix(self._result_cache_key)
+                if cached is not None:
+                    logger.debug("Using cached transition matrix; skipping data preparation")
+                    self._matrix = cached
+                    return
+            self._data = self._load_default_data(columns=columns)
+            self._data_loaded = True
+        
+        # Comprehensive input validation; the rows it selects for the filter
+        # are counted if the transition is not memoized yet
+        validated = validate_visualization_inputs(
             self._data, self._variable_name, self._wave_config, 
             self._filter_column, self._filter_value
         )
+        self._selection = validated.selection
         
-        # Apply filtering if specified
-        if self._filter_column and self._filter_value:
-            self._apply_data_filter()
+        # The first and last waves are validated above; check the waves between them
+        for column in (self._get_stage_columns() or [])[1:-1]:
+            DataValidator.validate_column_exists(self._data, column, "visualization")
         
         logger.debug("Data preparation completed")
     
-    def _apply_data_filter(self) -> None:
-        """Apply row filtering to the data."""
-        logger.info(f"Applying filter: {self._filter_column} = '{self._filter_value}'")
-        
-        from ..data_prep.cleaning.row_reduction import RowReductionHandler
-        filter_handler = RowReductionHandler()
-        
-        # Create settings dict in the expected format
-        settings = {
-            "filters": [{
-                "column": self._filter_column,
-                "values": [self._filter_value]
-            }]
-        }
-        
-        original_count = len(self._data)
-        self._data = filter_handler.apply_filters(self._data, settings)
-        filtered_count = len(self._data)
-        
-        logger.info(f"Filtered to {filtered_count:,} observations ({filtered_count/original_count*100:.1f}%)")
-    
     def _configure_visualization(self) -> None:
         """Configure visualization settings and wave parsing."""
         # Parse wave configuration
         try:
             self._source_wave_prefix, self._target_wave_prefix = parse_wave_config(self._wave_config)
+            self._wave_prefixes = parse_wave_sequence(self._wave_config)
         except ValueError as e:
             logger.warning(f"Wave configuration error: {str(e)}")
             raise VisualizationError(f"Invalid wave configuration: {self._wave_config}")
@@ -238,10 +406,12 @@ class AlluvialVisualizationBuilder(VisualizationBuilder):
     def _generate_automatic_title(self) -> str:
         """Generate automatic title based on wave configuration and filtering."""
         # Extract clean wave names for display
-        source_wave = self._source_wave_prefix.rstrip('_')
-        target_wave = self._target_wave_prefix.rstrip('_')
+        if self._is_multistage():
+            waves = [prefix.rstrip('_') for prefix in self._wave_prefixes]
+        else:
+            waves = [self._source_wave_prefix.rstrip('_'), self._target_wave_prefix.rstrip('_')]
         
-        main_title = f"{source_wave} -> {target_wave} Transitions"
+        main_title = f"{' -> '.join(waves)} Transitions"
         
         # Add subtitle for filtering
         if self._filter_column and self._filter_value:
@@ -251,112 +421,81 @@ class AlluvialVisualizationBuilder(VisualizationBuilder):
     
     def _process_transition_data(self) -> pd.DataFrame:
         """Process data to create transition counts."""
-        from ..data_prep.wave_parser import generate_column_names
-        
         # Generate column names for source and target waves
         source_column, target_column = generate_column_names(
             self._source_wave_prefix, self._target_wave_prefix, self._variable_name
         )
         
-        # Create transition data
-        transition_data = self._data[[source_column, target_column]].dropna()
-        
-        # Group by transitions and count
-        transition_counts = (transition_data
-                           .groupby([source_column, target_column])
-                           .size()
-                           .reset_index(name='count'))
-        
-        # Rename columns for clarity
-        transition_counts.columns = ['source', 'target', 'count']
-        
-        # Calculate percentages
-        total_transitions = transition_counts['count'].sum()
-        transition_counts['percentage'] = (transition_counts['count'] / total_transitions) * 100
+        # Filter and count transitions (memoized per dataset, columns and filter),
+        # unless the counts were precomputed or read from the result cache
+        if self._matrix is None and (self._trajectories is not None or self._is_multistage()):
+            # One pass over every respondent's full path; the statistics
+            # describe the first -> last transition of those respondents
+            if self._trajectories is None:
+                self._trajectories = get_trajectory_counts(
+                    self._data, self._get_stage_columns(),
+                    self._filter_column, self._filter_value, selection=self._selection
+                )
+            self._matrix = self._trajectories.transition(0, len(self._trajectories.stages) - 1)
+        elif self._matrix is None:
+            self._matrix = get_transition_matrix(
+                self._data, source_column, target_column,
+                self._filter_column, self._filter_value, selection=self._selection
+            )
+            store_transition_matrix(self._result_cache_key, self._matrix)
         
-        # Sort by count (descending)
-        transition_counts = transition_counts.sort_values('count', ascending=False)
+        # Observed patterns sorted by count (descending)
+        transition_counts = self._matrix.ranked_patterns()[['source', 'target', 'count', 'percentage']]
         
         logger.debug(f"Processed {len(transition_counts)} unique transition patterns")
         return transition_counts
     
     def _create_plotly_figure(self, transition_data: pd.DataFrame) -> go.Figure:
         """Create the Plotly Sankey diagram figure."""
-        # Get unique categories for each wave separately
-        source_categories = sorted(transition_data['source'].unique())
-        target_categories = sorted(transition_data['target'].unique())
+        if self._trajectories is not None:
+            return self._create_multistage_figure()
         
-        # Create separate node lists for proper alluvial display
-        # Left side nodes (source wave)
+        # Sorted categories of each wave and every link's position among them
+        source_codes, source_categories = pd.factorize(transition_data['source'], sort=True)
+        target_codes, target_categories = pd.factorize(transition_data['target'], sort=True)
+        num_source = len(source_categories)
+        num_target = len(target_categories)
+        
+        # Create separate node lists for proper alluvial display:
+        # source wave nodes first, then target wave nodes
         source_wave_name = self._source_wave_prefix.rstrip('_').upper()
         target_wave_name = self._target_wave_prefix.rstrip('_').upper()
-        
-        source_nodes = [f"{cat} ({source_wave_name})" for cat in source_categories]
-        target_nodes = [f"{cat} ({target_wave_name})" for cat in target_categories]
-        
-        # Combine all nodes: source nodes first, then target nodes
-        all_node_labels = source_nodes + target_nodes
-        
-        # Create mappings for indices
-        source_to_index = {cat: i for i, cat in enumerate(source_categories)}
-        target_to_index = {cat: i + len(source_categories) for i, cat in enumerate(target_categories)}
-        
-        # Prepare Sankey data with proper indexing
-        source_indices = [source_to_index[source] for source in transition_data['source']]
-        target_indices = [target_to_index[target] for target in transition_data['target']]
-        values = transition_data['count'].tolist()
+        all_node_labels = ([f"{cat} ({source_wave_name})" for cat in source_categories] +
+                           [f"{cat} ({target_wave_name})" for cat in target_categories])
         
         # Get colors for unique categories (without wave labels)
         unique_categories = sorted(set(source_categories) | set(target_categories))
         base_colors = self._customizer.get_semantic_colors(self._variable_name, unique_categories)
-        
-        # Create color mappings
         color_map = {cat: color for cat, color in zip(unique_categories, base_colors)}
+        node_colors = ([color_map[cat] for cat in source_categories] +
+                       [color_map[cat] for cat in target_categories])
+        
+        # Link colors (semi-transparent source colors), converted once per category
+        source_link_colors = np.array([_link_color(color_map[cat]) for cat in source_categories],
+                                      dtype=object)
+        
+        # Hover text for every link at once
+        hover_text = _link_hover_text(
+            _labels(source_categories)[source_codes],
+            _labels(target_categories)[target_codes],
+            transition_data['count'].to_numpy(),
+            transition_data['percentage'].to_numpy()
+        )
         
-        # Apply colors to nodes: source colors + target colors
-        node_colors = []
-        for cat in source_categories:
-            node_colors.append(color_map[cat])
-        for cat in target_categories:
-            node_colors.append(color_map[cat])
-        
-        # Create link colors (semi-transparent source colors)
-        link_colors = []
-        for source in transition_data['source']:
-            base_color = color_map[source]
-            if base_color.startswith('#'):
-                # Convert hex to rgba with transparency
-                rgb = tuple(int(base_color[i:i+2], 16) for i in (1, 3, 5))
-                link_colors.append(f"rgba({rgb[0]}, {rgb[1]}, {rgb[2]}, 0.6)")
-            else:
-                link_colors.append(base_color)
-        
-        # Create hover text
-        hover_text = [
-            f"{row['source']} → {row['target']}<br>"
-            f"Count: {row['count']:,}<br>"
-            f"Percentage: {row['percentage']:.1f}%"
-            for _, row in transition_data.iterrows()
-        ]
-        
-        # Create node positions for proper left-right layout
-        num_source = len(source_categories)
-        num_target = len(target_categories)
-        
-        # Position nodes: source on left (x=0.01), target on right (x=0.99)
+        # Position nodes: source on left (x=0.01), target on right (x=0.99),
+        # each wave spread evenly top to bottom
         node_x = [0.01] * num_source + [0.99] * num_target
-        node_y = []
+        node_y = ([(i + 0.5) / num_source for i in range(num_source)] +
+                  [(i + 0.5) / num_target for i in range(num_target)])
         
-        # Distribute source nodes vertically on left
-        for i in range(num_source):
-            node_y.append((i + 0.5) / num_source)
-        
-        # Distribute target nodes vertically on right  
-        for i in range(num_target):
-            node_y.append((i + 0.5) / num_target)
-        
-        # Create Sankey diagram
-        fig = go.Figure(data=[go.Sankey(
+        # Create Sankey diagram (a trace dict is validated once, a go.Sankey twice)
+        fig = go.Figure(data=[dict(
+            type='sankey',
             arrangement="snap",
             node=dict(
                 pad=self._config['plot_params']['node_padding'],
@@ -368,16 +507,100 @@ class AlluvialVisualizationBuilder(VisualizationBuilder):
                 y=node_y
             ),
             link=dict(
-                source=source_indices,
-                target=target_indices,
-                value=values,
-                color=link_colors,
+                source=source_codes,
+                target=target_codes + num_source,
+                value=transition_data['count'].to_numpy(),
+                color=source_link_colors[source_codes].tolist(),
                 hovertemplate='%{customdata}<extra></extra>',
                 customdata=hover_text
             )
         )])
         
-        # Update layout
+        self._apply_layout(fig)
+        return fig
+    
+    def _create_multistage_figure(self) -> go.Figure:
+        """Create a Sankey diagram with one column of nodes per wave."""
+        trajectories = self._trajectories
+        n_stages = len(trajectories.stages)
+        categories = np.array(trajectories.categories, dtype=object)
+        wave_names = [prefix.rstrip('_').upper() for prefix in self._wave_prefixes]
+        total = trajectories.total
+        
+        # One node per (wave, category) that has respondents, numbered wave by wave
+        stage_counts = np.vstack([trajectories.stage_counts(stage) for stage in range(n_stages)])
+        present = stage_counts > 0
+        node_stage, node_category = np.nonzero(present)
+        node_index = np.full(present.shape, -1, dtype=np.int64)
+        node_index[node_stage, node_category] = np.arange(len(node_stage))
+        
+        # Semantic colors for every category used in any wave
+        used = present.any(axis=0)
+        category_colors = np.empty(len(categories), dtype=object)
+        category_colors[used] = self._customizer.get_semantic_colors(
+            self._variable_name, categories[used].tolist()
+        )
+        
+        # Waves spread evenly left to right; categories top to bottom within a wave
+        per_stage = present.sum(axis=1)
+        rank = np.cumsum(present, axis=1) - 1
+        node_x = 0.01 + 0.98 * node_stage / (n_stages - 1)
+        node_y = (rank[node_stage, node_category] + 0.5) / per_stage[node_stage]
+        node_labels = [f"{category} ({wave_names[stage]})"
+                       for stage, category in zip(node_stage, categories[node_category])]
+        
+        # Links between adjacent waves, read off the path counts
+        stage_labels = [_labels(f"{category} ({wave_name})" for category in categories)
+                        for wave_name in wave_names]
+        sources, targets, values, hover_text = [], [], [], []
+        link_categories = []
+        for stage in range(n_stages - 1):
+            counts = trajectories.transition_counts(stage, stage + 1)
+            source_codes, target_codes = np.nonzero(counts)
+            link_values = counts[source_codes, target_codes]
+            sources.append(node_index[stage, source_codes])
+            targets.append(node_index[stage + 1, target_codes])
+            values.append(link_values)
+            link_categories.append(source_codes)
+            hover_text.append(_link_hover_text(
+                stage_labels[stage][source_codes],
+                stage_labels[stage + 1][target_codes],
+                link_values,
+                link_values / total * 100 if total else np.zeros(len(link_values))
+            ))
+        link_categories = np.concatenate(link_categories)
+        
+        # Link colors (semi-transparent source colors), converted once per category
+        link_colors = np.empty(len(categories), dtype=object)
+        link_colors[used] = [_link_color(color) for color in category_colors[used]]
+        
+        fig = go.Figure(data=[dict(
+            type='sankey',
+            arrangement="snap",
+            node=dict(
+                pad=self._config['plot_params']['node_padding'],
+                thickness=self._config['plot_params']['node_thickness'],
+                line=dict(color="black", width=0.5),
+                label=node_labels,
+                color=category_colors[node_category].tolist(),
+                x=node_x.tolist(),
+                y=node_y.tolist()
+            ),
+            link=dict(
+                source=np.concatenate(sources),
+                target=np.concatenate(targets),
+                value=np.concatenate(values),
+                color=link_colors[link_categories].tolist(),
+                hovertemplate='%{customdata}<extra></extra>',
+                customdata=np.concatenate(hover_text)
+            )
+        )])
+        
+        self._apply_layout(fig)
+        return fig
+    
+    def _apply_layout(self, fig: go.Figure) -> None:
+        """Apply the configured title, fonts, size and margins."""
         fig.update_layout(
             title={
                 'text': self._config['title'],
@@ -395,8 +618,6 @@ class AlluvialVisualizationBuilder(VisualizationBuilder):
                 b=self._config['plot_params']['margin_bottom']
             )
         )
-
-        return fig
     
     def _calculate_statistics(self, transition_data: pd.DataFrame) -> Dict[str, Any]:
         """Calculate summary statistics for the visualization."""
@@ -418,11 +639,24 @@ class AlluvialVisualizationBuilder(VisualizationBuilder):
                 'stable': row['source'] == row['target']
             })
         
-        return {
+        statistics = {
             'total_transitions': int(total_transitions),
             'unique_patterns': len(transition_data),
             'stability_rate': float(stability_rate),
             'top_patterns': top_patterns,
             'variable_analyzed': self._variable_name,
             'wave_transition': self._wave_config
-        } 
\ No newline at end of file
+        }
+        
+        if self._trajectories is not None:
+            # Most common full paths through every wave
+            stages = self._trajectories.stages
+            ranked = self._trajectories.ranked_paths(top=10)
+            statistics['waves'] = [prefix.rstrip('_') for prefix in self._wave_prefixes]
+            statistics['top_trajectories'] = [
+                {'path': [row[stage] for stage in stages],
+                 'count': int(row['count']),
+                 'percentage': float(row['percentage'])}
+                for _, row in ranked.iterrows()
+            ]
+        return statistics 
\ No newline at end of file
@@ -13,6 +13,7 @@ from typing import Dict, List, Optional, Tuple, Union, Any
 
 from ..data_prep.customization import VisualizationCustomizer
 from ..data_prep.wave_parser import parse_wave_config
+from .transition_matrix import TrajectoryCounts, TransitionMatrix
 from ..utils.logger import get_logger
 from ..exceptions import (
     DataLoadingError, ColumnNotFoundError, WaveConfigurationError, 
@@ -49,6 +50,8 @@ def create_alluvial_visualization(data: Optional[pd.DataFrame] = None,
                                  filter_value: Optional[str] = None,
                                  custom_title: Optional[str] = None,
                                  show_plot: bool = True,
+                                 transition_matrix: Optional[TransitionMatrix] = None,
+                                 trajectory_counts: Optional[TrajectoryCounts] = None,
                                  **kwargs) -> Tuple[go.Figure, Dict[str, Any]]:
     """
     Convenience function to create alluvial visualization with automatic configuration.
@@ -61,6 +64,11 @@ def create_alluvial_visualization(data: Optional[pd.DataFrame] = None,
         filter_value: Value to filter to (e.g., 'Republican')
         custom_title: Optional custom title
         show_plot: Whether to display the plot
+        transition_matrix: Precomputed (already filtered) transition counts; when given,
+                           data is not loaded and the filter only labels the title
+                           (two-wave configurations only)
+        trajectory_counts: Precomputed (already filtered) path counts through every wave
+                           of the configuration, used like transition_matrix
         **kwargs: Additional configuration parameters
         
     Returns:
@@ -92,6 +100,11 @@ def create_alluvial_visualization(data: Optional[pd.DataFrame] = None,
     if custom_title:
         builder.set_custom_title(custom_title)
     
+    if transition_matrix is not None:
+        builder.set_transition_matrix(transition_matrix)
+    if trajectory_counts is not None:
+        builder.set_trajectory_counts(trajectory_counts)
+    
     # Build and return the visualization
     return builder.build()
  
\ No newline at end of file
@@ -0,0 +1,147 @@
+"""
+Grouped Visualizations module for wave_visualizer package.
+
+Creates the same set of visualizations for every value of a grouping column
+(e.g. one alluvial plot, heatmap and pattern chart per political party).
+Transitions for all groups are counted in a single pass over the data, then
+each figure is rendered from its slice of the counts, so producing N groups
+costs about the same as producing one. Multi-wave alluvial figures get every
+group's full paths from one more pass (group_trajectory_counts()).
+"""
+
+import pandas as pd
+import plotly.graph_objects as go
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from ..data_prep.wave_parser import parse_wave_config, parse_wave_sequence, generate_column_names
+from ..data_prep.data_loader import load_processed_data
+from ..exceptions import FilteringError, validate_column_exists
+from ..validators import ParameterValidator
+from ..utils.logger import get_logger
+from .alluvial_plots import create_alluvial_visualization
+from .heatmaps import create_heatmap_visualization
+from .transition_pattern_analysis import create_pattern_analysis_visualization
+from .transition_matrix import group_trajectory_counts, group_transition_matrices
+
+logger = get_logger(__name__)
+
+# Visualization kinds supported by create_visualizations_by_group
+VISUALIZATION_KINDS = ('alluvial', 'heatmap', 'patterns')
+
+_RENDERERS = {
+    'alluvial': create_alluvial_visualization,
+    'heatmap': create_heatmap_visualization,
+    'patterns': create_pattern_analysis_visualization,
+}
+
+
+def create_visualizations_by_group(variable_name: str = 'HFClust_labeled',
+                                   wave_config: str = 'w1_to_w2',
+                                   group_by: str = 'PID1_labeled',
+                                   kinds: Sequence[str] = VISUALIZATION_KINDS,
+                                   groups: Optional[Sequence[Any]] = None,
+                                   data: Optional[pd.DataFrame] = None,
+                                   show_plot: bool = False) -> Dict[Any, Dict[str, Tuple[go.Figure, Dict]]]:
+    """
+    Create visualizations for every value of a grouping column in one pass.
+
+    Each figure matches what the matching create_* function returns when
+    called with filter_column=group_by and filter_value=<group>. For
+    multi-wave configurations (e.g. 'all_waves') that means a multi-stage
+    alluvial over respondents observed in every wave, while heatmaps and
+    pattern charts use the first -> last pair. A figure is only created for
+    a group with respondents in the counts it draws: a group with first ->
+    last respondents but no complete path through every wave gets no
+    alluvial (logged), and groups with no figure at all are left out.
+
+    Args:
+        variable_name: Variable to analyze
+        wave_config: Wave configuration (e.g., 'w1_to_w3')
+        group_by: Column whose values define the groups (e.g., 'PID1_labeled')
+        kinds: Visualizations to create per group ('alluvial', 'heatmap', 'patterns')
+        groups: Group values to create, in order (defaults to every value present)
+        data: DataFrame with processed data (loads the needed columns if not provided)
+        show_plot: Whether to display each plot
+
+    Returns:
+        Dict mapping group value -> {kind: (Figure, statistics)}
+
+    Raises:
+        DataValidationError: If an unknown visualization kind is requested
+        ColumnNotFoundError: If the grouping column does not exist
+        FilteringError: If a requested group has no respondents for any requested figure
+
+    Example:
+        results = wave_visualizer.create_visualizations_by_group(
+            variable_name='HFClust_labeled', wave_config='w1_to_w3',
+            group_by='PID1_labeled', groups=['Democrat', 'Republican']
+        )
+        fig, stats = results['Democrat']['heatmap']
+    """
+    kinds = [ParameterValidator.validate_string_parameter(kind, 'kinds', list(VISUALIZATION_KINDS))
+             for kind in kinds]
+
+    # Parse wave configuration
+    source_wave_prefix, target_wave_prefix = parse_wave_config(wave_config)
+    source_column, target_column = generate_column_names(
+        source_wave_prefix, target_wave_prefix, variable_name
+    )
+    stage_columns = [f"{prefix}{variable_name}" for prefix in parse_wave_sequence(wave_config)]
+    multistage = 'alluvial' in kinds and len(stage_columns) > 2
+    columns = (stage_columns if multistage else [source_column, target_column]) + [group_by]
+
+    # Load data if not provided, reading only the columns the counts use
+    if data is None:
+        data = load_processed_data(columns=columns)
+        logger.info(f"Data loaded: {len(data):,} observations")
+    for column in columns:
+        validate_column_exists(data, column, "grouped visualization")
+
+    # One pass over the data for every group (plus one for full paths)
+    matrices = group_transition_matrices(data, source_column, target_column, group_by)
+    trajectories = group_trajectory_counts(data, stage_columns, group_by) if multistage else {}
+
+    def group_counts(group: Any) -> Dict[str, Dict[str, Any]]:
+        """Counts each requested kind draws for a group, for kinds with respondents."""
+        counts = {}
+        for kind in kinds:
+            if kind == 'alluvial' and multistage:
+                paths = trajectories.get(group)
+                if paths is not None and paths.total > 0:
+                    counts[kind] = {'trajectory_counts': paths}
+            elif group in matrices and matrices[group].total > 0:
+                counts[kind] = {'transition_matrix': matrices[group]}
+        return counts
+
+    if groups is None:
+        drawable = {group: group_counts(group) for group in matrices}
+        groups = [group for group, counts in drawable.items() if counts]
+    else:
+        drawable = {group: group_counts(group) for group in groups}
+        available = [group for group in matrices if group_counts(group)]
+        for group in groups:
+            if not drawable[group]:
+                raise FilteringError(filter_column=group_by, filter_value=group,
+                                     available_values=available)
+
+    logger.info(f"Creating {len(kinds)} visualization(s) for {len(groups)} group(s) of '{group_by}'")
+
+    results = {}
+    for group in groups:
+        results[group] = {}
+        for kind in kinds:
+            counts = drawable[group].get(kind)
+            if counts is None:
+                logger.warning(f"Skipping {kind} for {group_by} = '{group}': "
+                               f"no respondents observed in every wave")
+                continue
+            results[group][kind] = _RENDERERS[kind](
+                variable_name=variable_name,
+                wave_config=wave_config,
+                filter_column=group_by,
+                filter_value=group,
+                show_plot=show_plot,
+                **counts
+            )
+
+    return results
@@ -9,7 +9,7 @@ import plotly.graph_objects as go
 import numpy as np
 from typing import Dict, Optional, Tuple, Any
 from ..data_prep.wave_parser import parse_wave_config, generate_column_names
-from ..data_prep.cleaning.row_reduction import RowReductionHandler
+from .transition_matrix import TransitionMatrix, get_transition_matrix, load_transition_matrix
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -21,6 +21,7 @@ def create_heatmap_visualization(data: pd.DataFrame = None,
                                 filter_column: str = None,
                                 filter_value: str = None,
                                 show_plot: bool = True,
+                                transition_matrix: Optional[TransitionMatrix] = None,
                                 **kwargs) -> Tuple[go.Figure, Dict]:
     """
     Create heatmap visualization showing transition percentages.
@@ -32,52 +33,36 @@ def create_heatmap_visualization(data: pd.DataFrame = None,
         filter_column: Column to filter by
         filter_value: Value to filter for
         show_plot: Whether to display the plot
+        transition_matrix: Precomputed counts for this (filtered) transition; when
+                           given, data is not loaded or filtered and the filter
+                           arguments only label the chart
         
     Returns:
         Tuple of (Figure object, Statistics dictionary)
     """
-    # Load data if not provided
-    if data is None:
-        from pathlib import Path
-        package_dir = Path(__file__).parent.parent.parent
-        data_path = package_dir / 'wave_visualizer' / 'settings' / 'processed_data.csv'
-        data = pd.read_csv(data_path)
-        logger.info(f"Data loaded: {len(data):,} observations")
-    
-    # Apply filtering if specified
-    if filter_column and filter_value:
-        logger.info(f"Applying filter: {filter_column} = '{filter_value}'")
-        filter_handler = RowReductionHandler()
-        settings = {
-            "filters": [{
-                "column": filter_column,
-                "values": [filter_value]
-            }]
-        }
-        original_count = len(data)
-        data = filter_handler.apply_filters(data, settings)
-        filtered_count = len(data)
-        logger.info(f"Filtered to {filtered_count:,} observations ({filtered_count/original_count*100:.1f}%)")
-    
     # Parse wave configuration
     source_wave_prefix, target_wave_prefix = parse_wave_config(wave_config)
     source_column, target_column = generate_column_names(
         source_wave_prefix, target_wave_prefix, variable_name
     )
     
-    # Create transition matrix
-    transition_data = data[[source_column, target_column]].dropna()
-    
-    # Create count matrix
-    count_matrix = pd.crosstab(transition_data[source_column], 
-                              transition_data[target_column], 
-                              margins=False)
+    # Without data, count from the processed data file (only the columns this
+    # chart uses), or read the counts of an earlier run from the result cache
+    if data is None and transition_matrix is None:
+        transition_matrix = load_transition_matrix(
+            source_column, target_column, filter_column, filter_value
+        )
     
-    # Convert to percentage matrix (row-wise percentages)
-    pct_matrix = count_matrix.div(count_matrix.sum(axis=1), axis=0) * 100
+    # Filter and count transitions (memoized per dataset, columns and filter)
+    if transition_matrix is None:
+        transition_matrix = get_transition_matrix(
+            data, source_column, target_column, filter_column, filter_value
+        )
+    matrix = transition_matrix
     
-    # Get category labels
-    categories = sorted(pct_matrix.index.tolist())
+    # Row-wise percentages over the categories seen in either wave
+    pct_matrix = matrix.row_percentages()
+    categories = matrix.categories
     
     # Generate title
     source_wave = source_wave_prefix.rstrip('_').upper()
@@ -124,14 +109,10 @@ def create_heatmap_visualization(data: pd.DataFrame = None,
         fig.show()
     
     # Calculate statistics
-    total_transitions = len(transition_data)
+    total_transitions = matrix.total
     
-    # Calculate stability (diagonal values)
-    diagonal_stability = {}
-    for i, category in enumerate(categories):
-        if i < len(pct_matrix) and i < len(pct_matrix.columns):
-            stability_pct = pct_matrix.iloc[i, i]
-            diagonal_stability[category] = stability_pct
+    # Calculate stability (diagonal values) for categories present in the source wave
+    diagonal_stability = matrix.stability().to_dict()
     
     # Overall stability
     overall_stability = np.mean(list(diagonal_stability.values())) if diagonal_stability else 0
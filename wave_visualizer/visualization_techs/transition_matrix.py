@@ -0,0 +1,917 @@
+"""
+Transition Matrix module for wave_visualizer package.
+
+Shared source -> target contingency table used by the alluvial, heatmap and
+pattern analysis visualizations. The table is built once from integer
+category codes with np.bincount and exposes counts, row and column
+percentages, the diagonal (stability) and ranked patterns.
+
+get_transition_matrix() memoizes matrices per dataset, column pair and
+filter, so requesting several views of the same transition reuses one count;
+a memoized matrix is only reused while the change tokens of its source,
+target and filter columns are unchanged (see utils.frame_signature).
+load_transition_matrix() also keeps matrices of the processed data file in
+the on-disk result cache, so a repeat run with unchanged data and settings
+does no data work at all.
+"""
+
+import threading
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from ..data_prep.data_loader import load_processed_data, processed_data_fingerprint
+from ..utils.frame_signature import ColumnToken, column_token
+from ..utils.logger import get_logger
+from ..utils.result_cache import ResultCache, files_fingerprint, get_result_cache
+
+if TYPE_CHECKING:
+    from ..data_prep.cleaning.row_reduction import Selection
+
+logger = get_logger(__name__)
+
+# Number of matrices kept by get_transition_matrix()
+TRANSITION_CACHE_SIZE = 64
+
+
+def _shared_codes(columns: Sequence[pd.Series]) -> Tuple[List[np.ndarray], pd.Index]:
+    """
+    Encode several aligned series as integer codes over one shared set of categories.
+
+    Sharing the categories means a respondent is stable between two waves
+    exactly when the two codes are equal. Categorical columns reuse their
+    existing codes; ordered categoricals with identical categories keep their
+    order, everything else is sorted like pd.crosstab and groupby would.
+
+    Args:
+        columns: Wave values, one series per wave
+
+    Returns:
+        Tuple of (codes per series, categories); missing values are coded -1
+    """
+    if all(isinstance(column.dtype, pd.CategoricalDtype) for column in columns):
+        arrays = [column.array for column in columns]
+        if columns[0].dtype.ordered and all(column.dtype == columns[0].dtype for column in columns):
+            combined = union_categoricals(arrays)
+        else:
+            try:
+                combined = union_categoricals(arrays, ignore_order=True, sort_categories=True)
+            except TypeError:
+                combined = union_categoricals(arrays, ignore_order=True)
+        codes, categories = combined.codes, combined.categories
+    else:
+        values = pd.concat(list(columns), ignore_index=True)
+        try:
+            codes, categories = pd.factorize(values, sort=True)
+        except TypeError:
+            # Mixed, unorderable labels keep first-seen order
+            codes, categories = pd.factorize(values)
+
+    n_rows = len(columns[0])
+    return [codes[i * n_rows:(i + 1) * n_rows] for i in range(len(columns))], pd.Index(categories)
+
+
+def _shared_category_codes(source: pd.Series,
+                           target: pd.Series) -> Tuple[np.ndarray, np.ndarray, pd.Index]:
+    """
+    Encode source and target values as integer codes over one shared set of categories.
+
+    Args:
+        source: Source wave values
+        target: Target wave values
+
+    Returns:
+        Tuple of (source codes, target codes, categories); missing values are coded -1
+    """
+    (source_codes, target_codes), categories = _shared_codes([source, target])
+    return source_codes, target_codes, categories
+
+
+class TransitionMatrix:
+    """Source -> target transition counts over one shared set of categories."""
+
+    def __init__(self, counts: np.ndarray, categories: Sequence[Any]):
+        """
+        Initialize from a square count matrix.
+
+        Args:
+            counts: k x k array, counts[i, j] = respondents moving from category i to j
+            categories: The k category labels, in matrix order
+        """
+        counts = np.asarray(counts, dtype=np.int64)
+        if counts.ndim != 2 or counts.shape[0] != counts.shape[1] or counts.shape[0] != len(categories):
+            raise ValueError(f"Expected a {len(categories)}x{len(categories)} count matrix, "
+                             f"got shape {counts.shape}")
+        self._counts = counts
+        self._categories = pd.Index(categories)
+
+    @classmethod
+    def from_series(cls, source: pd.Series, target: pd.Series) -> 'TransitionMatrix':
+        """
+        Count transitions between two aligned series.
+
+        Rows where either value is missing are ignored. Categories that never
+        occur in either wave are dropped.
+
+        Args:
+            source: Source wave values
+            target: Target wave values, aligned with source
+
+        Returns:
+            TransitionMatrix with counts of every observed pair
+        """
+        source_codes, target_codes, categories = _shared_category_codes(source, target)
+        n_categories = len(categories)
+
+        # Missing values are coded -1; drop rows missing either wave
+        complete = (source_codes >= 0) & (target_codes >= 0)
+        if not complete.all():
+            source_codes, target_codes = source_codes[complete], target_codes[complete]
+
+        pair_counts = np.bincount(
+            source_codes.astype(np.int64) * n_categories + target_codes,
+            minlength=n_categories * n_categories
+        ).reshape(n_categories, n_categories)
+
+        return cls(pair_counts, categories).drop_unused_categories()
+
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame, source_column: str, target_column: str) -> 'TransitionMatrix':
+        """
+        Count transitions between two columns of a DataFrame.
+
+        Args:
+            data: DataFrame containing both columns
+            source_column: Column with source wave values
+            target_column: Column with target wave values
+
+        Returns:
+            TransitionMatrix for the column pair
+        """
+        return cls.from_series(data[source_column], data[target_column])
+
+    def drop_unused_categories(self) -> 'TransitionMatrix':
+        """
+        Remove categories that occur in neither wave.
+
+        Returns:
+            TransitionMatrix without empty rows and columns (self if there are none)
+        """
+        used = (self.row_totals + self.column_totals) > 0
+        if used.all():
+            return self
+        return TransitionMatrix(self._counts[np.ix_(used, used)], self._categories[used])
+
+    @property
+    def categories(self) -> List[Any]:
+        """Category labels in matrix order."""
+        return self._categories.tolist()
+
+    @property
+    def source_categories(self) -> List[Any]:
+        """Categories that occur in the source wave."""
+        return self._categories[self.row_totals > 0].tolist()
+
+    @property
+    def target_categories(self) -> List[Any]:
+        """Categories that occur in the target wave."""
+        return self._categories[self.column_totals > 0].tolist()
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Raw k x k count array (read-only view)."""
+        view = self._counts.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def total(self) -> int:
+        """Number of respondents with both values present."""
+        return int(self._counts.sum())
+
+    @property
+    def row_totals(self) -> np.ndarray:
+        """Respondents per source category."""
+        return self._counts.sum(axis=1)
+
+    @property
+    def column_totals(self) -> np.ndarray:
+        """Respondents per target category."""
+        return self._counts.sum(axis=0)
+
+    @property
+    def stable_count(self) -> int:
+        """Respondents in the same category in both waves."""
+        return int(np.trace(self._counts))
+
+    @property
+    def stability_rate(self) -> float:
+        """Percentage of respondents in the same category in both waves."""
+        return (self.stable_count / self.total) * 100 if self.total else 0.0
+
+    def count_frame(self) -> pd.DataFrame:
+        """
+        Get the counts as a labeled DataFrame.
+
+        Returns:
+            DataFrame indexed by source category with one column per target category
+        """
+        return pd.DataFrame(self._counts, index=self._categories.copy(), columns=self._categories.copy())
+
+    def row_percentages(self) -> pd.DataFrame:
+        """
+        Get the share of each source category that moved to each target category.
+
+        Returns:
+            DataFrame where each row with any respondents sums to 100
+        """
+        return self._normalized(self.row_totals[:, None])
+
+    def column_percentages(self) -> pd.DataFrame:
+        """
+        Get the share of each target category that came from each source category.
+
+        Returns:
+            DataFrame where each column with any respondents sums to 100
+        """
+        return self._normalized(self.column_totals[None, :])
+
+    def _normalized(self, totals: np.ndarray) -> pd.DataFrame:
+        """Divide counts by broadcast totals, giving 0 where a total is 0."""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pct = np.where(totals > 0, self._counts / totals * 100, 0.0)
+        return pd.DataFrame(pct, index=self._categories.copy(), columns=self._categories.copy())
+
+    def diagonal(self) -> pd.Series:
+        """
+        Get the stable (same category in both waves) count per category.
+
+        Returns:
+            Series of diagonal counts indexed by category
+        """
+        return pd.Series(np.diagonal(self._counts).copy(), index=self._categories.copy(), name='stable')
+
+    def stability(self) -> pd.Series:
+        """
+        Get the percentage of each source category that stayed in it.
+
+        Returns:
+            Series indexed by the categories that occur in the source wave
+        """
+        rows = self.row_totals
+        present = rows > 0
+        pct = np.diagonal(self._counts)[present] / rows[present] * 100
+        return pd.Series(pct, index=self._categories[present], name='stability')
+
+    def ranked_patterns(self, top: Optional[int] = None) -> pd.DataFrame:
+        """
+        Get the observed transition patterns, most common first.
+
+        Ties keep matrix order (source category, then target category).
+
+        Args:
+            top: Only return this many patterns (None returns all)
+
+        Returns:
+            DataFrame with source, target, count, percentage and stable columns
+        """
+        flat = self._counts.ravel()
+        observed = np.flatnonzero(flat)
+        observed = observed[np.argsort(-flat[observed], kind='stable')]
+        if top is not None:
+            observed = observed[:top]
+
+        counts = flat[observed]
+        source_codes, target_codes = np.divmod(observed, len(self._categories))
+        total = self.total
+
+        return pd.DataFrame({
+            'source': self._categories[source_codes],
+            'target': self._categories[target_codes],
+            'count': counts,
+            'percentage': (counts / total) * 100 if total else counts.astype(float),
+            'stable': source_codes == target_codes
+        })
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to plain Python types (for JSON storage).
+
+        Returns:
+            Dict with 'categories' and 'counts' (nested lists)
+        """
+        categories = [category.item() if isinstance(category, np.generic) else category
+                      for category in self._categories]
+        return {'categories': categories, 'counts': self._counts.tolist()}
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> 'TransitionMatrix':
+        """
+        Rebuild a matrix saved with to_dict().
+
+        Args:
+            payload: Dict with 'categories' and 'counts'
+
+        Returns:
+            TransitionMatrix
+        """
+        counts = np.asarray(payload['counts'], dtype=np.int64).reshape(
+            len(payload['categories']), len(payload['categories'])
+        )
+        return cls(counts, payload['categories'])
+
+    def __repr__(self) -> str:
+        return f"TransitionMatrix(categories={len(self._categories)}, total={self.total:,})"
+
+
+class TrajectoryCounts:
+    """
+    Counts of each respondent's full path through several waves.
+
+    Every path is encoded as one integer whose base-k digits are the
+    category codes at each wave (first wave most significant), and the
+    distinct paths are counted in a single pass. Transitions between any
+    two waves are then read off the digits of the distinct paths, weighted
+    by their counts, without going back to the rows, so a 10-wave panel
+    costs about as much as a 2-wave one.
+    """
+
+    def __init__(self, paths: np.ndarray, counts: np.ndarray,
+                 categories: Sequence[Any], stages: Sequence[str]):
+        """
+        Initialize from distinct paths.
+
+        Args:
+            paths: Encoded paths (one integer per distinct path, base len(categories)),
+                   or an (n_stages, n_paths) array of category codes when k ** n_stages
+                   does not fit in int64
+            counts: Respondents following each path
+            categories: Category labels shared by every stage
+            stages: Stage names (e.g. column names), in wave order
+        """
+        paths = np.asarray(paths, dtype=np.int64)
+        counts = np.asarray(counts, dtype=np.int64)
+        if paths.shape[-1] != len(counts) or (paths.ndim == 2 and len(paths) != len(stages)):
+            raise ValueError(f"Got paths of shape {paths.shape} for {len(counts)} counts "
+                             f"and {len(stages)} stages")
+        self._paths = paths
+        self._counts = counts
+        self._categories = pd.Index(categories)
+        self._stages = list(stages)
+
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame, columns: Sequence[str]) -> 'TrajectoryCounts':
+        """
+        Count every respondent's path through several columns.
+
+        Rows missing a value at any stage are ignored.
+
+        Args:
+            data: DataFrame (or Selection) with one column per wave
+            columns: Wave columns in path order (at least two)
+
+        Returns:
+            TrajectoryCounts over the columns
+        """
+        if len(columns) < 2:
+            raise ValueError(f"A trajectory needs at least two stages, got {list(columns)}")
+
+        codes, categories = _shared_codes([data[column] for column in columns])
+        n_categories, n_stages = max(len(categories), 1), len(columns)
+
+        # Missing values are coded -1; keep respondents observed at every stage
+        complete = np.ones(len(codes[0]), dtype=bool)
+        for stage_codes in codes:
+            complete &= stage_codes >= 0
+
+        if n_categories ** n_stages < 2 ** 63:
+            # Horner's rule: path = ((c0 * k + c1) * k + c2) ...
+            encoded = np.zeros(len(codes[0]), dtype=np.int64)
+            for stage_codes in codes:
+                encoded *= n_categories
+                encoded += stage_codes
+            paths, counts = np.unique(encoded[complete], return_counts=True)
+        else:
+            # Too many stages or categories for one int64 per path
+            stacked = np.vstack(codes)[:, complete].astype(np.int64)
+            paths, counts = np.unique(stacked, axis=1, return_counts=True)
+
+        logger.debug(f"Counted {counts.sum():,} paths through {n_stages} waves "
+                     f"({len(counts):,} distinct)")
+        return cls(paths, counts, categories, columns)
+
+    def _stage_codes(self, stage: int) -> np.ndarray:
+        """Category code of every distinct path at one stage."""
+        if self._paths.ndim == 2:
+            return self._paths[stage]
+        n_categories = len(self._categories)
+        return (self._paths // n_categories ** (len(self._stages) - 1 - stage)) % n_categories
+
+    @property
+    def stages(self) -> List[str]:
+        """Stage names in wave order."""
+        return list(self._stages)
+
+    @property
+    def categories(self) -> List[Any]:
+        """Category labels shared by every stage."""
+        return self._categories.tolist()
+
+    @property
+    def total(self) -> int:
+        """Respondents observed at every stage."""
+        return int(self._counts.sum())
+
+    def stage_counts(self, stage: int) -> np.ndarray:
+        """
+        Count respondents in each category at one stage.
+
+        Args:
+            stage: Stage position (0 is the first wave)
+
+        Returns:
+            Array of length len(categories)
+        """
+        return np.bincount(self._stage_codes(stage), weights=self._counts,
+                           minlength=len(self._categories)).astype(np.int64)
+
+    def transition_counts(self, source_stage: int, target_stage: int) -> np.ndarray:
+        """
+        Count transitions between two stages over the shared categories.
+
+        Args:
+            source_stage: Stage position of the source wave
+            target_stage: Stage position of the target wave
+
+        Returns:
+            k x k array, counts[i, j] = respondents in category i at source_stage
+            and category j at target_stage
+        """
+        n_categories = len(self._categories)
+        if self._paths.ndim == 1 and target_stage == source_stage + 1:
+            # Adjacent waves are two neighbouring digits: source * k + target
+            shift = n_categories ** (len(self._stages) - 1 - target_stage)
+            pair = (self._paths // shift) % (n_categories * n_categories)
+        else:
+            pair = self._stage_codes(source_stage) * n_categories + self._stage_codes(target_stage)
+        return np.bincount(pair, weights=self._counts,
+                           minlength=n_categories * n_categories
+                           ).astype(np.int64).reshape(n_categories, n_categories)
+
+    def transition(self, source_stage: int, target_stage: int) -> TransitionMatrix:
+        """
+        Get the transition matrix between two stages.
+
+        Args:
+            source_stage: Stage position of the source wave
+            target_stage: Stage position of the target wave
+
+        Returns:
+            TransitionMatrix without categories unused at both stages
+        """
+        counts = self.transition_counts(source_stage, target_stage)
+        return TransitionMatrix(counts, self._categories).drop_unused_categories()
+
+    def ranked_paths(self, top: Optional[int] = None) -> pd.DataFrame:
+        """
+        Get the observed paths, most common first.
+
+        Ties keep path order (first wave's category, then the next, ...).
+
+        Args:
+            top: Only return this many paths (None returns all)
+
+        Returns:
+            DataFrame with one column per stage plus count and percentage
+        """
+        order = np.argsort(-self._counts, kind='stable')
+        if top is not None:
+            order = order[:top]
+        counts = self._counts[order]
+        total = self.total
+
+        ranked = pd.DataFrame({
+            stage: self._categories[self._stage_codes(position)[order]]
+            for position, stage in enumerate(self._stages)
+        })
+        ranked['count'] = counts
+        ranked['percentage'] = (counts / total) * 100 if total else counts.astype(float)
+        return ranked
+
+    def __repr__(self) -> str:
+        return (f"TrajectoryCounts(stages={len(self._stages)}, categories={len(self._categories)}, "
+                f"paths={len(self._counts):,}, total={self.total:,})")
+
+
+def _group_codes(group_values: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    """
+    Encode group values as integer codes, groups sorted by value.
+
+    Args:
+        group_values: Values of the grouping column
+
+    Returns:
+        Tuple of (codes, groups); missing values are coded -1, and ordered
+        categoricals keep their order
+    """
+    try:
+        group_codes, groups = pd.factorize(group_values, sort=True)
+        if isinstance(group_values.dtype, pd.CategoricalDtype) and not group_values.dtype.ordered:
+            # Unordered categoricals sort by category position; sort by value like other columns
+            order = np.argsort(np.asarray(groups.astype(object)), kind='stable')
+            rank = np.empty(len(order), dtype=np.intp)
+            rank[order] = np.arange(len(order))
+            group_codes = np.where(group_codes >= 0, rank[group_codes], -1)
+            groups = groups[order]
+    except TypeError:
+        group_codes, groups = pd.factorize(group_values)
+    return group_codes, pd.Index(groups)
+
+
+def group_transition_matrices(data: pd.DataFrame,
+                              source_column: str,
+                              target_column: str,
+                              group_column: str) -> Dict[Any, TransitionMatrix]:
+    """
+    Count transitions for every value of a grouping column in one pass.
+
+    Group, source and target are coded as integers and folded into one index
+    (group * k * k + source * k + target), so a single np.bincount fills a
+    (groups, k, k) count cube. Each slice of the cube is the matrix the
+    single-filter path would produce for that group value.
+
+    Args:
+        data: DataFrame with the source, target and grouping columns
+        source_column: Column with source wave values
+        target_column: Column with target wave values
+        group_column: Column whose values define the groups (e.g. party)
+
+    Returns:
+        Dict mapping each group value (sorted; ordered categoricals keep their
+        order) to its TransitionMatrix; rows with a missing group value are ignored
+    """
+    source_codes, target_codes, categories = _shared_category_codes(
+        data[source_column], data[target_column]
+    )
+    group_codes, groups = _group_codes(data[group_column])
+
+    n_categories, n_groups = len(categories), len(groups)
+    complete = (source_codes >= 0) & (target_codes >= 0) & (group_codes >= 0)
+    cell = (group_codes[complete].astype(np.int64) * n_categories + source_codes[complete]) * n_categories \
+        + target_codes[complete]
+    cube = np.bincount(cell, minlength=n_groups * n_categories * n_categories)
+    cube = cube.reshape(n_groups, n_categories, n_categories)
+
+    logger.debug(f"Counted {n_groups} groups of {source_column} -> {target_column} "
+                 f"by {group_column} in one pass")
+    return {
+        group: TransitionMatrix(cube[index], categories).drop_unused_categories()
+        for index, group in enumerate(groups)
+    }
+
+
+def group_trajectory_counts(data: pd.DataFrame,
+                            columns: Sequence[str],
+                            group_column: str) -> Dict[Any, TrajectoryCounts]:
+    """
+    Count paths through several wave columns for every value of a grouping column in one pass.
+
+    Paths are encoded as in TrajectoryCounts.from_frame() with the group
+    code as an extra, most significant digit, so a single np.unique counts
+    every (group, path) pair. Each group's counts hold the paths
+    get_trajectory_counts() finds when filtering to that group value.
+
+    Args:
+        data: DataFrame with the wave and grouping columns
+        columns: Wave columns in path order (at least two)
+        group_column: Column whose values define the groups (e.g. party)
+
+    Returns:
+        Dict mapping each group value (ordered as by group_transition_matrices())
+        to its TrajectoryCounts; rows with a missing group value are ignored
+    """
+    if len(columns) < 2:
+        raise ValueError(f"A trajectory needs at least two stages, got {list(columns)}")
+
+    codes, categories = _shared_codes([data[column] for column in columns])
+    group_codes, groups = _group_codes(data[group_column])
+    n_categories, n_stages, n_groups = max(len(categories), 1), len(columns), len(groups)
+
+    # Keep respondents with a group observed at every stage
+    complete = group_codes >= 0
+    for stage_codes in codes:
+        complete &= stage_codes >= 0
+
+    n_paths = n_categories ** n_stages
+    if n_paths * max(n_groups, 1) < 2 ** 63:
+        encoded = group_codes[complete].astype(np.int64)
+        for stage_codes in codes:
+            encoded *= n_categories
+            encoded += stage_codes[complete]
+        keys, counts = np.unique(encoded, return_counts=True)
+        key_groups, paths = np.divmod(keys, n_paths)
+    else:
+        # Too many stages, categories or groups for one int64 per (group, path)
+        stacked = np.vstack([group_codes] + list(codes))[:, complete].astype(np.int64)
+        keys, counts = np.unique(stacked, axis=1, return_counts=True)
+        key_groups, paths = keys[0], keys[1:]
+
+    # Keys sort by group first, so each group's paths are one contiguous run
+    bounds = np.searchsorted(key_groups, np.arange(n_groups + 1))
+    logger.debug(f"Counted {n_groups} groups of paths through {n_stages} waves "
+                 f"by {group_column} in one pass")
+    return {
+        group: TrajectoryCounts(paths[..., bounds[index]:bounds[index + 1]],
+                                counts[bounds[index]:bounds[index + 1]], categories, columns)
+        for index, group in enumerate(groups)
+    }
+
+
+# LRU of matrices keyed on (dataset identity, columns, filter), stored with
+# the change tokens of the columns they were counted from
+_matrix_cache: 'OrderedDict[Tuple[Hashable, ...], Tuple[weakref.ref, Tuple[Optional[ColumnToken], ...], TransitionMatrix]]' = OrderedDict()
+_matrix_cache_lock = threading.RLock()
+
+
+def select_transition_rows(data: pd.DataFrame,
+                           filter_column: Optional[str],
+                           filter_value: Optional[str]) -> 'Selection':
+    """
+    Select the rows where filter_column equals filter_value, without copying.
+
+    Rows are selected with the frame's cached filter index, so filtering the
+    same frame again by other values reuses its bitmaps.
+
+    Args:
+        data: DataFrame to filter
+        filter_column: Column to filter by (None skips filtering)
+        filter_value: Value to keep
+
+    Returns:
+        Selection of data's matching rows (every row if no filter is given)
+    """
+    from ..data_prep.cleaning.row_reduction import RowReductionHandler, Selection
+
+    if not (filter_column and filter_value):
+        return Selection(data)
+
+    logger.info(f"Applying filter: {filter_column} = '{filter_value}'")
+    settings = {
+        "filters": [{
+            "column": filter_column,
+            "values": [filter_value]
+        }]
+    }
+    selection = RowReductionHandler().select(data, settings)
+    logger.info(f"Filtered to {len(selection):,} observations ({len(selection)/len(data)*100:.1f}%)")
+    return selection
+
+
+def filter_transition_data(data: pd.DataFrame,
+                           filter_column: Optional[str],
+                           filter_value: Optional[str],
+                           columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Keep the rows where filter_column equals filter_value.
+
+    Args:
+        data: DataFrame to filter
+        filter_column: Column to filter by (None skips filtering)
+        filter_value: Value to keep
+        columns: Only return these columns (None returns every column)
+
+    Returns:
+        Filtered DataFrame (data, or its columns, if no filter is given)
+    """
+    if not (filter_column and filter_value):
+        return data if columns is None else data[columns]
+    return select_transition_rows(data, filter_column, filter_value).to_frame(columns)
+
+
+def get_transition_matrix(data: pd.DataFrame,
+                          source_column: str,
+                          target_column: str,
+                          filter_column: Optional[str] = None,
+                          filter_value: Optional[str] = None,
+                          selection: Optional['Selection'] = None) -> TransitionMatrix:
+    """
+    Get the transition matrix for a column pair, reusing earlier results.
+
+    Results are cached per DataFrame object, so the same (unfiltered) frame
+    with the same columns and filter is only filtered and counted once. A
+    cached matrix is recounted when the source, target or filter column has
+    been replaced since, or after invalidate_frame_caches(data).
+
+    Args:
+        data: Unfiltered DataFrame
+        source_column: Column with source wave values
+        target_column: Column with target wave values
+        filter_column: Column to filter by
+        filter_value: Value to filter for
+        selection: Rows of data already selected for the filter (e.g.
+                   ValidatedInputs.selection); counted instead of selecting
+                   them again when no matrix is memoized
+
+    Returns:
+        TransitionMatrix for the (filtered) column pair
+    """
+    if not (filter_column and filter_value):
+        filter_column = filter_value = None
+    key = (id(data), source_column, target_column, filter_column, filter_value)
+    tokens = tuple(column_token(data, column) if column is not None else None
+                   for column in (source_column, target_column, filter_column))
+
+    with _matrix_cache_lock:
+        entry = _matrix_cache.get(key)
+        if entry is not None and entry[0]() is data and entry[1] == tokens:
+            _matrix_cache.move_to_end(key)
+            logger.debug(f"Reusing transition matrix: {source_column} -> {target_column}")
+            return entry[2]
+
+    # Select rows of the full frame through its cached filter index; only the
+    # source and target columns of those rows are materialized. A missing
+    # filter column is skipped (with a warning) by the row reduction handler
+    if selection is None:
+        selection = select_transition_rows(data, filter_column, filter_value)
+    matrix = TransitionMatrix.from_frame(selection, source_column, target_column)
+
+    if None in tokens[:2] or (filter_column in data.columns and tokens[2] is None):
+        # Untracked columns could change unnoticed
+        return matrix
+    try:
+        reference = weakref.ref(data)
+    except TypeError:
+        return matrix
+
+    with _matrix_cache_lock:
+        _matrix_cache[key] = (reference, tokens, matrix)
+        _matrix_cache.move_to_end(key)
+        while len(_matrix_cache) > TRANSITION_CACHE_SIZE:
+            _matrix_cache.popitem(last=False)
+    return matrix
+
+
+def get_trajectory_counts(data: pd.DataFrame,
+                          columns: Sequence[str],
+                          filter_column: Optional[str] = None,
+                          filter_value: Optional[str] = None,
+                          selection: Optional['Selection'] = None) -> TrajectoryCounts:
+    """
+    Count paths through several wave columns, optionally for one filter value.
+
+    Args:
+        data: Unfiltered DataFrame
+        columns: Wave columns in path order
+        filter_column: Column to filter by
+        filter_value: Value to filter for
+        selection: Rows of data already selected for the filter (e.g.
+                   ValidatedInputs.selection), used instead of selecting them again
+
+    Returns:
+        TrajectoryCounts for the (filtered) columns
+    """
+    if selection is None:
+        selection = select_transition_rows(data, filter_column, filter_value)
+    return TrajectoryCounts.from_frame(selection, columns)
+
+
+def clear_transition_cache() -> int:
+    """
+    Drop all memoized transition matrices.
+
+    Returns:
+        int: Number of entries removed
+    """
+    with _matrix_cache_lock:
+        removed = len(_matrix_cache)
+        _matrix_cache.clear()
+    return removed
+
+
+def _settings_fingerprint() -> str:
+    """Digest of the settings CSV files (labels, merging rules, colors, waves)."""
+    from wave_visualizer.settings import METADATA_DIR, CLEANING_DIR, VISUALIZATION_DIR
+    return files_fingerprint(path for directory in (METADATA_DIR, CLEANING_DIR, VISUALIZATION_DIR)
+                             for path in directory.glob('*.csv'))
+
+
+def transition_cache_key(source_column: str,
+                         target_column: str,
+                         filter_column: Optional[str] = None,
+                         filter_value: Optional[str] = None,
+                         data_path: Optional[Union[str, Path]] = None) -> Optional[str]:
+    """
+    Get the result cache key of a transition matrix of the processed data file.
+
+    The key covers the processed-data fingerprint, the column pair, the filter
+    and the settings CSV hashes, so it changes whenever any of them does.
+
+    Args:
+        source_column: Column with source wave values
+        target_column: Column with target wave values
+        filter_column: Column to filter by
+        filter_value: Value to filter for
+        data_path: Processed data file (defaults to settings/processed_data.csv)
+
+    Returns:
+        str: Cache key, or None if the result cache is disabled or there is no data file
+    """
+    if get_result_cache() is None:
+        return None
+    fingerprint = processed_data_fingerprint(data_path)
+    if fingerprint is None:
+        return None
+    if not (filter_column and filter_value):
+        filter_column = filter_value = None
+    return ResultCache.make_key({
+        'result': 'transition_matrix',
+        'data': fingerprint,
+        'source_column': source_column,
+        'target_column': target_column,
+        'filter_column': filter_column,
+        'filter_value': filter_value,
+        'settings': _settings_fingerprint(),
+    })
+
+
+def load_cached_transition_matrix(key: Optional[str]) -> Optional[TransitionMatrix]:
+    """
+    Read a transition matrix from the result cache.
+
+    Args:
+        key: Key from transition_cache_key() (None always misses)
+
+    Returns:
+        TransitionMatrix, or None on a cache miss
+    """
+    cache = get_result_cache() if key else None
+    payload = cache.get(key) if cache is not None else None
+    if payload is None:
+        return None
+    try:
+        matrix = TransitionMatrix.from_dict(payload)
+    except (KeyError, TypeError, ValueError) as e:
+        logger.debug(f"Ignoring malformed cached transition matrix: {e}")
+        return None
+    logger.debug(f"Transition matrix read from result cache: {matrix}")
+    return matrix
+
+
+def store_transition_matrix(key: Optional[str], matrix: TransitionMatrix) -> bool:
+    """
+    Save a transition matrix to the result cache.
+
+    Args:
+        key: Key from transition_cache_key() (None stores nothing)
+        matrix: Matrix to store
+
+    Returns:
+        bool: True if the matrix was written
+    """
+    cache = get_result_cache() if key else None
+    if cache is None:
+        return False
+    return cache.put(key, matrix.to_dict())
+
+
+def load_transition_matrix(source_column: str,
+                           target_column: str,
+                           filter_column: Optional[str] = None,
+                           filter_value: Optional[str] = None,
+                           data_path: Optional[Union[str, Path]] = None) -> TransitionMatrix:
+    """
+    Get a transition matrix of the processed data file, skipping all data work when cached.
+
+    A matrix computed by an earlier run for the same data, columns, filter
+    and settings is read from the on-disk result cache; otherwise the needed
+    columns are loaded, filtered and counted, and the result is stored.
+
+    Args:
+        source_column: Column with source wave values
+        target_column: Column with target wave values
+        filter_column: Column to filter by
+        filter_value: Value to filter for
+        data_path: Processed data file (defaults to settings/processed_data.csv)
+
+    Returns:
+        TransitionMatrix for the (filtered) column pair
+    """
+    key = transition_cache_key(source_column, target_column, filter_column, filter_value, data_path)
+    matrix = load_cached_transition_matrix(key)
+    if matrix is not None:
+        return matrix
+
+    columns = [source_column, target_column]
+    if filter_column and filter_value:
+        columns.append(filter_column)
+    data = load_processed_data(data_path, columns=columns)
+    logger.info(f"Data loaded: {len(data):,} observations")
+
+    matrix = get_transition_matrix(data, source_column, target_column, filter_column, filter_value)
+    store_transition_matrix(key, matrix)
+    return matrix
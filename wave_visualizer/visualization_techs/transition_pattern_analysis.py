@@ -9,18 +9,38 @@ import plotly.graph_objects as go
 import numpy as np
 from typing import Dict, Optional, Tuple, Any
 from ..data_prep.wave_parser import parse_wave_config, generate_column_names
-from ..data_prep.cleaning.row_reduction import RowReductionHandler
+from .transition_matrix import TransitionMatrix, get_transition_matrix, load_transition_matrix
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+def _pattern_table(matrix: TransitionMatrix) -> pd.DataFrame:
+    """
+    Format ranked transition patterns for the pattern chart.
+    
+    Args:
+        matrix: Transition matrix to rank
+        
+    Returns:
+        DataFrame with Pattern, Count, Percentage and Type columns, most common first
+    """
+    ranked = matrix.ranked_patterns()
+    return pd.DataFrame({
+        'Pattern': ranked['source'].astype(str) + ' -> ' + ranked['target'].astype(str),
+        'Count': ranked['count'],
+        'Percentage': ranked['percentage'],
+        'Type': np.where(ranked['stable'], 'Stable', 'Changed')
+    })
+
+
 def create_pattern_analysis_visualization(data: pd.DataFrame = None,
                                          variable_name: str = 'HFClust_labeled', 
                                          wave_config: str = 'w1_to_w2',
                                          filter_column: str = None,
                                          filter_value: str = None,
                                          show_plot: bool = True,
+                                         transition_matrix: Optional[TransitionMatrix] = None,
                                          **kwargs) -> Tuple[go.Figure, Dict]:
     """
     Create pattern analysis visualization showing ranked transition patterns.
@@ -32,62 +52,33 @@ def create_pattern_analysis_visualization(data: pd.DataFrame = None,
         filter_column: Column to filter by
         filter_value: Value to filter for
         show_plot: Whether to display the plot
+        transition_matrix: Precomputed counts for this (filtered) transition; when
+                           given, data is not loaded or filtered and the filter
+                           arguments only label the chart
         
     Returns:
         Tuple of (Figure object, Statistics dictionary)
     """
-    # Load data if not provided
-    if data is None:
-        from pathlib import Path
-        package_dir = Path(__file__).parent.parent.parent
-        data_path = package_dir / 'wave_visualizer' / 'settings' / 'processed_data.csv'
-        data = pd.read_csv(data_path)
-        logger.info(f"Data loaded: {len(data):,} observations")
-    
-    # Apply filtering if specified
-    if filter_column and filter_value:
-        logger.info(f"Applying filter: {filter_column} = '{filter_value}'")
-        filter_handler = RowReductionHandler()
-        settings = {
-            "filters": [{
-                "column": filter_column,
-                "values": [filter_value]
-            }]
-        }
-        original_count = len(data)
-        data = filter_handler.apply_filters(data, settings)
-        filtered_count = len(data)
-        logger.info(f"Filtered to {filtered_count:,} observations ({filtered_count/original_count*100:.1f}%)")
-    
     # Parse wave configuration
     source_wave_prefix, target_wave_prefix = parse_wave_config(wave_config)
     source_column, target_column = generate_column_names(
         source_wave_prefix, target_wave_prefix, variable_name
     )
     
-    # Create transition patterns
-    transition_data = data[[source_column, target_column]].dropna()
-    
-    # Create transition patterns with meaningful names
-    patterns = []
-    for _, row in transition_data.iterrows():
-        source_name = row[source_column]
-        target_name = row[target_column]
-        pattern = f"{source_name} -> {target_name}"
-        patterns.append(pattern)
-    
-    # Count patterns and create summary
-    pattern_counts = pd.Series(patterns).value_counts()
-    pattern_df = pd.DataFrame({
-        'Pattern': pattern_counts.index,
-        'Count': pattern_counts.values,
-        'Percentage': (pattern_counts.values / len(transition_data)) * 100
-    })
-    
-    # Add pattern type classification (stable vs changed)
-    pattern_df['Type'] = pattern_df['Pattern'].apply(
-        lambda x: 'Stable' if x.split(' -> ')[0] == x.split(' -> ')[1] else 'Changed'
-    )
+    # Without data, count from the processed data file (only the columns this
+    # chart uses), or read the counts of an earlier run from the result cache
+    if data is None and transition_matrix is None:
+        transition_matrix = load_transition_matrix(
+            source_column, target_column, filter_column, filter_value
+        )
+    
+    # Filter and count transitions (memoized per dataset, columns and filter)
+    if transition_matrix is None:
+        transition_matrix = get_transition_matrix(
+            data, source_column, target_column, filter_column, filter_value
+        )
+    matrix = transition_matrix
+    pattern_df = _pattern_table(matrix)
     
     # Get top 15 patterns for visualization
     top_patterns = pattern_df.head(15)
@@ -137,7 +128,7 @@ def create_pattern_analysis_visualization(data: pd.DataFrame = None,
         fig.show()
     
     # Calculate statistics
-    total_transitions = len(transition_data)
+    total_transitions = matrix.total
     unique_patterns = len(pattern_df)
     
     stable_count = pattern_df[pattern_df['Type'] == 'Stable']['Count'].sum()